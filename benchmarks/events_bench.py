@@ -0,0 +1,121 @@
+# /_events için fetch (HTTP POST), toplu /_events/_batch ve WebSocket köprüsünü tek bağlantı üzerinde karşılaştırır.
+#
+#   pip install websockets
+#   python -m bead.benchmarks.events_bench [--events 2000] [--window 32]
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+
+import httpx
+import uvicorn
+
+from bead.server.dev_server import get_app
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+HANDLER_SOURCE = """
+async def handler(request):
+    data = await request.json()
+    return {"ok": True, "n": data.get("n")}
+"""
+
+def create_project(path: str):
+    os.makedirs(os.path.join(path, "pages", "api"))
+    with open(os.path.join(path, "pages", "index.bead"), "w", encoding="utf-8") as f:
+        f.write('def default(params, context):\n    return Page(title="Bench", body=[Text("bench")])\n')
+    with open(os.path.join(path, "pages", "api", "ping.py"), "w", encoding="utf-8") as f:
+        f.write(HANDLER_SOURCE)
+    with open(os.path.join(path, "bead.config.json"), "w", encoding="utf-8") as f:
+        json.dump({"events": {"websocket": True}}, f)
+
+def _serve(app, sock):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off")).run(sockets=[sock])
+
+def start_server(app):
+    # Sunucu ayrı bir süreçte çalışır; soket ayarları 'bead start' ile aynıdır (TCP_NODELAY dahil).
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.listen(128)
+    process = multiprocessing.get_context("fork").Process(target=_serve, args=(app, sock), daemon=True)
+    process.start()
+    return process, sock.getsockname()[1]
+
+async def fetch_sequential(port: int, count: int) -> float:
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        await client.post("/_events/ping", json={"n": -1})
+        start = time.perf_counter()
+        for n in range(count):
+            response = await client.post("/_events/ping", json={"n": n})
+            assert response.json()["n"] == n
+        return time.perf_counter() - start
+
+async def fetch_batched(port: int, count: int, size: int) -> float:
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        await client.post("/_events/_batch", json={"events": [{"handler": "ping", "data": {"n": -1}}]})
+        start = time.perf_counter()
+        for first in range(0, count, size):
+            events = [{"handler": "ping", "data": {"n": n}} for n in range(first, min(first + size, count))]
+            response = await client.post("/_events/_batch", json={"events": events})
+            assert [result["body"]["n"] for result in response.json()["results"]] == [event["data"]["n"] for event in events]
+        return time.perf_counter() - start
+
+async def socket_run(port: int, count: int, window: int) -> float:
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_events/ws") as ws:
+        await ws.send(json.dumps({"id": 0, "handler": "ping", "data": {"n": 0}}))
+        await ws.recv()
+
+        start = time.perf_counter()
+        sent = received = 0
+        while received < count:
+            while sent < count and sent - received < window:
+                sent += 1
+                await ws.send(json.dumps({"id": sent, "handler": "ping", "data": {"n": sent}}))
+            reply = json.loads(await ws.recv())
+            assert reply["status"] == 200
+            received += 1
+        return time.perf_counter() - start
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bead event transport benchmark")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--window", type=int, default=32)
+    args = parser.parse_args()
+
+    if websockets is None:
+        print("Bu benchmark için 'websockets' paketi gerekli: pip install websockets")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as project_path:
+        create_project(project_path)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            app = get_app(project_path, debug=False)
+        process, port = start_server(app)
+        try:
+            results = [
+                ("fetch (sıralı)", await fetch_sequential(port, args.events)),
+                (f"fetch (toplu {args.window})", await fetch_batched(port, args.events, args.window)),
+                ("websocket (sıralı)", await socket_run(port, args.events, 1)),
+                (f"websocket (pencere {args.window})", await socket_run(port, args.events, args.window)),
+            ]
+        finally:
+            process.terminate()
+            process.join()
+
+    print(f"{'transport':>24} {'events/s':>10} {'ms/event':>10}")
+    for name, elapsed in results:
+        print(f"{name:>24} {args.events / elapsed:>10.0f} {elapsed / args.events * 1000:>10.3f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
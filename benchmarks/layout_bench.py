@@ -0,0 +1,83 @@
+# İç içe layout derinliğine göre istek başına sayfa ağacı kurma süresi: her istekte layout arama/yükleme ve
+# açılışta birleştirilmiş rota fonksiyonu (registry.load_route, derleme çıktısıyla dondurulmuş kayıt).
+#
+#   python -m bead.benchmarks.layout_bench [--depths 1,3,6] [--requests 20000]
+import argparse
+import asyncio
+import inspect
+import os
+import tempfile
+import time
+
+from bead.compiler import registry
+
+LAYOUT_SOURCE = '''def default(params, context, children):
+    return Page(title=children.props["title"], body=[Card(style="p-2", children=list(children.props["children"]["default"]))])
+'''
+PAGE_SOURCE = '''def default(params, context):
+    return Page(title="Bench", body=[Text("page")])
+'''
+
+def make_project(root: str, depth: int) -> tuple:
+    pages_path = os.path.join(root, "pages")
+    directory = pages_path
+    for level in range(depth):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "_layout.bead"), "w", encoding="utf-8") as f:
+            f.write(LAYOUT_SOURCE)
+        directory = os.path.join(directory, f"level{level}")
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, "page.bead")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(PAGE_SOURCE)
+    return pages_path, file_path
+
+async def lookup_per_request(pages_path: str, file_path: str) -> object:
+    # Her istekte dizin zinciri yürünür, layout'lar bulunur ve yüklenir.
+    tree = registry.load_page(file_path).default({}, {})
+    directory = os.path.dirname(file_path)
+    chain = []
+    while True:
+        layout_path = os.path.join(directory, "_layout.bead")
+        if os.path.exists(layout_path):
+            chain.append(layout_path)
+        if directory == pages_path:
+            break
+        directory = os.path.dirname(directory)
+    for layout_path in chain:
+        layout_func = registry.load_page(layout_path).default
+        tree = await layout_func({}, {}, children=tree) if inspect.iscoroutinefunction(layout_func) else layout_func({}, {}, children=tree)
+    return tree
+
+async def composed(pages_path: str, file_path: str) -> object:
+    return await registry.load_route(file_path, pages_path).render({}, {})
+
+async def measure(func, pages_path: str, file_path: str, requests: int) -> float:
+    await func(pages_path, file_path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await func(pages_path, file_path)
+    return (time.perf_counter() - started) / requests * 1e6
+
+async def main_async(depths: list, requests: int):
+    print(f"{'derinlik':>8} {'istek başına arama':>20} {'birleştirilmiş (dev)':>22} {'birleştirilmiş (build)':>24}")
+    for depth in depths:
+        with tempfile.TemporaryDirectory() as root:
+            registry.clear_cache()
+            pages_path, file_path = make_project(root, depth)
+            lookup = await measure(lookup_per_request, pages_path, file_path, requests)
+            dev = await measure(composed, pages_path, file_path, requests)
+            registry.freeze()
+            frozen = await measure(composed, pages_path, file_path, requests)
+            registry.clear_cache()
+        print(f"{depth:>8} {lookup:>17.1f} µs {dev:>19.1f} µs {frozen:>21.1f} µs")
+
+def main():
+    parser = argparse.ArgumentParser(description="Nested layout composition benchmark")
+    parser.add_argument("--depths", default="1,3,6")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main_async([int(depth) for depth in args.depths.split(",")], args.requests))
+
+if __name__ == "__main__":
+    main()
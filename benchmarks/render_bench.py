@@ -0,0 +1,57 @@
+# Senkron render yolu ile düğüm başına asyncio.gather kullanan yolu büyük ağaçlarda karşılaştırır.
+#
+#   python -m bead.benchmarks.render_bench [--nodes 1000 10000 50000] [--repeat 5]
+import argparse
+import asyncio
+import time
+
+from bead.ui import Page, Card, Stack, Text, Button, Link
+from bead.compiler.renderer import render_component, render_component_concurrent
+
+def build_tree(node_count: int, fanout: int = 10):
+    def build(remaining):
+        if remaining <= fanout:
+            return [Text(f"item {i}", style="text-sm p-1") for i in range(remaining)]
+        per_child = remaining // fanout
+        children = []
+        for i in range(fanout):
+            children.append(Card(style="p-4 rounded-lg", children=[
+                Link(f"link {i}", href=f"/items/{i}", style="text-indigo-600"),
+                Button("Open", onclick="open", style="px-4 py-2"),
+                Stack(children=build(per_child - 3)),
+            ]))
+        return children
+
+    return Page(title="Benchmark", body=build(node_count))
+
+def count_nodes(component) -> int:
+    children = component.props.get("children") or {}
+    return 1 + sum(count_nodes(child) for slot in children.values() for child in slot)
+
+async def time_renderer(renderer, tree, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await renderer(tree, set())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bead renderer benchmark")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'sync (ms)':>12} {'gather (ms)':>12} {'speedup':>8}")
+    for node_count in args.nodes:
+        tree = build_tree(node_count)
+        sync_html = await render_component(tree, set())
+        concurrent_html = await render_component_concurrent(tree, set())
+        assert sync_html == concurrent_html
+
+        sync_time = await time_renderer(render_component, tree, args.repeat)
+        concurrent_time = await time_renderer(render_component_concurrent, tree, args.repeat)
+        print(f"{count_nodes(tree):>8} {sync_time * 1000:>12.2f} {concurrent_time * 1000:>12.2f} {concurrent_time / sync_time:>7.1f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+# Sayfa rotası eşleşme süresini rota sayısına göre ölçer: düz Starlette Route listesi ve segment ağacı (RouteIndex).
+#
+#   python -m bead.benchmarks.route_bench [--sizes 100,1000,5000] [--lookups 20000]
+import argparse
+import random
+import time
+
+from starlette.routing import Match, Route
+
+from bead.server.route_index import PageRoutes, RouteIndex
+
+def endpoint(request):
+    return None
+
+def generate_routes(count: int) -> list:
+    # pages/ düzenini taklit eder: bölüm başına statik sayfalar, [id] sayfaları ve [...slug] yakalayıcıları.
+    routes = []
+    section = 0
+    while len(routes) < count:
+        prefix = f"/section{section}"
+        routes.append(f"{prefix}/index")
+        routes.append(f"{prefix}/about")
+        routes.append(f"{prefix}/items/{{id}}")
+        routes.append(f"{prefix}/items/{{id}}/edit")
+        routes.append(f"{prefix}/docs/{{slug:path}}")
+        section += 1
+    return routes[:count]
+
+def sample_paths(routes: list, count: int) -> list:
+    rng = random.Random(0)
+    paths = []
+    for _ in range(count):
+        pattern = rng.choice(routes)
+        paths.append(pattern.replace("{id}", str(rng.randint(1, 9999))).replace("{slug:path}", "guide/intro"))
+    return paths
+
+def scope_for(path: str) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "root_path": "", "path_params": {}}
+
+def time_flat(routes: list, paths: list) -> float:
+    flat = [Route(path, endpoint=endpoint) for path in routes]
+    start = time.perf_counter()
+    for path in paths:
+        scope = scope_for(path)
+        for route in flat:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                break
+    return time.perf_counter() - start
+
+def time_index(routes: list, paths: list) -> float:
+    index = RouteIndex()
+    for path in routes:
+        index.add(path, endpoint)
+    page_routes = PageRoutes(index)
+    start = time.perf_counter()
+    for path in paths:
+        match, _ = page_routes.matches(scope_for(path))
+        assert match is Match.FULL
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Bead route matching benchmark")
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'routes':>8} {'flat (µs)':>10} {'trie (µs)':>10} {'speedup':>8}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        routes = generate_routes(size)
+        # Düz listede rota sayısıyla orantılı süre aldığından daha az arama yapılır.
+        flat_paths = sample_paths(routes, max(200, args.lookups * 100 // size))
+        paths = sample_paths(routes, args.lookups)
+        flat = time_flat(routes, flat_paths) / len(flat_paths) * 1e6
+        trie = time_index(routes, paths) / len(paths) * 1e6
+        print(f"{size:>8} {flat:>10.1f} {trie:>10.2f} {flat / trie:>7.0f}x")
+
+if __name__ == "__main__":
+    main()
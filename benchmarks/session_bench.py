@@ -0,0 +1,141 @@
+# Oturum depolarını karşılaştırır: çerez (Starlette), memory, sqlite ve redis (yerel RESP sunucusu taklidi ya da --redis-url).
+# Her depo için ASGI uygulaması doğrudan çağrılarak istek süresi ve yanıttaki Set-Cookie boyutu ölçülür.
+#
+#   python -m bead.benchmarks.session_bench [--requests 2000] [--redis-url redis://127.0.0.1:6379/0]
+import argparse
+import asyncio
+import os
+import socketserver
+import tempfile
+import threading
+import time
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from bead.server.sessions import session_middleware
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    # Yalnızca oturum deposunun kullandığı komutları (GET, SET [EX], DEL, AUTH, SELECT, PING) bilen bellek içi RESP sunucusu.
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), RespHandler)
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        store = self.server
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            with store.lock:
+                if name == b"GET":
+                    value = store.data.get(args[1])
+                    reply = b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+                elif name == b"SET":
+                    store.data[args[1]] = args[2]
+                    reply = b"+OK\r\n"
+                elif name == b"DEL":
+                    reply = b":%d\r\n" % sum(store.data.pop(key, None) is not None for key in args[1:])
+                elif name in (b"AUTH", b"SELECT", b"PING"):
+                    reply = b"+OK\r\n" if name != b"PING" else b"+PONG\r\n"
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+async def untouched(request):
+    return PlainTextResponse("ok")
+
+async def touched(request):
+    # Sayfa render'ındaki CSRF token'ı gibi: varsa okunur, yoksa bir kez yazılır; sepet gibi büyüyen bir değer de tutulur.
+    request.session.setdefault("_csrf_token", os.urandom(32).hex())
+    visits = request.session.get("visits", [])
+    if len(visits) < 20:
+        request.session["visits"] = visits + [request.url.path * 4]
+    return PlainTextResponse("ok")
+
+def make_app(settings: dict, project_path: str) -> Starlette:
+    return Starlette(
+        routes=[Route("/untouched", untouched), Route("/touched", touched)],
+        middleware=[session_middleware(settings, "bench-secret", project_path)],
+    )
+
+async def request(app, path: str, cookie: str) -> dict:
+    headers = [(b"host", b"bench")]
+    if cookie:
+        headers.append((b"cookie", f"session={cookie}".encode()))
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+             "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"", "headers": headers,
+             "client": ("127.0.0.1", 1), "server": ("bench", 80), "app": app}
+    start = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+
+    await app(scope, receive, send)
+    return {key.decode(): value.decode() for key, value in start["headers"]}
+
+async def measure(app, path: str, requests: int, cookie: str = "") -> tuple:
+    largest = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        headers = await request(app, path, cookie)
+        set_cookie = headers.get("set-cookie", "")
+        if set_cookie:
+            largest = max(largest, len(set_cookie))
+            cookie = set_cookie.split(";", 1)[0].split("=", 1)[1]
+    elapsed = (time.perf_counter() - started) / requests * 1e6
+    return elapsed, largest, cookie
+
+def main():
+    parser = argparse.ArgumentParser(description="Session backend benchmark")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--redis-url", default=None, help="Use a real Redis server instead of the in-process stand-in.")
+    args = parser.parse_args()
+
+    stand_in = None
+    redis_url = args.redis_url
+    if redis_url is None:
+        stand_in = RespStandIn()
+        threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+        redis_url = stand_in.url
+
+    print(f"{'depo':>8} {'dokunmayan istek':>18} {'oturumlu istek':>16} {'en büyük Set-Cookie':>21} {'çerez':>7}")
+    with tempfile.TemporaryDirectory() as project_path:
+        for backend in ("cookie", "memory", "sqlite", "redis"):
+            settings = {"backend": backend, "url": redis_url}
+            app = make_app(settings, project_path)
+            with_session, set_cookie, cookie = asyncio.run(measure(app, "/touched", args.requests))
+            # Oturum çerezi taşıyan ama oturumu kullanmayan istekler (ör. API, statik dosya).
+            plain, _, _ = asyncio.run(measure(app, "/untouched", args.requests, cookie))
+            print(f"{backend:>8} {plain:>15.1f} µs {with_session:>13.1f} µs {set_cookie:>19} B {len(cookie):>5} B")
+
+    if stand_in is not None:
+        stand_in.shutdown()
+
+if __name__ == "__main__":
+    main()
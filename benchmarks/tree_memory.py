@@ -0,0 +1,91 @@
+# Değişmez, __slots__ kullanan bileşen ağacının bellek maliyetini eski dict tabanlı düğümlerle karşılaştırır.
+#
+#   python -m bead.benchmarks.tree_memory [--nodes 100000] [--renders 5]
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from bead.ui import Page, Card, Stack, Text, Button, Link
+from bead.compiler.renderer import render_component
+
+class LegacyComponent:
+    # Eski gösterim: örnek başına __dict__, serbest props dict'i ve list çocuklar.
+    def __init__(self, component_type, children=None, **kwargs):
+        self.props = kwargs
+        if children is not None:
+            self.props["children"] = {"default": children}
+        self.component_type = component_type
+
+LEGACY = {
+    "Page": lambda title, body: LegacyComponent("Page", children=body, title=title, style=None, custom_style=None, meta=None),
+    "Card": lambda children, style=None: LegacyComponent("Card", children=children, style=style, custom_style=None, id=None),
+    "Stack": lambda children: LegacyComponent("Stack", children=children, direction="col", style=None, custom_style=None),
+    "Text": lambda value, style=None: LegacyComponent("Text", value=value, style=style, custom_style=None, as_="p"),
+    "Button": lambda label, onclick=None, style=None: LegacyComponent("Button", label=label, onclick=onclick, href=None, style=style, custom_style=None),
+    "Link": lambda label, href, style=None: LegacyComponent("Link", label=label, href=href, style=style, custom_style=None, router_link=False),
+}
+
+SLOTTED = {"Page": Page, "Card": Card, "Stack": Stack, "Text": Text, "Button": Button, "Link": Link}
+
+def build_tree(nodes: dict, node_count: int, fanout: int = 10):
+    def build(remaining):
+        if remaining <= fanout:
+            return [nodes["Text"](f"item {i}", style="text-sm p-1") for i in range(remaining)]
+        per_child = remaining // fanout
+        children = []
+        for i in range(fanout):
+            children.append(nodes["Card"](style="p-4 rounded-lg", children=[
+                nodes["Link"](f"link {i}", href=f"/items/{i}", style="text-indigo-600"),
+                nodes["Button"]("Open", onclick="open", style="px-4 py-2"),
+                nodes["Stack"](children=build(per_child - 3)),
+            ]))
+        return children
+
+    return nodes["Page"](title="Benchmark", body=build(node_count))
+
+def count_nodes(component) -> int:
+    children = component.props.get("children") or {}
+    return 1 + sum(count_nodes(child) for slot in children.values() for child in slot)
+
+def measure(nodes: dict, node_count: int):
+    gc.collect()
+    start = time.perf_counter()
+    build_tree(nodes, node_count)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    tree = build_tree(nodes, node_count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, size, elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bead component tree memory benchmark")
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--renders", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy_tree, legacy_size, legacy_time = measure(LEGACY, args.nodes)
+    node_count = count_nodes(legacy_tree)
+    del legacy_tree
+    tree, size, build_time = measure(SLOTTED, args.nodes)
+
+    print(f"{'tree':>10} {'nodes':>8} {'memory (MB)':>12} {'bytes/node':>11} {'build (ms)':>11}")
+    print(f"{'legacy':>10} {node_count:>8} {legacy_size / 1e6:>12.2f} {legacy_size / node_count:>11.0f} {legacy_time * 1000:>11.1f}")
+    print(f"{'slotted':>10} {count_nodes(tree):>8} {size / 1e6:>12.2f} {size / node_count:>11.0f} {build_time * 1000:>11.1f}")
+    print(f"Bellek tasarrufu: {(1 - size / legacy_size) * 100:.1f}%")
+
+    # Aynı ağaç istekler arasında yeniden kullanılır; render girdiyi değiştirmediği için çıktı her seferinde aynıdır.
+    outputs = set()
+    start = time.perf_counter()
+    for _ in range(args.renders):
+        outputs.add(await render_component(tree, set()))
+    elapsed = time.perf_counter() - start
+    assert len(outputs) == 1
+    print(f"{args.renders} render (paylaşılan ağaç): ortalama {elapsed / args.renders * 1000:.1f} ms, çıktılar aynı")
+
+if __name__ == "__main__":
+    asyncio.run(main())
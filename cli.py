@@ -3,6 +3,11 @@ import sys
 import argparse
 import shutil
 from bead.server.dev_server import start_dev_server
+from bead.server.prod_server import start_production_server
+from bead.compiler.build import build_project
+from bead.compiler.export import export_project
+from bead.compiler.deps import DependencyGraph, file_kind, page_urls
+from bead.exceptions import BeadException
 
 def create_project(project_name):
 
@@ -114,6 +119,31 @@ def InfoCard(title: str, body: str):
     print("--------------------------------------------------")
 
 
+def show_dependencies(project_path, file_path=None):
+    graph = DependencyGraph.build(project_path)
+    graph_path = graph.save()
+    if file_path is None:
+        print(f"Dependency graph: {len(graph.nodes)} files -> {graph_path}")
+        for path in sorted(path for path, node in graph.nodes.items() if node["kind"] == "page"):
+            print(path)
+            for dep in sorted(graph.dependencies(path)):
+                print(f"  {dep}")
+        return
+
+    relative_path = graph.relative(os.path.abspath(file_path))
+    print(f"{relative_path} ({file_kind(relative_path)})")
+    print("Dependents:")
+    for dep in sorted(graph.dependents(relative_path)) or ["(none)"]:
+        print(f"  {dep}")
+    print("Affected pages:")
+    pages_path = os.path.join(project_path, "pages")
+    affected = graph.affected_pages(relative_path)
+    for page in affected:
+        urls = page_urls(pages_path, os.path.join(project_path, *page.split("/")))
+        print(f"  {page} -> {', '.join(urls)}")
+    if not affected:
+        print("  (none)")
+
 def main():
 
     parser = argparse.ArgumentParser(description="Bead Framework CLI")
@@ -126,12 +156,63 @@ def main():
     dev_parser = subparsers.add_parser("dev", help="Starts the development server.")
     dev_parser.add_argument("project_path", nargs="?", default=".", help="The path to the project directory.")
 
+    build_parser = subparsers.add_parser("build", help="Compiles the project for production.")
+    build_parser.add_argument("project_path", nargs="?", default=".", help="The path to the project directory.")
+    build_parser.add_argument("--out", default=None, help="The output directory (default: <project>/build).")
+
+    export_parser = subparsers.add_parser("export", help="Exports non-interactive pages as static HTML.")
+    export_parser.add_argument("project_path", nargs="?", default=".", help="The path to the project directory.")
+    export_parser.add_argument("--out", default=None, help="The output directory (default: <project>/export).")
+    export_parser.add_argument("--workers", type=int, default=None, help="Number of render processes (default: CPU count).")
+    export_parser.add_argument("--force", action="store_true", help="Render every page even if its inputs did not change.")
+
+    deps_parser = subparsers.add_parser("deps", help="Shows the page/layout/component dependency graph.")
+    deps_parser.add_argument("project_path", nargs="?", default=".", help="The path to the project directory.")
+    deps_parser.add_argument("--file", default=None, help="Show the files and pages that depend on this file.")
+
+    start_parser = subparsers.add_parser("start", help="Starts the production server from the build output.")
+    start_parser.add_argument("project_path", nargs="?", default=".", help="The path to the project directory.")
+    start_parser.add_argument("--build-dir", default=None, help="The build output directory (default: <project>/build).")
+    start_parser.add_argument("--host", default="0.0.0.0", help="The host to bind to.")
+    start_parser.add_argument("--port", type=int, default=None, help="The port to bind to (default: server.port).")
+    start_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    start_parser.add_argument("--max-requests", type=int, default=None, help="Restart a worker after this many requests.")
+    start_parser.add_argument("--graceful-timeout", type=int, default=30, help="Seconds to wait for in-flight requests on shutdown.")
+
     args = parser.parse_args()
     
     if args.command == "create":
         create_project(args.project_name)
     elif args.command == "dev":
         start_dev_server(os.path.abspath(args.project_path))
+    elif args.command == "start":
+        try:
+            start_production_server(
+                args.project_path,
+                build_dir=args.build_dir,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                max_requests=args.max_requests,
+                graceful_timeout=args.graceful_timeout,
+            )
+        except BeadException as e:
+            print(f"Error: {e.message}")
+            sys.exit(1)
+    elif args.command == "export":
+        try:
+            export_project(args.project_path, args.out, workers=args.workers, force=args.force)
+        except BeadException as e:
+            print(f"Error: {e.message}")
+            sys.exit(1)
+    elif args.command == "deps":
+        show_dependencies(os.path.abspath(args.project_path), args.file)
+    elif args.command == "build":
+        try:
+            build_project(os.path.abspath(args.project_path), args.out)
+        except BeadException as e:
+            print(f"Error: {e.message}")
+            sys.exit(1)
     else:
         parser.print_help()
 
@@ -0,0 +1,219 @@
+import ast
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import pathlib
+import shutil
+import time
+from bead.compiler import registry
+from bead.compiler.deps import DependencyGraph, discover_pages, layout_chain
+from bead.compiler.renderer import set_extracted_styles
+from bead.compiler.runtime import RUNTIME_FILES
+from bead.config import load_config
+from bead.exceptions import BuildError
+from bead.server.responses import precompress_directory
+from bead.styles.compiler import generate_css, get_style_map, custom_style_class, custom_style_rule
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def _hashed_name(relative_path: str, digest: str) -> str:
+    stem, suffix = os.path.splitext(relative_path)
+    return f"{stem}.{digest}{suffix}"
+
+def _string_tokens(tree: ast.AST) -> set:
+    tokens = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            tokens.update(node.value.split())
+    return tokens
+
+def _custom_styles(tree: ast.AST) -> dict:
+    styles = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.keyword) and node.arg == "custom_style":
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str) and node.value.value.strip():
+                styles[custom_style_class(node.value.value)] = node.value.value
+    return styles
+
+def _module_kind(relative_path: str) -> str:
+    if relative_path.startswith("components/"):
+        return "component"
+    if os.path.basename(relative_path).startswith("_layout"):
+        return "layout"
+    return "page"
+
+def _write_bytecode(path: pathlib.Path, code):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(importlib.util.MAGIC_NUMBER)
+        f.write(marshal.dumps(code))
+
+def _read_bytecode(path: pathlib.Path):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic = importlib.util.MAGIC_NUMBER
+    if data[:len(magic)] != magic:
+        raise BuildError(f"Bytecode '{path}' was built for a different Python version; run 'bead build' again.")
+    return marshal.loads(data[len(magic):])
+
+def build_project(project_path: str, out_dir: str = None) -> dict:
+    started = time.perf_counter()
+    project = pathlib.Path(project_path).resolve()
+    out = pathlib.Path(out_dir).resolve() if out_dir else project / "build"
+    pages_path = project / "pages"
+
+    if not pages_path.exists():
+        raise BuildError(f"'pages' directory not found in '{project}'.")
+
+    for name in ("bytecode", "public", MANIFEST_NAME):
+        target = out / name
+        if target.is_dir():
+            shutil.rmtree(target)
+        elif target.exists():
+            target.unlink()
+    out.mkdir(parents=True, exist_ok=True)
+
+    config = load_config(str(project))
+    style_map = get_style_map(config.settings)
+
+    sources = sorted(pages_path.rglob("*.bead"))
+    components_path = project / "components"
+    if components_path.exists():
+        sources += sorted(components_path.rglob("*.bead"))
+
+    modules = {}
+    used_classes = set()
+    custom_styles = {}
+    extract_custom_styles = config.get("styles", {}).get("extract_custom_styles", True)
+    for source_path in sources:
+        relative_path = source_path.relative_to(project).as_posix()
+        source = source_path.read_bytes()
+
+        code = registry.compile_source(str(source_path), source)
+        tree = ast.parse(source, filename=str(source_path))
+        used_classes.update(token for token in _string_tokens(tree) if token in style_map)
+        if extract_custom_styles:
+            custom_styles.update(_custom_styles(tree))
+
+        kind = _module_kind(relative_path)
+        if kind != "component" and not any(
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "default" for node in tree.body
+        ):
+            print(f"UYARI: '{relative_path}' içinde 'default' fonksiyonu bulunamadı.")
+
+        bytecode_path = f"bytecode/{relative_path}.bin"
+        _write_bytecode(out / bytecode_path, code)
+        modules[relative_path] = {
+            "kind": kind,
+            "bytecode": bytecode_path,
+            "digest": hashlib.sha256(source).hexdigest(),
+        }
+
+    # Layout zinciri derleme sırasında çözülür; sunucu her rota için birleştirilmiş render fonksiyonunu açılışta kurar.
+    routes = [
+        {
+            "path": url_path,
+            "file": pathlib.Path(file_path).relative_to(project).as_posix(),
+            "layouts": [pathlib.Path(layout).relative_to(project).as_posix() for layout in layout_chain(pages_path, file_path)],
+        }
+        for url_path, file_path in discover_pages(pages_path)
+    ]
+
+    public_out = out / "public"
+    public_out.mkdir(parents=True, exist_ok=True)
+
+    # Yalnızca kaynaklarda geçen utility sınıfları stil dosyasına girer.
+    # Kaynakta sabit metin olarak geçen custom_style değerleri de paylaşılan dosyaya taşınır.
+    custom_css = "\n".join(custom_style_rule(name, css) for name, css in sorted(custom_styles.items()))
+    css_content = generate_css(used_classes, style_map)
+    if custom_css:
+        css_content += "\n" + custom_css
+    css_content = css_content.encode("utf-8")
+    css_hash = _content_hash(css_content)
+    stylesheet_name = f"bead.{css_hash}.css"
+    (public_out / stylesheet_name).write_bytes(css_content)
+    for name, content in RUNTIME_FILES.items():
+        (public_out / f"bead-runtime.{name}.js").write_text(content, encoding="utf-8")
+
+    assets = {}
+    public_path = project / "public"
+    if public_path.exists():
+        for asset_path in sorted(p for p in public_path.rglob("*") if p.is_file()):
+            relative_path = asset_path.relative_to(public_path).as_posix()
+            data = asset_path.read_bytes()
+            hashed_path = _hashed_name(relative_path, _content_hash(data))
+            for target in (public_out / relative_path, public_out / hashed_path):
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+            assets[relative_path] = hashed_path
+
+    # Sunucu, istemci kabul ettiğinde bu .br/.gz kopyalarını çalışma anında sıkıştırmadan gönderir.
+    compressed = precompress_directory(public_out)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "python_magic": importlib.util.MAGIC_NUMBER.hex(),
+        "routes": routes,
+        "modules": modules,
+        "stylesheet": {
+            "file": f"public/{stylesheet_name}",
+            "hash": css_hash,
+            "classes": sorted(used_classes),
+            "custom_styles": sorted(custom_styles),
+            "custom_css": custom_css,
+        },
+        "assets": assets,
+    }
+    with open(out / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    graph = DependencyGraph.build(str(project))
+    graph_path = graph.save()
+
+    elapsed = time.perf_counter() - started
+    print(f"INFO:  {len(modules)} modül derlendi, {len(routes)} rota, {len(used_classes)} CSS sınıfı, {len(custom_styles)} özel stil, {len(assets)} varlık, {compressed} sıkıştırılmış kopya ({elapsed:.2f}s).")
+    print(f"INFO:  Derleme çıktısı: {out}")
+    print(f"INFO:  Bağımlılık grafiği: {graph_path} ({len(graph.nodes)} dosya)")
+    return manifest
+
+def load_build(build_dir: str, project_path: str) -> dict:
+    build = pathlib.Path(build_dir).resolve()
+    manifest_path = build / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise BuildError(f"Build manifest not found at '{manifest_path}'; run 'bead build' first.")
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise BuildError(f"Unsupported build manifest version: {manifest.get('version')}.")
+    if manifest.get("python_magic") != importlib.util.MAGIC_NUMBER.hex():
+        raise BuildError("The build was created with a different Python version; run 'bead build' again.")
+
+    for relative_path, module in manifest["modules"].items():
+        file_path = os.path.join(project_path, relative_path)
+        registry.register_precompiled(file_path, _read_bytecode(build / module["bytecode"]), module["digest"])
+
+    for relative_path, module in manifest["modules"].items():
+        if module["kind"] != "component":
+            registry.preload_page(os.path.join(project_path, relative_path))
+
+    registry.freeze(manifest.get("assets"))
+    pages_path = os.path.join(project_path, "pages")
+    for route in manifest["routes"]:
+        file_path = os.path.join(project_path, route["file"])
+        if "layouts" in route:
+            registry.register_layout_chain(file_path, [os.path.join(project_path, layout) for layout in route["layouts"]])
+        registry.load_route(file_path, pages_path)
+    set_extracted_styles(manifest["stylesheet"].get("custom_styles", []))
+
+    manifest["build_dir"] = str(build)
+    with open(build / manifest["stylesheet"]["file"], "r", encoding="utf-8") as f:
+        manifest["stylesheet"]["content"] = f.read()
+    return manifest
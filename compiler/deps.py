@@ -0,0 +1,242 @@
+import ast
+import hashlib
+import json
+import os
+import pathlib
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+GRAPH_DIR = ".bead"
+GRAPH_NAME = "deps.json"
+GRAPH_VERSION = 1
+LAYOUT_NAME = "_layout.bead"
+
+def file_kind(relative_path: str) -> str:
+    name = os.path.basename(relative_path)
+    if relative_path.startswith("components/"):
+        return "component"
+    if relative_path.startswith("pages/api/") and relative_path.endswith(".py"):
+        return "api"
+    if relative_path.startswith("pages/") and relative_path.endswith(".bead"):
+        return "layout" if name.startswith("_layout") else "page"
+    return "module"
+
+def layout_chain(pages_path: str, file_path: str) -> List[str]:
+    # pages/ kökünden sayfanın dizinine kadar her seviyedeki _layout.bead; dıştan içe sıralı.
+    pages = pathlib.Path(pages_path)
+    try:
+        parts = pathlib.Path(file_path).parent.relative_to(pages).parts
+    except ValueError:
+        return []
+    directories = [pages.joinpath(*parts[:depth]) for depth in range(len(parts) + 1)]
+    return [str(directory / LAYOUT_NAME) for directory in directories if (directory / LAYOUT_NAME).is_file()]
+
+def page_urls(pages_path, file_path) -> list:
+    relative_path_parts = pathlib.Path(file_path).relative_to(pages_path).parts
+
+    page_name = relative_path_parts[-1].removesuffix('.bead')
+    path_parts = list(relative_path_parts[:-1]) + [page_name]
+
+    url_parts = []
+    for p in path_parts:
+        if p.startswith("[...") and p.endswith("]"):
+            param_name = p[4:-1]
+            url_parts.append(f"{{{param_name}:path}}")
+        elif p.startswith("[") and p.endswith("]"):
+            param_name = p[1:-1]
+            url_parts.append(f"{{{param_name}}}")
+        else:
+            url_parts.append(p)
+
+    urls = ["/" + "/".join(url_parts)]
+    if relative_path_parts == ("index.bead",):
+        urls.append("/")
+    return urls
+
+def discover_pages(pages_path):
+    pages_path = pathlib.Path(pages_path)
+    discovered = []
+    index_file = None
+
+    for file_path in pages_path.rglob('*.bead'):
+        if file_path.name.startswith('_layout'):
+            continue
+        url_path, *index_urls = page_urls(pages_path, file_path)
+        discovered.append((url_path, str(file_path)))
+        if index_urls:
+            index_file = file_path
+
+    if index_file is not None:
+        discovered.append(("/", str(index_file)))
+
+    return discovered
+
+def _imported_modules(tree: ast.AST, relative_path: str) -> Set[str]:
+    package = relative_path.rsplit("/", 1)[0].replace("/", ".") if "/" in relative_path else ""
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.split(".") if package else []
+                parent = parent[:len(parent) - (node.level - 1)] if node.level > 1 else parent
+                base = ".".join(part for part in [*parent, base] if part)
+            if base:
+                modules.add(base)
+            # `from components import navbar` bir alt modülü içe aktarabilir.
+            modules.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names if alias.name != "*")
+    return modules
+
+def _module_file(project: pathlib.Path, module_name: str) -> Optional[str]:
+    parts = module_name.split(".")
+    candidates = []
+    if parts[0] == "components" and len(parts) > 1:
+        candidates.append(pathlib.Path(*parts).with_suffix(".bead"))
+    candidates += [pathlib.Path(*parts).with_suffix(".py"), pathlib.Path(*parts, "__init__.py")]
+    for candidate in candidates:
+        if (project / candidate).is_file():
+            return candidate.as_posix()
+    return None
+
+def scan_file(project: pathlib.Path, relative_path: str) -> List[str]:
+    # Dosyanın doğrudan bağımlılıkları: içe aktardığı proje dosyaları ve (sayfalar için) üst dizinlerdeki tüm _layout.bead'ler.
+    path = project / relative_path
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        tree = None
+
+    deps = set()
+    if tree is not None:
+        for module_name in _imported_modules(tree, relative_path):
+            module_file = _module_file(project, module_name)
+            if module_file is not None and module_file != relative_path:
+                deps.add(module_file)
+
+    if file_kind(relative_path) == "page":
+        deps.update(pathlib.Path(layout).relative_to(project).as_posix() for layout in layout_chain(project / "pages", path))
+    return sorted(deps)
+
+class DependencyGraph:
+    # Sayfa -> layout -> bileşen -> Python modülü kenarları; değişen bir dosyanın geçişli bağımlıları ters kenarlardan bulunur.
+    def __init__(self, project_path: str, nodes: Optional[Dict[str, dict]] = None):
+        self.project = pathlib.Path(project_path).resolve()
+        self.nodes = nodes or {}
+        self._reverse = None
+
+    @classmethod
+    def build(cls, project_path: str) -> "DependencyGraph":
+        graph = cls(project_path)
+        roots = []
+        for directory, pattern in (("pages", "*.bead"), ("components", "*.bead"), ("pages/api", "*.py")):
+            base = graph.project / directory
+            if base.exists():
+                roots += sorted(path.relative_to(graph.project).as_posix() for path in base.rglob(pattern))
+        graph._scan(roots)
+        return graph
+
+    @classmethod
+    def load(cls, project_path: str) -> Optional["DependencyGraph"]:
+        path = pathlib.Path(project_path) / GRAPH_DIR / GRAPH_NAME
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != GRAPH_VERSION:
+            return None
+        return cls(project_path, data["nodes"])
+
+    def save(self) -> pathlib.Path:
+        path = self.project / GRAPH_DIR / GRAPH_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": GRAPH_VERSION, "nodes": self.nodes}, f, indent=2, sort_keys=True)
+        return path
+
+    def _scan(self, queue: Iterable[str]):
+        queue = deque(queue)
+        while queue:
+            relative_path = queue.popleft()
+            deps = scan_file(self.project, relative_path)
+            self.nodes[relative_path] = {"kind": file_kind(relative_path), "deps": deps}
+            queue.extend(dep for dep in deps if dep not in self.nodes and dep not in queue)
+        self._reverse = None
+
+    def relative(self, file_path: str) -> str:
+        path = pathlib.Path(file_path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.project)
+        return path.as_posix()
+
+    def update(self, file_path: str) -> Set[str]:
+        # Tek dosyayı yeniden tarar; değişiklikten önce ve sonra ona bağlı olan dosyaların birleşimini döner.
+        relative_path = self.relative(file_path)
+        affected = self.dependents(relative_path)
+        exists = (self.project / relative_path).is_file()
+
+        if exists and relative_path not in self.nodes and file_kind(relative_path) in ("component", "module"):
+            # Yeni bir modül, daha önce çözülemeyen import'ları çözebilir; bu seyrek durumda tüm kenarlar yeniden taranır.
+            self._scan([relative_path, *self.nodes])
+        elif exists:
+            self._scan([relative_path])
+        else:
+            self.nodes.pop(relative_path, None)
+            self._reverse = None
+
+        # Yeni veya silinmiş bir layout, kendi dizini ve alt dizinlerindeki sayfaların kenarlarını değiştirir.
+        if file_kind(relative_path) == "layout":
+            prefix = os.path.dirname(relative_path) + "/"
+            nested = [path for path, node in self.nodes.items() if node["kind"] == "page" and path.startswith(prefix)]
+            self._scan(nested)
+
+        return affected | self.dependents(relative_path)
+
+    def _reverse_edges(self) -> Dict[str, Set[str]]:
+        if self._reverse is None:
+            self._reverse = {}
+            for path, node in self.nodes.items():
+                for dep in node["deps"]:
+                    self._reverse.setdefault(dep, set()).add(path)
+        return self._reverse
+
+    def dependents(self, relative_path: str) -> Set[str]:
+        reverse = self._reverse_edges()
+        found = set()
+        queue = deque([relative_path])
+        while queue:
+            for dependent in reverse.get(queue.popleft(), ()):
+                if dependent not in found:
+                    found.add(dependent)
+                    queue.append(dependent)
+        return found
+
+    def dependencies(self, relative_path: str) -> Set[str]:
+        found = set()
+        queue = deque([relative_path])
+        while queue:
+            node = self.nodes.get(queue.popleft())
+            for dep in node["deps"] if node else ():
+                if dep not in found:
+                    found.add(dep)
+                    queue.append(dep)
+        return found
+
+    def affected_pages(self, file_path: str) -> List[str]:
+        relative_path = self.relative(file_path)
+        candidates = self.dependents(relative_path) | {relative_path}
+        return sorted(path for path in candidates if file_kind(path) == "page")
+
+    def inputs_digest(self, file_path: str) -> str:
+        # Dosyanın ve geçişli bağımlılıklarının içerik özeti; dışa aktarma bir sayfanın gerçekten değişip değişmediğini bununla anlar.
+        relative_path = self.relative(file_path)
+        digest = hashlib.sha256()
+        for path in sorted(self.dependencies(relative_path) | {relative_path}):
+            digest.update(path.encode("utf-8"))
+            try:
+                digest.update((self.project / path).read_bytes())
+            except OSError:
+                digest.update(b"\0missing")
+        return digest.hexdigest()
@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import json
+import os
+import pathlib
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+from bead.compiler import registry
+from bead.compiler.deps import DependencyGraph, discover_pages
+from bead.compiler.runtime import RUNTIME_FILES
+from bead.compiler.renderer import render_page
+from bead.config import load_config
+from bead.exceptions import BuildError
+from bead.styles.compiler import generate_css, get_style_map
+
+EXPORT_MANIFEST_NAME = ".bead-export.json"
+CSS_PLACEHOLDER = "/__bead_export_css__"
+_PARAM_PATTERN = re.compile(r"\{(\w+)(?::path)?\}")
+_EVENT_ATTRIBUTE = re.compile(r' data-bead-event-on\w+="')
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def _expand_path(url_pattern: str, params: dict) -> str:
+    def replace(match):
+        value = params[match.group(1)]
+        if isinstance(value, (list, tuple)):
+            return "/".join(quote(str(part)) for part in value)
+        return quote(str(value), safe="/")
+    return _PARAM_PATTERN.sub(replace, url_pattern)
+
+def _output_file(url_path: str) -> str:
+    relative = url_path.strip("/")
+    return f"{relative}/index.html" if relative else "index.html"
+
+def _init_worker(project_path: str):
+    if project_path not in sys.path:
+        sys.path.insert(0, project_path)
+    registry.install_component_importer(project_path)
+
+def _render_job(job: dict) -> dict:
+    started = time.perf_counter()
+    compiled_route = registry.load_route(job["file"], job["pages"])
+    context = {"request": None, "query": {}, "headers": {}, "session": {}}
+
+    async def render():
+        component_tree = await compiled_route.render(job["params"], context)
+        if not component_tree:
+            raise BuildError("Component tree could not be created.")
+        utility_classes = set()
+        html_content = await render_page(component_tree, utility_classes, css_href=lambda classes: CSS_PLACEHOLDER)
+        return html_content, utility_classes
+
+    try:
+        html_content, utility_classes = asyncio.run(render())
+    except Exception as e:
+        return {**job, "error": getattr(e, "detail", None) or str(e)}
+
+    return {**job, "html": html_content, "classes": sorted(utility_classes), "elapsed": time.perf_counter() - started}
+
+def _collect_jobs(project_path: str, pages_path: str, graph: DependencyGraph):
+    jobs = []
+    skipped = []
+    for url_pattern, file_path in discover_pages(pages_path):
+        if url_pattern == "/index":
+            continue
+
+        # Bir sayfanın hatası tüm dışa aktarımı durdurmaz; sayfa nedeniyle birlikte atlananlara eklenir.
+        try:
+            compiled_page = registry.load_page(file_path)
+        except Exception as e:
+            skipped.append((url_pattern, f"compile error: {e}"))
+            continue
+        if _PARAM_PATTERN.search(url_pattern):
+            static_params = compiled_page.namespace.get("static_params")
+            if static_params is None:
+                skipped.append((url_pattern, "dynamic route without static_params()"))
+                continue
+            try:
+                params_list = list(static_params())
+            except Exception as e:
+                skipped.append((url_pattern, f"static_params error: {e}"))
+                continue
+        else:
+            params_list = [{}]
+
+        # Yalnızca sayfanın geçişli bağımlılıkları (layout, bileşenler, modüller) girdiye dahildir.
+        source_digest = graph.inputs_digest(file_path)
+
+        for params in params_list:
+            try:
+                params = {key: value for key, value in params.items()}
+                url_path = _expand_path(url_pattern, params)
+            except KeyError as e:
+                skipped.append((url_pattern, f"static_params entry {params!r} is missing {e}"))
+                continue
+            except Exception as e:
+                skipped.append((url_pattern, f"static_params error: invalid entry {params!r}: {e}"))
+                continue
+            input_hash = _digest(f"{source_digest}|{json.dumps(params, sort_keys=True, default=str)}".encode("utf-8"))
+            jobs.append({"url": url_path, "file": file_path, "pages": pages_path, "params": params, "input": input_hash})
+    return jobs, skipped
+
+def export_project(project_path: str, out_dir: str = None, workers: int = None, force: bool = False) -> dict:
+    started = time.perf_counter()
+    project_path = os.path.abspath(project_path)
+    pages_path = os.path.join(project_path, "pages")
+    out = pathlib.Path(out_dir).resolve() if out_dir else pathlib.Path(project_path) / "export"
+
+    if not os.path.isdir(pages_path):
+        raise BuildError(f"'pages' directory not found in '{project_path}'.")
+
+    _init_worker(project_path)
+    config = load_config(project_path)
+    style_map = get_style_map(config.settings)
+
+    manifest_path = out / EXPORT_MANIFEST_NAME
+    previous = {"css": None, "pages": {}}
+    if manifest_path.exists() and not force:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    graph = DependencyGraph.build(project_path)
+    graph.save()
+    jobs, skipped = _collect_jobs(project_path, pages_path, graph)
+
+    # Girdisi değişmemiş ve çıktısı diskte duran sayfalar yeniden render edilmez.
+    unchanged = []
+    pending = []
+    for job in jobs:
+        entry = previous["pages"].get(job["url"])
+        if entry is not None and entry["input"] == job["input"] and (out / entry["file"]).exists():
+            unchanged.append({**job, **entry})
+        else:
+            pending.append(job)
+
+    rendered = []
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(pending) == 1:
+            results = [_render_job(job) for job in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(project_path,)) as pool:
+                results = list(pool.map(_render_job, pending, chunksize=max(1, len(pending) // (workers * 4))))
+        for result in results:
+            if "error" in result:
+                skipped.append((result["url"], f"render error: {result['error']}"))
+            elif _EVENT_ATTRIBUTE.search(result["html"]):
+                skipped.append((result["url"], "interactive page (uses event handlers)"))
+            else:
+                rendered.append(result)
+
+    all_classes = set()
+    for page in rendered + unchanged:
+        all_classes.update(page["classes"])
+    css_content = generate_css(all_classes, style_map).encode("utf-8")
+    css_name = f"public/bead.{_digest(css_content)[:16]}.css"
+    css_href = f"/{css_name}"
+
+    (out / "public").mkdir(parents=True, exist_ok=True)
+    if not (out / css_name).exists():
+        (out / css_name).write_bytes(css_content)
+    for name, content in RUNTIME_FILES.items():
+        (out / "public" / f"bead-runtime.{name}.js").write_text(content, encoding="utf-8")
+
+    public_path = pathlib.Path(project_path) / "public"
+    if public_path.exists():
+        for asset_path in public_path.rglob("*"):
+            target = out / "public" / asset_path.relative_to(public_path)
+            if asset_path.is_dir():
+                continue
+            if not target.exists() or target.read_bytes() != asset_path.read_bytes():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(asset_path, target)
+
+    pages = {}
+    written = 0
+    for page in rendered:
+        html_content = page["html"].replace(CSS_PLACEHOLDER, css_href).encode("utf-8")
+        output_file = _output_file(page["url"])
+        output_digest = _digest(html_content)
+        previous_entry = previous["pages"].get(page["url"])
+        if previous_entry is None or previous_entry.get("output") != output_digest or not (out / output_file).exists():
+            target = out / output_file
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(html_content)
+            written += 1
+        pages[page["url"]] = {"file": output_file, "input": page["input"], "output": output_digest, "classes": page["classes"]}
+
+    previous_css_href = f"/{previous['css']}" if previous.get("css") else None
+    for page in unchanged:
+        entry = {key: page[key] for key in ("file", "input", "output", "classes")}
+        if previous_css_href and previous_css_href != css_href:
+            target = out / page["file"]
+            html_content = target.read_bytes().replace(previous_css_href.encode("utf-8"), css_href.encode("utf-8"))
+            target.write_bytes(html_content)
+            entry["output"] = _digest(html_content)
+        pages[page["url"]] = entry
+
+    if previous.get("css") and previous["css"] != css_name and (out / previous["css"]).exists():
+        (out / previous["css"]).unlink()
+
+    for url_path, entry in previous["pages"].items():
+        if url_path not in pages and (out / entry["file"]).exists():
+            (out / entry["file"]).unlink()
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"css": css_name, "pages": pages}, f, indent=2)
+
+    elapsed = time.perf_counter() - started
+    rate = len(rendered) / elapsed if elapsed > 0 else 0.0
+    for url_path, reason in skipped:
+        print(f"UYARI: {url_path} atlandı: {reason}")
+    print(f"INFO:  {len(rendered)} sayfa render edildi ({written} yazıldı), {len(unchanged)} sayfa değişmedi, {len(skipped)} atlandı.")
+    print(f"INFO:  {elapsed:.2f}s, {rate:.1f} sayfa/s. Çıktı: {out}")
+
+    return {"rendered": len(rendered), "written": written, "unchanged": len(unchanged), "skipped": skipped, "elapsed": elapsed}
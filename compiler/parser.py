@@ -4,6 +4,7 @@ import os
 from bead.ui.core_components import Component, Page, Text, Button, Card, Stack, Input, Form, Link, Image
 from bead.exceptions import CompilerError
 from bead.component import component
+from bead.compiler.renderer import render_to_parts, custom_styles_for
 from typing import Dict, Any, List
 
 _file_cache = {}
@@ -112,4 +113,106 @@ def process_ast_node_value(node, file_path: str, line_no: int, col_offset: int):
     elif isinstance(node, ast.Attribute):
         return node.attr
 
-    return None
\ No newline at end of file
+    return None
+
+# Page belge iskeletini, Form ise isteğe özel CSRF token'ını taşıdığı için önceden render edilmez.
+HOISTABLE_COMPONENTS = {"Text", "Button", "Card", "Stack", "Input", "Link", "Image"}
+PRERENDER_NAME = "__bead_prerender__"
+
+CORE_MODULES = {"bead.ui", "bead.ui.core_components"}
+
+def _bound_names(tree: ast.AST) -> set:
+    # `from bead.ui import Text` çekirdek bileşeni aynen bağlar; yalnızca başka bir şeye bağlanan adlar hariç tutulur.
+    names = set()
+    core_aliases = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module in CORE_MODULES:
+            core_aliases.update(id(alias) for alias in node.names if alias.asname in (None, alias.name))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.alias) and id(node) in core_aliases:
+            continue
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.alias):
+            names.add(node.asname or node.name.split(".")[0])
+    return names
+
+class StaticHoister(ast.NodeTransformer):
+    # Parametre ya da bağlama bağlı olmayan alt ağaçları modül seviyesine taşır ve derleme anında render edilmiş HTML'lerini üzerlerine ekler.
+    def __init__(self, namespace: dict, component_names: set):
+        self.namespace = namespace
+        self.component_names = component_names
+        self.assignments = []
+
+    def _is_static(self, node) -> bool:
+        if isinstance(node, ast.Constant):
+            return True
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return all(self._is_static(element) for element in node.elts)
+        if isinstance(node, ast.Dict):
+            return all(key is not None and self._is_static(key) for key in node.keys) and all(self._is_static(value) for value in node.values)
+        if isinstance(node, ast.Call):
+            return (
+                isinstance(node.func, ast.Name)
+                and node.func.id in self.component_names
+                and all(self._is_static(arg) for arg in node.args)
+                and all(keyword.arg is not None and self._is_static(keyword.value) for keyword in node.keywords)
+            )
+        return False
+
+    def _prerender(self, node: ast.Call):
+        try:
+            tree = eval(compile(ast.fix_missing_locations(ast.Expression(node)), "<static>", "eval"), dict(self.namespace))
+        except Exception:
+            # Hatalı çağrılar olduğu gibi bırakılır; hata istek anında her zamanki yerinden yükselsin.
+            return None
+        classes = set()
+        parts = render_to_parts(tree, classes)
+        if not all(isinstance(part, str) for part in parts):
+            return None
+        return "".join(parts), tuple(sorted(classes)), custom_styles_for(classes)
+
+    def visit_Call(self, node):
+        if self._is_static(node):
+            rendered = self._prerender(node)
+            if rendered is not None:
+                name = f"__bead_static_{len(self.assignments)}__"
+                html_content, classes, styles = rendered
+                # Asıl çağrı korunur: kullanıcı kodu düğümün prop'larını, türünü ve çocuklarını görmeye devam eder.
+                value = ast.Call(
+                    func=ast.Name(id=PRERENDER_NAME, ctx=ast.Load()),
+                    args=[
+                        node,
+                        ast.Constant(html_content),
+                        ast.Constant(classes),
+                        ast.Dict(keys=[ast.Constant(key) for key in styles], values=[ast.Constant(css) for css in styles.values()]),
+                    ],
+                    keywords=[],
+                )
+                self.assignments.append(ast.Assign(targets=[ast.Name(id=name, ctx=ast.Store())], value=value))
+                return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+        return self.generic_visit(node)
+
+def hoist_static_subtrees(tree: ast.Module, namespace: dict) -> int:
+    component_names = {name for name in HOISTABLE_COMPONENTS if name in namespace} - _bound_names(tree)
+    if not component_names:
+        return 0
+
+    hoister = StaticHoister(namespace, component_names)
+    hoister.visit(tree)
+    if not hoister.assignments:
+        return 0
+
+    position = 0
+    while position < len(tree.body) and (
+        (isinstance(tree.body[position], ast.ImportFrom) and tree.body[position].module == "__future__")
+        or (position == 0 and isinstance(tree.body[0], ast.Expr) and isinstance(tree.body[0].value, ast.Constant) and isinstance(tree.body[0].value.value, str))
+    ):
+        position += 1
+    tree.body[position:position] = hoister.assignments
+    ast.fix_missing_locations(tree)
+    return len(hoister.assignments)
@@ -0,0 +1,246 @@
+import ast
+import asyncio
+import hashlib
+import importlib.abc
+import importlib.util
+import inspect
+import os
+import random
+import sys
+from bead.ui import core_components
+from bead.compiler.parser import PRERENDER_NAME, hoist_static_subtrees
+from bead.compiler.deps import layout_chain
+from bead.exceptions import CompilerError, LayoutError
+
+_BASE_NAMESPACE = {
+    'Page': core_components.Page,
+    'Text': core_components.Text,
+    'Button': core_components.Button,
+    'Card': core_components.Card,
+    'Stack': core_components.Stack,
+    'Link': core_components.Link,
+    'Image': core_components.Image,
+    'Form': core_components.Form,
+    'Input': core_components.Input,
+    'asyncio': asyncio,
+    'random': random,
+    PRERENDER_NAME: core_components.prerender,
+}
+
+_page_cache = {}
+_route_cache = {}
+_layout_chains = {}
+_precompiled_code = {}
+_asset_urls = {}
+_frozen = False
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+class CompiledPage:
+    def __init__(self, file_path: str, code, namespace: dict, mtime_ns: int, size: int, digest: str):
+        self.file_path = file_path
+        self.code = code
+        self.namespace = namespace
+        self.default = namespace.get('default')
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+
+    def __repr__(self):
+        return f"<CompiledPage {self.file_path} {self.digest[:12]}>"
+
+class CompiledRoute:
+    # Sayfa ve layout zinciri tek bir render fonksiyonunda birleştirilir; istek başına layout araması veya derlemesi yapılmaz.
+    def __init__(self, page: CompiledPage, layouts: list):
+        self.page = page
+        self.layouts = layouts
+        self.namespace = page.namespace
+        self.render = compose_layouts(page, layouts) if page.default else None
+
+    def __repr__(self):
+        return f"<CompiledRoute {self.page.file_path} layouts={len(self.layouts)}>"
+
+def compose_layouts(page: CompiledPage, layouts: list):
+    page_func = page.default
+    page_is_async = inspect.iscoroutinefunction(page_func)
+    # İçten dışa: en yakın layout sayfayı, üst dizinlerin layout'ları onu sarar.
+    steps = [(layout.file_path, layout.default, inspect.iscoroutinefunction(layout.default)) for layout in reversed(layouts)]
+
+    async def render(params, context):
+        tree = await page_func(params, context) if page_is_async else page_func(params, context)
+        for file_path, layout_func, is_async in steps:
+            try:
+                tree = await layout_func(params, context, children=tree) if is_async else layout_func(params, context, children=tree)
+            except Exception as e:
+                raise LayoutError(file_path, e) from e
+        return tree
+
+    return render
+
+def asset(path: str) -> str:
+    path = path.lstrip("/")
+    if path.startswith("public/"):
+        path = path[len("public/"):]
+    return "/public/" + _asset_urls.get(path, path)
+
+def build_namespace(file_path: str) -> dict:
+    namespace = dict(_BASE_NAMESPACE)
+    namespace['asset'] = asset
+    namespace['__file__'] = file_path
+    namespace['__name__'] = os.path.splitext(os.path.basename(file_path))[0]
+    return namespace
+
+def compile_source(file_path: str, source: bytes):
+    try:
+        tree = ast.parse(source, filename=file_path)
+    except SyntaxError as e:
+        raise CompilerError(f"Syntax error: {e.msg}", file_path, e.lineno, e.offset)
+    hoist_static_subtrees(tree, _BASE_NAMESPACE)
+    return compile(tree, file_path, "exec", dont_inherit=True)
+
+def get_code(file_path: str):
+    if file_path in _precompiled_code:
+        return _precompiled_code[file_path][0]
+    with open(file_path, "rb") as f:
+        return compile_source(file_path, f.read())
+
+def compile_page(file_path: str, source: bytes, mtime_ns: int = 0, size: int = 0, digest: str = None) -> CompiledPage:
+    code = compile_source(file_path, source)
+    return execute_page(file_path, code, source, mtime_ns, size, digest)
+
+def execute_page(file_path: str, code, source: bytes = b"", mtime_ns: int = 0, size: int = 0, digest: str = None) -> CompiledPage:
+    namespace = build_namespace(file_path)
+    exec(code, namespace)
+
+    if digest is None:
+        digest = hashlib.sha256(source).hexdigest()
+    return CompiledPage(file_path, code, namespace, mtime_ns, size, digest)
+
+def load_page(file_path: str) -> CompiledPage:
+    entry = _page_cache.get(file_path)
+    if _frozen and entry is not None:
+        _stats["hits"] += 1
+        return entry
+
+    stat = os.stat(file_path)
+
+    if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+        _stats["hits"] += 1
+        return entry
+
+    with open(file_path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+
+    # Dosyaya dokunulmuş ama içerik aynı kalmışsa yeniden derlemeye gerek yok.
+    if entry is not None and entry.digest == digest:
+        entry.mtime_ns = stat.st_mtime_ns
+        entry.size = stat.st_size
+        _stats["hits"] += 1
+        return entry
+
+    _stats["misses"] += 1
+    if entry is not None:
+        _stats["invalidations"] += 1
+
+    compiled = compile_page(file_path, source, stat.st_mtime_ns, stat.st_size, digest)
+    _page_cache[file_path] = compiled
+    return compiled
+
+def register_layout_chain(file_path: str, layouts: list):
+    _layout_chains[file_path] = list(layouts)
+
+def load_route(file_path: str, pages_path: str) -> CompiledRoute:
+    entry = _route_cache.get(file_path)
+    if _frozen and entry is not None:
+        return entry
+
+    chain = _layout_chains.get(file_path)
+    if chain is None:
+        chain = _layout_chains[file_path] = layout_chain(pages_path, file_path)
+
+    page = load_page(file_path)
+    layouts = [load_page(layout_path) for layout_path in chain]
+    # Sayfa ve layout'lar önbellekten aynı nesne olarak döndüyse birleştirilmiş fonksiyon geçerlidir.
+    if entry is not None and entry.page is page and all(old is new for old, new in zip(entry.layouts, layouts)):
+        return entry
+
+    entry = _route_cache[file_path] = CompiledRoute(page, layouts)
+    return entry
+
+def register_precompiled(file_path: str, code, digest: str):
+    _precompiled_code[file_path] = (code, digest)
+
+def preload_page(file_path: str) -> CompiledPage:
+    code, digest = _precompiled_code[file_path]
+    compiled = execute_page(file_path, code, digest=digest)
+    _page_cache[file_path] = compiled
+    return compiled
+
+def freeze(asset_urls: dict = None):
+    global _frozen
+    _frozen = True
+    if asset_urls:
+        _asset_urls.update(asset_urls)
+
+def invalidate(file_path: str):
+    if _page_cache.pop(file_path, None) is not None:
+        _stats["invalidations"] += 1
+    # Sayfanın layout zinciri yeniden çözülür (ör. yeni bir _layout.bead eklendiğinde).
+    _route_cache.pop(file_path, None)
+    _layout_chains.pop(file_path, None)
+
+def clear_cache():
+    global _frozen
+    _page_cache.clear()
+    _route_cache.clear()
+    _layout_chains.clear()
+    _precompiled_code.clear()
+    _asset_urls.clear()
+    _frozen = False
+
+def get_stats() -> dict:
+    return {**_stats, "size": len(_page_cache), "routes": len(_route_cache)}
+
+class ComponentImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    # `from components.navbar import Navbar` ifadesini components/navbar.bead dosyasına yönlendirir.
+    def __init__(self, components_path: str):
+        self.components_path = components_path
+
+    def find_spec(self, fullname, path=None, target=None):
+        parts = fullname.split(".")
+        if parts[0] != "components":
+            return None
+        if os.path.exists(os.path.join(self.components_path, "__init__.py")):
+            return None
+
+        location = os.path.join(self.components_path, *parts[1:])
+        if os.path.isdir(location):
+            return importlib.util.spec_from_loader(fullname, self, origin=location, is_package=True)
+
+        file_path = location + ".bead"
+        if os.path.exists(file_path) or file_path in _precompiled_code:
+            return importlib.util.spec_from_loader(fullname, self, origin=file_path)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        if spec.submodule_search_locations is not None:
+            module.__path__ = [spec.origin]
+            return
+
+        module.__dict__.update(_BASE_NAMESPACE)
+        module.__dict__['asset'] = asset
+        module.__file__ = spec.origin
+        exec(get_code(spec.origin), module.__dict__)
+
+def install_component_importer(project_path: str) -> ComponentImporter:
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, ComponentImporter)]
+    for name in [name for name in sys.modules if name == "components" or name.startswith("components.")]:
+        del sys.modules[name]
+
+    importer = ComponentImporter(os.path.join(project_path, "components"))
+    sys.meta_path.insert(0, importer)
+    return importer
@@ -1,76 +1,154 @@
 import html
-from bead.ui.core_components import Component, Page, Text, Button, Card, Stack, Input, Form, Link, Image
-from bead.styles.compiler import extract_classes, get_style_map
-from typing import Optional, Awaitable, List
+from bead.ui.core_components import Component, Page, Text, Button, Card, Stack, Input, Form, Link, Image, Memo
+from bead.styles.compiler import custom_style_class, custom_style_rule
+from bead.compiler.runtime import RUNTIME_SCRIPT_TAG
+from typing import Optional, Awaitable, List, Callable
+from collections import OrderedDict
 import asyncio
+import inspect
 
-_all_custom_styles = set()
-_all_utility_classes = set()
+MAX_CUSTOM_STYLES = 4096
+
+# Sınıf adı -> stil metni. İçerik adresli olduğu için aynı stil tek kayıt tutar; LRU ile sınırlıdır.
+_custom_styles = OrderedDict()
+_extracted_styles = set()
 
 def escape_html(text: str) -> str:
     if text is None:
         return ""
     return html.escape(text, quote=True)
 
-async def render_component(component: Component, utility_classes: set, csrf_token: Optional[str] = None) -> str:
+_TAGS = {
+    "Page": "html",
+    "Text": "p",
+    "Button": "button",
+    "Card": "div",
+    "Stack": "div",
+    "Input": "input",
+    "Form": "form",
+    "Link": "a",
+    "Image": "img",
+}
+
+def _children_of(props: dict) -> list:
+    children_prop = props.get("children", {})
+    if isinstance(children_prop, dict):
+        all_children = []
+        for slot_name, slot_children in children_prop.items():
+            if isinstance(slot_children, (list, tuple)):
+                all_children.extend(slot_children)
+        return all_children
+    if isinstance(children_prop, (list, tuple)):
+        return children_prop
+    return []
+
+def register_custom_style(css: str, class_name: Optional[str] = None) -> str:
+    class_name = class_name or custom_style_class(css)
+    if class_name in _custom_styles:
+        _custom_styles.move_to_end(class_name)
+    else:
+        _custom_styles[class_name] = css.strip()
+        while len(_custom_styles) > MAX_CUSTOM_STYLES:
+            _custom_styles.popitem(last=False)
+    return class_name
+
+def set_extracted_styles(class_names):
+    _extracted_styles.clear()
+    _extracted_styles.update(class_names)
+
+def custom_styles_css(classes) -> str:
+    return "\n".join(
+        custom_style_rule(class_name, _custom_styles[class_name])
+        for class_name in sorted(classes)
+        if class_name in _custom_styles and class_name not in _extracted_styles
+    )
+
+def custom_styles_for(classes) -> dict:
+    return {class_name: _custom_styles[class_name] for class_name in classes if class_name in _custom_styles}
+
+def _register_fragment_styles(props: dict):
+    for class_name, css in props.get("styles", {}).items():
+        register_custom_style(css, class_name)
+
+def _prerendered_of(component):
+    # Bileşen alt sınıfları super().__init__ çağırmadan da oluşturulabilir; eksik slot "önceden render edilmemiş" sayılır.
+    return getattr(component, "prerendered", None)
+
+def _use_prerendered(prerendered, utility_classes: set) -> str:
+    html_content, classes, styles = prerendered
+    for class_name, css in styles.items():
+        register_custom_style(css, class_name)
+    utility_classes.update(classes)
+    return html_content
+
+def _style_of(props) -> Optional[str]:
+    # custom_style sınıfı prop'lara yazılmaz; ağaç render sırasında değişmeden kalır.
+    style = props.get("style")
+    custom_style = props.get("custom_style")
+    if custom_style is None:
+        return style
+    class_name = register_custom_style(custom_style)
+    if style is None:
+        return class_name
+    if class_name in style.split():
+        return style
+    return f"{style} {class_name}"
+
+def collect_styles(component, utility_classes: set):
     if not isinstance(component, Component):
-        return escape_html(str(component))
-
+        return
+    prerendered = _prerendered_of(component)
+    if prerendered is not None:
+        _use_prerendered(prerendered, utility_classes)
+        return
+    props = component.props
+    if component.component_type == "Fragment":
+        _register_fragment_styles(props)
+        utility_classes.update(props["classes"])
+        return
+    style = _style_of(props)
+    if style is not None:
+        utility_classes.update(style.split())
+    for child in _children_of(props):
+        collect_styles(child, utility_classes)
+
+def _node_parts(component: Component, utility_classes: set, csrf_token: Optional[str]):
+    prerendered = _prerendered_of(component)
+    if prerendered is not None:
+        return _use_prerendered(prerendered, utility_classes), (), ""
     props = component.props
     component_type = component.component_type
+
+    if component_type == "Fragment":
+        _register_fragment_styles(props)
+        utility_classes.update(props["classes"])
+        return props["html"], (), ""
+    if component_type == "Memo":
+        return "", props["children"]["default"], ""
     attrs = ""
 
     for key, value in props.items():
         if key.startswith("on"):
             attrs += f' data-bead-event-{key}="{escape_html(str(value))}"'
-            
-    if "custom_style" in props and props["custom_style"] is not None:
-        _all_custom_styles.add(f' .custom-style-{id(component)} {{ {props["custom_style"]} }}')
-        if "style" in props and props["style"] is not None:
-            props["style"] += f" custom-style-{id(component)}"
-        else:
-            props["style"] = f" custom-style-{id(component)}"
+    if props.get("debounce") is not None:
+        attrs += f' data-bead-debounce="{int(props["debounce"])}"'
 
-    if "style" in props and props["style"] is not None:
-        attrs += f' class="{escape_html(props["style"])}"'
-        found_classes = extract_classes(f'class="{props["style"]}"')
-        utility_classes.update(found_classes)
+    style = _style_of(props)
+    if style is not None:
+        attrs += f' class="{escape_html(style)}"'
+        utility_classes.update(style.split())
 
     if "id" in props and props["id"] is not None:
       attrs += f' id="{escape_html(props["id"])}"'
-      
+
     if "href" in props and props["href"] is not None:
         attrs += f' href="{escape_html(props["href"])}"'
-    
+
     if "as_" in props:
         tag = props["as_"]
     else:
-        tag = {
-            "Page": "html",
-            "Text": "p",
-            "Button": "button",
-            "Card": "div",
-            "Stack": "div",
-            "Input": "input",
-            "Form": "form",
-            "Link": "a",
-            "Image": "img",
-        }.get(component_type, "div")
-
-    children_html = ""
-    children_prop = props.get("children", {})
-    
-    if isinstance(children_prop, dict):
-        all_children = []
-        for slot_name, slot_children in children_prop.items():
-            if isinstance(slot_children, list):
-                all_children.extend(slot_children)
-        render_tasks = [render_component(child, utility_classes, csrf_token=csrf_token) for child in all_children]
-        children_html = "".join(await asyncio.gather(*render_tasks))
-    elif isinstance(children_prop, list):
-        render_tasks = [render_component(child, utility_classes, csrf_token=csrf_token) for child in children_prop]
-        children_html = "".join(await asyncio.gather(*render_tasks))
-    
+        tag = _TAGS.get(component_type, "div")
+
     if component_type == "Image":
         if "src" in props:
             attrs += f' src="{escape_html(props["src"])}"'
@@ -78,25 +156,25 @@ async def render_component(component: Component, utility_classes: set, csrf_toke
             attrs += f' alt="{escape_html(props["alt"])}"'
         if "loading" in props and props["loading"] is not None:
             attrs += f' loading="{escape_html(props["loading"])}"'
-        return f'<{tag}{attrs} />'
+        return f'<{tag}{attrs} />', (), ""
 
     if component_type == "Link":
         label = escape_html(props.get("label", ""))
         if props.get("router_link"):
             attrs += f' data-bead-router-link'
-        return f'<{tag}{attrs}>{label}</{tag}>'
+        return f'<{tag}{attrs}>{label}</{tag}>', (), ""
 
     if component_type == "Form":
         if "action" in props:
             attrs += f' action="{escape_html(props["action"])}"'
         if "method" in props:
             attrs += f' method="{escape_html(props["method"])}"'
-        
+
+        closing = f'</{tag}>'
         if csrf_token is not None:
-            csrf_input = f'<input type="hidden" name="csrf_token" value="{escape_html(csrf_token)}" />'
-            children_html += csrf_input
-            
-        return f'<{tag}{attrs}>{children_html}</{tag}>'
+            closing = f'<input type="hidden" name="csrf_token" value="{escape_html(csrf_token)}" />' + closing
+
+        return f'<{tag}{attrs}>', _children_of(props), closing
 
     if component_type == "Input":
         if "name" in props:
@@ -107,264 +185,237 @@ async def render_component(component: Component, utility_classes: set, csrf_toke
             attrs += f' value="{escape_html(props["value"])}"'
         if "placeholder" in props:
             attrs += f' placeholder="{escape_html(props["placeholder"])}"'
-        return f'<{tag}{attrs} />'
+        return f'<{tag}{attrs} />', (), ""
 
     if component_type == "Page":
-        title = escape_html(props.get("title", "Bead App"))
-        meta_html = ""
-        if "meta" in props and isinstance(props["meta"], dict):
-            for name, content in props["meta"].items():
-                if name == "favicon":
-                    meta_html += f'    <link rel="icon" href="{escape_html(content)}" type="image/x-icon">\n'
-                else:
-                    meta_html += f'    <meta name="{escape_html(name)}" content="{escape_html(content)}">\n'
-        
-        render_tasks = [render_component(child, utility_classes, csrf_token=csrf_token) for child in props["children"]['default']]
-        body_content = "".join(await asyncio.gather(*render_tasks))
-        
-        head_content = f"""
-<head>
-    <title>{title}</title>
-{meta_html}
-</head>
-"""
-        return (f"<!DOCTYPE html><html>{head_content}<body>{body_content}</body></html>")
+        head = "".join(_page_head(props))
+        return f"<!DOCTYPE html><html>\n<head>\n{head}</head>\n<body>", props["children"]['default'], "</body></html>"
 
     if component_type == "Text":
         value = escape_html(props.get("value", ""))
-        return f'<{tag}{attrs}>{value}</{tag}>'
-    
+        return f'<{tag}{attrs}>{value}</{tag}>', (), ""
+
     if component_type == "Button":
         label = escape_html(props.get("label", "Button"))
-        return f'<{tag}{attrs}>{label}</{tag}>'
-
-    return f'<{tag}{attrs}>{children_html}</{tag}>'
-
-async def render_page(component_tree: Component, utility_classes: set, csrf_token: Optional[str] = None) -> str:
-    html_content = await render_component(component_tree, utility_classes, csrf_token=csrf_token)
-
-    css_link = '<link rel="stylesheet" href="/public/bead.css">'
-    html_content = html_content.replace('</head>', f'    {css_link}\n</head>')
-    
-    custom_styles_str = "\n".join(list(_all_custom_styles))
-    if custom_styles_str:
-        style_block = f'\n    <style>{custom_styles_str}</style>\n'
-        html_content = html_content.replace('</head>', f'{style_block}\n</head>')
-
-    js_runtime = """
-    <script>
-    function morphdom(fromNode, toNode) {
-      if (!fromNode || !toNode) {
-        return toNode;
-      }
-
-      if (fromNode.isEqualNode(toNode)) {
-        return fromNode;
-      }
-      
-      var toAttrs = toNode.attributes;
-      var fromAttrs = fromNode.attributes;
-
-      for (var i = toAttrs.length - 1; i >= 0; --i) {
-        var attr = toAttrs[i];
-        if (attr.name.startsWith('data-bead-event-')) continue;
-        fromNode.setAttribute(attr.name, attr.value);
-      }
-
-      for (var i = fromAttrs.length - 1; i >= 0; --i) {
-        var attr = fromAttrs[i];
-        if (attr.name.startsWith('data-bead-event-')) continue;
-        if (!toNode.hasAttribute(attr.name)) {
-          fromNode.removeAttribute(attr.name);
-        }
-      }
-
-      var fromChildren = Array.from(fromNode.childNodes);
-      var toChildren = Array.from(toNode.childNodes);
-
-      var fromChildrenLen = fromChildren.length;
-      var toChildrenLen = toChildren.length;
-
-      for (var i = 0; i < toChildrenLen; i++) {
-        var toChild = toChildren[i];
-        if (i < fromChildrenLen) {
-          var fromChild = fromChildren[i];
-          if (fromChild.nodeType === Node.TEXT_NODE && toChild.nodeType === Node.TEXT_NODE) {
-            fromChild.nodeValue = toChild.nodeValue;
-          } else if (fromChild.nodeType !== toChild.nodeType || fromChild.tagName !== toChild.tagName) {
-            fromNode.replaceChild(toChild.cloneNode(true), fromChild);
-          } else {
-            morphdom(fromChild, toChild);
-          }
-        } else {
-          fromNode.appendChild(toChild.cloneNode(true));
-        }
-      }
-
-      while (fromChildrenLen > toChildrenLen) {
-        fromNode.removeChild(fromChildren[fromChildrenLen - 1]);
-        fromChildrenLen--;
-      }
-
-      return fromNode;
-    }
+        return f'<{tag}{attrs}>{label}</{tag}>', (), ""
 
-    function updateHead(newDoc) {
-      document.title = newDoc.title;
-      const newMetaTags = newDoc.head.querySelectorAll('meta');
-      const currentMetaTags = document.head.querySelectorAll('meta');
-      const newLinks = newDoc.head.querySelectorAll('link');
-      const currentLinks = document.head.querySelectorAll('link');
-
-      for(const newTag of newMetaTags) {
-        const currentTag = Array.from(currentMetaTags).find(t => t.name === newTag.name);
-        if (currentTag) {
-          if (currentTag.content !== newTag.content) {
-            currentTag.content = newTag.content;
-          }
-        } else {
-          document.head.appendChild(newTag.cloneNode(true));
-        }
-      }
-
-      for(const currentTag of currentMetaTags) {
-        if (!Array.from(newMetaTags).some(t => t.name === currentTag.name)) {
-          currentTag.remove();
-        }
-      }
-      
-      for(const newLink of newLinks) {
-        const currentLink = Array.from(currentLinks).find(l => l.href === newLink.href);
-        if (!currentLink) {
-          document.head.appendChild(newLink.cloneNode(true));
-        }
-      }
-      
-      for(const currentLink of currentLinks) {
-        if (!Array.from(newLinks).some(l => l.href === currentLink.href)) {
-          if (!currentLink.href.includes('/public/bead.css')) {
-            currentLink.remove();
-          }
-        }
-      }
-    }
+    return f'<{tag}{attrs}>', _children_of(props), f'</{tag}>'
+
+def render_to_parts(component, utility_classes: set, csrf_token: Optional[str] = None, parts: Optional[list] = None) -> list:
+    # Awaitable çocuklar listede boşluk olarak kalır; render_component bunları bekleyip doldurur.
+    if parts is None:
+        parts = []
+
+    if not isinstance(component, Component):
+        if inspect.isawaitable(component):
+            parts.append(component)
+        else:
+            parts.append(escape_html(str(component)))
+        return parts
+
+    if component.component_type == "Memo":
+        _render_memo(component, utility_classes, csrf_token, parts)
+        return parts
+
+    opening, children, closing = _node_parts(component, utility_classes, csrf_token)
+    parts.append(opening)
+    for child in children:
+        render_to_parts(child, utility_classes, csrf_token, parts)
+    if closing:
+        parts.append(closing)
+    return parts
+
+def _render_memo(memo: Memo, utility_classes: set, csrf_token: Optional[str], parts: list):
+    props = memo.props
+    memo_classes = set()
+    memo_parts = []
+    for child in props["children"]["default"]:
+        render_to_parts(child, memo_classes, csrf_token, memo_parts)
+    utility_classes.update(memo_classes)
+
+    # Awaitable içeren ya da isteğe özel CSRF token'ı taşıyan parçalar önbelleğe alınmaz.
+    if all(isinstance(part, str) for part in memo_parts):
+        html_content = "".join(memo_parts)
+        if csrf_token is None or escape_html(csrf_token) not in html_content:
+            props["cache"].set(props["cache_key"], html_content, memo_classes, custom_styles_for(memo_classes))
+        parts.append(html_content)
+    else:
+        parts.extend(memo_parts)
+
+async def _resolve_holes(parts: list, utility_classes: set, csrf_token: Optional[str]):
+    holes = [i for i, part in enumerate(parts) if not isinstance(part, str)]
+    if not holes:
+        return
 
+    results = await asyncio.gather(*(parts[i] for i in holes))
+    for i, result in zip(holes, results):
+        parts[i] = await render_component(result, utility_classes, csrf_token=csrf_token)
+
+async def _resolve_parts(parts: list, utility_classes: set, csrf_token: Optional[str]) -> str:
+    await _resolve_holes(parts, utility_classes, csrf_token)
+    return "".join(parts)
+
+async def render_component(component: Component, utility_classes: set, csrf_token: Optional[str] = None) -> str:
+    parts = render_to_parts(component, utility_classes, csrf_token)
+    return await _resolve_parts(parts, utility_classes, csrf_token)
+
+async def render_component_concurrent(component: Component, utility_classes: set, csrf_token: Optional[str] = None) -> str:
+    # Her çocuk için ayrı bir görev başlatan eski yol; karşılaştırma için duruyor.
+    if inspect.isawaitable(component):
+        component = await component
+    if not isinstance(component, Component):
+        return escape_html(str(component))
+
+    opening, children, closing = _node_parts(component, utility_classes, csrf_token)
+    render_tasks = [render_component_concurrent(child, utility_classes, csrf_token=csrf_token) for child in children]
+    children_html = "".join(await asyncio.gather(*render_tasks))
+    return f"{opening}{children_html}{closing}"
+
+def _page_head(props: dict) -> list:
+    head = [f'    <title>{escape_html(props.get("title", "Bead App"))}</title>\n']
+    if "meta" in props and isinstance(props["meta"], dict):
+        for name, content in props["meta"].items():
+            if name == "favicon":
+                head.append(f'    <link rel="icon" href="{escape_html(content)}" type="image/x-icon">\n')
+            else:
+                head.append(f'    <meta name="{escape_html(name)}" content="{escape_html(content)}">\n')
+    return head
+
+_head_hooks = []
+
+def add_head_hook(hook: Callable[["Document"], None]):
+    # Eklentiler belgeyi yeniden taramadan <head> ve </body> öncesine içerik ekleyebilir.
+    if hook not in _head_hooks:
+        _head_hooks.append(hook)
+
+def remove_head_hook(hook: Callable[["Document"], None]):
+    if hook in _head_hooks:
+        _head_hooks.remove(hook)
+
+class Document:
+    def __init__(self, page: Page, utility_classes: set):
+        self.page = page
+        self.utility_classes = utility_classes
+        self.head = _page_head(page.props)
+        self.body_end = []
+
+    def add_head(self, html_content: str):
+        self.head.append(f"    {html_content}\n")
+
+    def add_stylesheet(self, href: str):
+        self.add_head(f'<link rel="stylesheet" href="{escape_html(href)}">')
+
+    def add_style(self, css: str):
+        if css:
+            self.add_head(f"<style>{css}</style>")
+
+    def add_preload(self, href: str, as_: str):
+        self.add_head(f'<link rel="preload" href="{escape_html(href)}" as="{escape_html(as_)}">')
+
+    def add_script(self, src: str, defer: bool = True, head: bool = False):
+        tag = f'<script src="{escape_html(src)}"{" defer" if defer else ""}></script>'
+        if head:
+            self.add_head(tag)
+        else:
+            self.body_end.append(tag)
+
+    def opening(self) -> list:
+        return ["<!DOCTYPE html><html>\n<head>\n", *self.head, "</head>\n<body>"]
+
+    def closing(self) -> list:
+        return [*self.body_end, RUNTIME_SCRIPT_TAG, "</body></html>"]
+
+def _build_document(page: Page, utility_classes: set, css_href: Optional[Callable[[set], str]]) -> Document:
+    document = Document(page, utility_classes)
+    document.add_stylesheet(css_href(utility_classes) if css_href is not None else "/public/bead.css")
+    document.add_style(custom_styles_css(utility_classes))
+    for hook in _head_hooks:
+        hook(document)
+    return document
+
+async def _render_body(page: Page, utility_classes: set, csrf_token: Optional[str], concurrent: bool) -> list:
+    body = page.props["children"]["default"]
+    if concurrent:
+        return await asyncio.gather(*(render_component_concurrent(child, utility_classes, csrf_token=csrf_token) for child in body))
+    body_parts = []
+    for child in body:
+        render_to_parts(child, utility_classes, csrf_token, body_parts)
+    await _resolve_holes(body_parts, utility_classes, csrf_token)
+    return body_parts
+
+async def render_page(component_tree: Component, utility_classes: set, csrf_token: Optional[str] = None, css_href: Optional[Callable[[set], str]] = None, concurrent: bool = False) -> str:
+    if not isinstance(component_tree, Page):
+        if concurrent:
+            return await render_component_concurrent(component_tree, utility_classes, csrf_token=csrf_token)
+        return await render_component(component_tree, utility_classes, csrf_token=csrf_token)
+
+    # Gövde önce parçalar halinde render edilir; belge head/body yuvalarıyla tek seferde birleştirilir.
+    body_parts = await _render_body(component_tree, utility_classes, csrf_token, concurrent)
+    document = _build_document(component_tree, utility_classes, css_href)
+    return "".join([*document.opening(), *body_parts, *document.closing()])
+
+async def render_fragment(component_tree: Component, utility_classes: set, csrf_token: Optional[str] = None, css_href: Optional[Callable[[set], str]] = None, concurrent: bool = False) -> dict:
+    # İstemci yönlendiricisi için: runtime ve head kancaları sayfada zaten yüklüdür; yalnızca başlık, meta ve gövde gönderilir.
+    title = None
+    meta = {}
+    if isinstance(component_tree, Page):
+        props = component_tree.props
+        body = "".join(await _render_body(component_tree, utility_classes, csrf_token, concurrent))
+        title = props.get("title", "Bead App")
+        if isinstance(props.get("meta"), dict):
+            meta = {name: content for name, content in props["meta"].items() if name != "favicon"}
+    else:
+        body = await render_page(component_tree, utility_classes, csrf_token=csrf_token, concurrent=concurrent)
+
+    return {
+        "title": title,
+        "meta": meta,
+        "stylesheet": css_href(utility_classes) if css_href is not None else "/public/bead.css",
+        "style": custom_styles_css(utility_classes),
+        "body": body,
+    }
 
-    document.addEventListener('DOMContentLoaded', () => {
-        document.body.addEventListener('click', (event) => {
-            let target = event.target;
-            while (target && !target.dataset.beadEventOnclick) {
-                target = target.parentElement;
-            }
-            if (target && target.dataset.beadEventOnclick) {
-                event.preventDefault();
-                handleEvent(target, target.dataset.beadEventOnclick);
-            }
-
-            let routerLinkTarget = event.target.closest('[data-bead-router-link]');
-            if (routerLinkTarget && routerLinkTarget.href) {
-                event.preventDefault();
-                handleRouterLink(routerLinkTarget.href);
-            }
-        });
-
-        document.body.addEventListener('submit', (event) => {
-            let target = event.target;
-            while (target && target.tagName !== 'FORM') {
-                target = target.parentElement;
-            }
-            if (target && target.dataset.beadEventOnsubmit) {
-                event.preventDefault();
-                handleEvent(target, target.dataset.beadEventOnsubmit);
-            }
-        });
-
-        function handleEvent(target, handlerName) {
-            let requestBody = {};
-            if (target.tagName === 'FORM') {
-                const formData = new FormData(target);
-                requestBody = Object.fromEntries(formData.entries());
-            }
-
-            fetch(`/_events/${handlerName}`, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(requestBody)
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(error => {
-                        window.alert(error.error);
-                        throw new Error(error.error);
-                    });
-                }
-                return response.json();
-            })
-            .then(data => {
-                if (data.redirect) {
-                    window.location.href = data.redirect;
-                } else if (data.patch) {
-                    const tempElement = document.createElement('div');
-                    tempElement.innerHTML = data.patch;
-                    const patchElement = tempElement.firstElementChild;
-                    
-                    if (patchElement && patchElement.id) {
-                        const currentElement = document.getElementById(patchElement.id);
-                        if (currentElement) {
-                            morphdom(currentElement, patchElement);
-                        }
-                    } else {
-                        morphdom(document.body, tempElement.querySelector('body'));
-                    }
-                }
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-            });
-        }
-        
-        function handleRouterLink(href, isPopState = false) {
-            fetch(href, {
-                method: 'GET',
-                headers: {
-                    'X-Bead-Router': 'true' 
-                }
-            })
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Network response was not ok');
-                }
-                return response.text();
-            })
-            .then(htmlContent => {
-                const parser = new DOMParser();
-                const newDoc = parser.parseFromString(htmlContent, 'text/html');
-                const newBody = newDoc.querySelector('body');
-                
-                if (newBody) {
-                    morphdom(document.body, newBody);
-                    updateHead(newDoc);
-                    if (!isPopState) {
-                        window.history.pushState({}, '', href);
-                    }
-                } else {
-                    console.error('Yeni sayfa gövdesi bulunamadı.');
-                }
-            })
-            .catch(error => {
-                console.error('Rota geçişi sırasında hata:', error);
-                if (!isPopState) {
-                   window.location.href = href;
-                }
-            });
-        }
-        
-        window.addEventListener('popstate', (event) => {
-            handleRouterLink(window.location.href, true);
-        });
-
-    });
-    </script>
-    """
-    
-    return html_content.replace('</body>', f'{js_runtime}</body>')
\ No newline at end of file
+async def stream_page(component_tree: Component, utility_classes: set, csrf_token: Optional[str] = None, css_href: Optional[Callable[[set], str]] = None):
+    if not isinstance(component_tree, Page):
+        yield await render_page(component_tree, utility_classes, csrf_token=csrf_token, css_href=css_href)
+        return
+
+    # <head> içindeki CSS bağlantısı için sınıflar gövde render edilmeden önce toplanır.
+    collect_styles(component_tree, utility_classes)
+    head_classes = set(utility_classes)
+
+    document = _build_document(component_tree, utility_classes, css_href)
+    yield "".join(document.opening())
+    body = component_tree.props["children"]["default"]
+
+    parts = []
+    for child in body:
+        render_to_parts(child, utility_classes, csrf_token, parts)
+
+    # Awaitable boşluklar birlikte başlatılır, bittikçe belge sırasıyla gönderilir.
+    parts = [part if isinstance(part, str) else asyncio.ensure_future(part) for part in parts]
+    try:
+        buffer = []
+        for part in parts:
+            if isinstance(part, str):
+                buffer.append(part)
+                continue
+            if buffer:
+                yield "".join(buffer)
+                buffer = []
+            yield await render_component(await part, utility_classes, csrf_token=csrf_token)
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        for part in parts:
+            if not isinstance(part, str) and not part.done():
+                part.cancel()
+
+    late_classes = utility_classes - head_classes
+    if late_classes and css_href is not None:
+        yield f'<link rel="stylesheet" href="{escape_html(css_href(late_classes))}">'
+    late_styles = custom_styles_css(late_classes)
+    if late_styles:
+        yield f"<style>{late_styles}</style>"
+
+    yield "".join(document.closing())
@@ -0,0 +1,580 @@
+import hashlib
+
+RUNTIME_JS = """
+function morphdom(fromNode, toNode) {
+  if (!fromNode || !toNode) {
+    return toNode;
+  }
+
+  if (fromNode.isEqualNode(toNode)) {
+    return fromNode;
+  }
+
+  var toAttrs = toNode.attributes;
+  var fromAttrs = fromNode.attributes;
+
+  for (var i = toAttrs.length - 1; i >= 0; --i) {
+    var attr = toAttrs[i];
+    if (attr.name.startsWith('data-bead-event-')) continue;
+    fromNode.setAttribute(attr.name, attr.value);
+  }
+
+  for (var i = fromAttrs.length - 1; i >= 0; --i) {
+    var attr = fromAttrs[i];
+    if (attr.name.startsWith('data-bead-event-')) continue;
+    if (!toNode.hasAttribute(attr.name)) {
+      fromNode.removeAttribute(attr.name);
+    }
+  }
+
+  var fromChildren = Array.from(fromNode.childNodes);
+  var toChildren = Array.from(toNode.childNodes);
+
+  var fromChildrenLen = fromChildren.length;
+  var toChildrenLen = toChildren.length;
+
+  for (var i = 0; i < toChildrenLen; i++) {
+    var toChild = toChildren[i];
+    if (i < fromChildrenLen) {
+      var fromChild = fromChildren[i];
+      if (fromChild.nodeType === Node.TEXT_NODE && toChild.nodeType === Node.TEXT_NODE) {
+        fromChild.nodeValue = toChild.nodeValue;
+      } else if (fromChild.nodeType !== toChild.nodeType || fromChild.tagName !== toChild.tagName) {
+        fromNode.replaceChild(toChild.cloneNode(true), fromChild);
+      } else {
+        morphdom(fromChild, toChild);
+      }
+    } else {
+      fromNode.appendChild(toChild.cloneNode(true));
+    }
+  }
+
+  while (fromChildrenLen > toChildrenLen) {
+    fromNode.removeChild(fromChildren[fromChildrenLen - 1]);
+    fromChildrenLen--;
+  }
+
+  return fromNode;
+}
+
+function updateHead(newDoc) {
+  document.title = newDoc.title;
+  const newMetaTags = newDoc.head.querySelectorAll('meta');
+  const currentMetaTags = document.head.querySelectorAll('meta');
+  const newLinks = newDoc.head.querySelectorAll('link');
+  const currentLinks = document.head.querySelectorAll('link');
+
+  for(const newTag of newMetaTags) {
+    const currentTag = Array.from(currentMetaTags).find(t => t.name === newTag.name);
+    if (currentTag) {
+      if (currentTag.content !== newTag.content) {
+        currentTag.content = newTag.content;
+      }
+    } else {
+      document.head.appendChild(newTag.cloneNode(true));
+    }
+  }
+
+  for(const currentTag of currentMetaTags) {
+    if (!Array.from(newMetaTags).some(t => t.name === currentTag.name)) {
+      currentTag.remove();
+    }
+  }
+
+  for(const newLink of newLinks) {
+    const currentLink = Array.from(currentLinks).find(l => l.href === newLink.href);
+    if (!currentLink) {
+      document.head.appendChild(newLink.cloneNode(true));
+    }
+  }
+
+  for(const currentLink of currentLinks) {
+    if (!Array.from(newLinks).some(l => l.href === currentLink.href)) {
+      if (!currentLink.href.includes('/public/bead.')) {
+        currentLink.remove();
+      }
+    }
+  }
+}
+
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.body.addEventListener('click', (event) => {
+        let target = event.target;
+        while (target && !target.dataset.beadEventOnclick) {
+            target = target.parentElement;
+        }
+        if (target && target.dataset.beadEventOnclick) {
+            event.preventDefault();
+            handleEvent(target, target.dataset.beadEventOnclick);
+        }
+
+        let routerLinkTarget = event.target.closest('[data-bead-router-link]');
+        if (routerLinkTarget && routerLinkTarget.href) {
+            event.preventDefault();
+            handleRouterLink(routerLinkTarget.href);
+        }
+    });
+
+    document.body.addEventListener('submit', (event) => {
+        let target = event.target;
+        while (target && target.tagName !== 'FORM') {
+            target = target.parentElement;
+        }
+        if (target && target.dataset.beadEventOnsubmit) {
+            event.preventDefault();
+            handleEvent(target, target.dataset.beadEventOnsubmit);
+        }
+    });
+
+    document.body.addEventListener('input', (event) => {
+        const target = event.target.closest('[data-bead-event-oninput]');
+        if (target) {
+            handleEvent(target, target.dataset.beadEventOninput);
+        }
+    });
+
+    // Sunucunun bu sayfa için tuttuğu görüntü sürümleri (hedef id -> sürüm); fark yalnızca sürüm eşleşirse gönderilir.
+    let viewVersions = {};
+
+    function resolvePath(root, path) {
+        let node = root;
+        for (const index of path) {
+            node = node.childNodes[index];
+        }
+        return node;
+    }
+
+    function htmlToNodes(html) {
+        const template = document.createElement('template');
+        template.innerHTML = html;
+        return template.content;
+    }
+
+    function applyOps(root, ops) {
+        for (const op of ops) {
+            const node = resolvePath(root, op.path);
+            if (op.op === 'text') {
+                node.nodeValue = op.value;
+            } else if (op.op === 'attr') {
+                if (op.value === null) {
+                    node.removeAttribute(op.name);
+                } else {
+                    node.setAttribute(op.name, op.value);
+                }
+            } else if (op.op === 'insert') {
+                node.insertBefore(htmlToNodes(op.html), node.childNodes[op.index] || null);
+            } else if (op.op === 'remove') {
+                node.remove();
+            } else if (op.op === 'replace') {
+                node.replaceWith(htmlToNodes(op.html));
+            } else if (op.op === 'children') {
+                node.replaceChildren(htmlToNodes(op.html));
+            }
+        }
+    }
+
+    function ensureStylesheet(href) {
+        if (!document.head.querySelector(`link[rel="stylesheet"][href="${href}"]`)) {
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = href;
+            document.head.appendChild(link);
+        }
+    }
+
+    function applyUpdate(data) {
+        const root = data.target ? document.getElementById(data.target) : document.body;
+        if (!root) {
+            return;
+        }
+        if (data.stylesheet) {
+            ensureStylesheet(data.stylesheet);
+        }
+        if (data.ops) {
+            applyOps(root, data.ops);
+        } else if (data.target) {
+            morphdom(root, htmlToNodes(data.patch).firstElementChild);
+        } else {
+            const newDoc = new DOMParser().parseFromString(data.patch, 'text/html');
+            morphdom(document.body, newDoc.body);
+        }
+
+        // Gövde güncellemesi parça görüntülerini, parça güncellemesi gövde görüntüsünü geçersiz kılar.
+        if (data.target) {
+            delete viewVersions[''];
+        } else {
+            viewVersions = {};
+        }
+        viewVersions[data.target || ''] = data.version;
+    }
+
+    // Sayfa izin verirse olaylar tek bir WebSocket bağlantısı üzerinden, istek kimlikleriyle gönderilir.
+    const eventSocket = {
+        socket: null,
+        opening: null,
+        pending: new Map(),
+        nextId: 1,
+        failures: 0,
+
+        enabled() {
+            const meta = document.querySelector('meta[name="bead-events"]');
+            return 'WebSocket' in window && meta && meta.content === 'websocket' && this.failures < 3;
+        },
+
+        connect() {
+            if (this.opening) {
+                return this.opening;
+            }
+            this.opening = new Promise((resolve, reject) => {
+                const scheme = window.location.protocol === 'https:' ? 'wss' : 'ws';
+                const socket = new WebSocket(`${scheme}://${window.location.host}/_events/ws`);
+                const timer = setTimeout(() => socket.close(), 3000);
+
+                socket.onopen = () => {
+                    clearTimeout(timer);
+                    this.failures = 0;
+                    this.socket = socket;
+                    resolve(socket);
+                };
+                socket.onmessage = (message) => {
+                    const reply = JSON.parse(message.data);
+                    const entry = this.pending.get(reply.id);
+                    if (entry) {
+                        this.pending.delete(reply.id);
+                        entry.resolve(reply);
+                    }
+                };
+                socket.onclose = () => {
+                    clearTimeout(timer);
+                    this.failures++;
+                    this.socket = null;
+                    this.opening = null;
+                    for (const entry of this.pending.values()) {
+                        const error = new Error('Olay bağlantısı kapandı.');
+                        error.sent = true;
+                        entry.reject(error);
+                    }
+                    this.pending.clear();
+                    reject(new Error('Olay bağlantısı kurulamadı.'));
+                };
+            });
+            return this.opening;
+        },
+
+        send(message) {
+            return this.connect().then(socket => new Promise((resolve, reject) => {
+                const id = this.nextId++;
+                this.pending.set(id, { resolve, reject });
+                socket.send(JSON.stringify({
+                    ...message,
+                    id: id,
+                    view: window.location.pathname,
+                    versions: viewVersions
+                }));
+            }));
+        }
+    };
+
+    // handlerName '_batch' ise requestBody { events, csrf_token } biçimindedir.
+    function postEvent(handlerName, requestBody) {
+        const viaFetch = () => fetch(`/_events/${handlerName}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Bead-View': window.location.pathname,
+                'X-Bead-View-Version': JSON.stringify(viewVersions)
+            },
+            body: JSON.stringify(requestBody)
+        }).then(response => response.json().then(body => ({ status: response.status, body: body })));
+
+        if (!eventSocket.enabled()) {
+            return viaFetch();
+        }
+        // Gönderilmiş bir olay tekrar gönderilmez; yalnızca bağlantı kurulamazsa fetch'e düşülür.
+        const message = handlerName === '_batch' ? requestBody : { handler: handlerName, data: requestBody };
+        return eventSocket.send(message).catch(error => error.sent ? Promise.reject(error) : viaFetch());
+    }
+
+    // Boştayken olay hemen gönderilir; istek sürerken gelenler sıraya alınır ve bir sonraki istekte toplu gönderilir.
+    // data-bead-debounce taşıyan olaylarda (oninput için varsayılan 150 ms) işleyici başına yalnızca son değer gönderilir.
+    const MAX_BATCH_EVENTS = 100;
+    const eventQueue = [];
+    const debounceTimers = new Map();
+    let flushTimer = null;
+    let sending = false;
+
+    function queueEvent(handlerName, requestBody, debounce) {
+        if (debounce > 0) {
+            clearTimeout(debounceTimers.get(handlerName));
+            debounceTimers.set(handlerName, setTimeout(() => {
+                debounceTimers.delete(handlerName);
+                enqueueEvent(handlerName, requestBody, true);
+            }, debounce));
+            return;
+        }
+        enqueueEvent(handlerName, requestBody, false);
+    }
+
+    function enqueueEvent(handlerName, requestBody, coalesce) {
+        const last = eventQueue[eventQueue.length - 1];
+        if (coalesce && last && last.handler === handlerName) {
+            last.data = requestBody;
+        } else {
+            eventQueue.push({ handler: handlerName, data: requestBody });
+        }
+        if (!flushTimer && !sending) {
+            flushTimer = setTimeout(flushEvents);
+        }
+    }
+
+    function csrfToken(events) {
+        const withToken = events.find(event => event.data.csrf_token);
+        if (withToken) {
+            return withToken.data.csrf_token;
+        }
+        const input = document.querySelector('input[name="csrf_token"]');
+        return input ? input.value : undefined;
+    }
+
+    function flushEvents() {
+        flushTimer = null;
+        const events = eventQueue.splice(0, MAX_BATCH_EVENTS);
+        if (!events.length) {
+            return;
+        }
+        sending = true;
+
+        const request = events.length === 1
+            ? postEvent(events[0].handler, events[0].data).then(applyReply)
+            : postEvent('_batch', { events: events, csrf_token: csrfToken(events) }).then(reply => {
+                if (reply.status >= 400) {
+                    return applyReply(reply);
+                }
+                for (const result of reply.body.results) {
+                    if (applyReply(result)) {
+                        return;
+                    }
+                }
+                reply.body.patches.forEach(applyUpdate);
+            });
+
+        request
+        .catch(error => {
+            console.error('Hata:', error);
+        })
+        .finally(() => {
+            sending = false;
+            if (eventQueue.length) {
+                flushEvents();
+            }
+        });
+    }
+
+    // Yönlendirme yapıldıysa true döner; kalan sonuçlar uygulanmaz.
+    function applyReply(reply) {
+        if (reply.status >= 400) {
+            const message = reply.body.error || reply.body.detail;
+            window.alert(message);
+            console.error('Hata:', message);
+            return false;
+        }
+        const data = reply.body || {};
+        if (data.redirect) {
+            window.location.href = data.redirect;
+            return true;
+        }
+        if (data.ops || data.patch) {
+            applyUpdate(data);
+        }
+        return false;
+    }
+
+    function handleEvent(target, handlerName) {
+        let requestBody = {};
+        if (target.tagName === 'FORM') {
+            const formData = new FormData(target);
+            requestBody = Object.fromEntries(formData.entries());
+        } else if (target.name && 'value' in target) {
+            requestBody = { [target.name]: target.value };
+        }
+
+        const fallback = target.dataset.beadEventOninput === handlerName ? 150 : 0;
+        const debounce = target.dataset.beadDebounce !== undefined ? parseInt(target.dataset.beadDebounce, 10) : fallback;
+        queueEvent(handlerName, requestBody, debounce);
+    }
+
+    // Yönlendirici parçaları: sunucu X-Bead-Router isteğine başlık, meta ve gövdeyi JSON olarak döner.
+    // Bağlantılar üzerine gelindiğinde veya görünür olduğunda önceden getirilir; her kayıt bir kez kullanılır.
+    const PREFETCH_TTL = 30000;
+    const PREFETCH_LIMIT = 20;
+    const routerCache = new Map();
+
+    function fetchFragment(href) {
+        return fetch(href, {
+            method: 'GET',
+            headers: {
+                'X-Bead-Router': 'true'
+            }
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Network response was not ok');
+            }
+            const contentType = response.headers.get('Content-Type') || '';
+            return contentType.includes('application/json') ? response.json() : response.text().then(html => ({ document: html }));
+        });
+    }
+
+    function prefetchRoute(href) {
+        const url = new URL(href, window.location.href);
+        if (url.origin !== window.location.origin || url.href === window.location.href) {
+            return;
+        }
+        const entry = routerCache.get(url.href);
+        if (entry && Date.now() - entry.time < PREFETCH_TTL) {
+            return;
+        }
+        const promise = fetchFragment(url.href);
+        promise.catch(() => routerCache.delete(url.href));
+        routerCache.set(url.href, { time: Date.now(), promise: promise });
+        while (routerCache.size > PREFETCH_LIMIT) {
+            routerCache.delete(routerCache.keys().next().value);
+        }
+    }
+
+    function takeFragment(href) {
+        const url = new URL(href, window.location.href).href;
+        const entry = routerCache.get(url);
+        routerCache.delete(url);
+        if (entry && Date.now() - entry.time < PREFETCH_TTL) {
+            return entry.promise;
+        }
+        return fetchFragment(url);
+    }
+
+    const linkObserver = 'IntersectionObserver' in window && !(navigator.connection && navigator.connection.saveData)
+        ? new IntersectionObserver(entries => {
+            for (const entry of entries) {
+                if (entry.isIntersecting) {
+                    linkObserver.unobserve(entry.target);
+                    prefetchRoute(entry.target.href);
+                }
+            }
+        })
+        : null;
+
+    function observeRouterLinks() {
+        if (linkObserver) {
+            linkObserver.disconnect();
+            document.querySelectorAll('a[data-bead-router-link][href]').forEach(link => linkObserver.observe(link));
+        }
+    }
+
+    document.body.addEventListener('mouseover', (event) => {
+        const link = event.target.closest('a[data-bead-router-link][href]');
+        if (link) {
+            prefetchRoute(link.href);
+        }
+    });
+
+    function applyFragment(fragment) {
+        if (fragment.title !== null) {
+            document.title = fragment.title;
+        }
+        // bead-* meta etiketleri head kancalarına aittir ve gezinti sırasında korunur.
+        for (const tag of document.head.querySelectorAll('meta[name]')) {
+            if (!(tag.name in fragment.meta) && !tag.name.startsWith('bead-')) {
+                tag.remove();
+            }
+        }
+        for (const [name, content] of Object.entries(fragment.meta)) {
+            let tag = document.head.querySelector(`meta[name="${CSS.escape(name)}"]`);
+            if (!tag) {
+                tag = document.createElement('meta');
+                tag.name = name;
+                document.head.appendChild(tag);
+            }
+            tag.content = content;
+        }
+        ensureStylesheet(fragment.stylesheet);
+        let style = document.head.querySelector('style[data-bead-router]');
+        if (fragment.style && !style) {
+            style = document.createElement('style');
+            style.dataset.beadRouter = '';
+            document.head.appendChild(style);
+        }
+        if (style) {
+            style.textContent = fragment.style;
+        }
+
+        const newBody = document.createElement('body');
+        newBody.innerHTML = fragment.body;
+        morphdom(document.body, newBody);
+    }
+
+    function handleRouterLink(href, isPopState = false) {
+        takeFragment(href)
+        .then(fragment => {
+            if (fragment.document !== undefined) {
+                const newDoc = new DOMParser().parseFromString(fragment.document, 'text/html');
+                if (!newDoc.body) {
+                    throw new Error('Yeni sayfa gövdesi bulunamadı.');
+                }
+                morphdom(document.body, newDoc.body);
+                updateHead(newDoc);
+            } else {
+                applyFragment(fragment);
+            }
+            viewVersions = {};
+            if (!isPopState) {
+                window.history.pushState({}, '', href);
+            }
+            observeRouterLinks();
+        })
+        .catch(error => {
+            console.error('Rota geçişi sırasında hata:', error);
+            if (!isPopState) {
+               window.location.href = href;
+            }
+        });
+    }
+
+    observeRouterLinks();
+
+    window.addEventListener('popstate', (event) => {
+        handleRouterLink(window.location.href, true);
+    });
+
+});
+"""
+
+def minify_js(source: str) -> str:
+    # Satır sonları korunur; yalnızca girinti, boş satırlar ve tam satır yorumları atılır.
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+RUNTIME_MIN_JS = minify_js(RUNTIME_JS)
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+RUNTIME_HASH = _content_hash(RUNTIME_JS)
+RUNTIME_MIN_HASH = _content_hash(RUNTIME_MIN_JS)
+
+# Dosya adı -> içerik; /public/bead-runtime.<ad>.js altında servis edilir.
+RUNTIME_FILES = {
+    RUNTIME_HASH: RUNTIME_JS,
+    f"{RUNTIME_MIN_HASH}.min": RUNTIME_MIN_JS,
+}
+
+def runtime_url(minified: bool = True) -> str:
+    name = f"{RUNTIME_MIN_HASH}.min" if minified else RUNTIME_HASH
+    return f"/public/bead-runtime.{name}.js"
+
+RUNTIME_SCRIPT_TAG = f'<script src="{runtime_url()}" defer></script>'
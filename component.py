@@ -1,10 +1,85 @@
-from bead.ui.core_components import Component
+from bead.ui.core_components import Component, Fragment, Memo
 from functools import wraps
 from bead.utils.validation import validate_data
+from collections import OrderedDict
+import hashlib
 import inspect
+import itertools
+import time
 
-def component(schema=None):
+_component_ids = itertools.count()
+
+class FragmentCache:
+    def __init__(self, maxsize: int = 256, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        html, classes, styles, expires = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return html, classes, styles
+
+    def set(self, key: str, html: str, classes, styles: dict = None):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (html, list(classes), dict(styles or {}), expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+def _make_fragment_cache(cache) -> FragmentCache:
+    if isinstance(cache, FragmentCache):
+        return cache
+    if cache is True:
+        return FragmentCache()
+    if isinstance(cache, (int, float)) and not isinstance(cache, bool):
+        return FragmentCache(ttl=cache)
+    if isinstance(cache, dict):
+        return FragmentCache(maxsize=cache.get("maxsize", 256), ttl=cache.get("ttl"))
+    raise TypeError(f"Geçersiz cache ayarı: {cache!r}")
+
+def _stable_repr(value) -> str:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(f"{_stable_repr(k)}:{_stable_repr(v)}" for k, v in value.items())) + "}"
+    raise TypeError(f"'{type(value).__name__}' props cannot be used as a cache key.")
+
+def props_key(prefix: str, signature: inspect.Signature, args: tuple, kwargs: dict):
+    try:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        props_repr = _stable_repr(dict(bound.arguments))
+    except TypeError:
+        return None
+    return hashlib.sha256(f"{prefix}|{props_repr}".encode("utf-8")).hexdigest()
+
+def component(schema=None, cache=None):
     def decorator(func):
+        fragment_cache = _make_fragment_cache(cache) if cache else None
+        # Her dekorasyon (sayfa yeniden derlendiğinde de) yeni bir önek alır; eski parçalar LRU ile düşer.
+        key_prefix = f"{func.__qualname__}#{next(_component_ids)}"
+        signature = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if schema:
@@ -12,14 +87,25 @@ def component(schema=None):
                 if errors:
                     error_messages = ", ".join([f"'{field}': {msg}" for field, msg in errors.items()])
                     raise TypeError(f"Bileşen '{func.__name__}' için geçersiz prop'lar: {error_messages}")
-            
+
+            cache_key = props_key(key_prefix, signature, args, kwargs) if fragment_cache is not None else None
+            if cache_key is not None:
+                cached = fragment_cache.get(cache_key)
+                if cached is not None:
+                    html, classes, styles = cached
+                    return Fragment(html, classes, styles)
+
             result = func(*args, **kwargs)
-            
+
+            if cache_key is not None and isinstance(result, Component):
+                return Memo(result, fragment_cache, cache_key)
             return result
-        
+
+        wrapper.fragment_cache = fragment_cache
         return wrapper
-    
+
     if inspect.isfunction(schema):
-        return decorator(schema)
+        func, schema = schema, None
+        return decorator(func)
     else:
-        return decorator
\ No newline at end of file
+        return decorator
@@ -16,12 +16,52 @@ def load_config(project_path: str) -> Config:
     
     default_settings = {
         "server": {
-            "port": 8000
+            "port": 8000,
+            "workers": None,
+            "max_requests": None,
+            "stats": False
         },
         "theme": {},
+        "styles": {
+            "extract_custom_styles": True
+        },
+        "render": {
+            "mode": "sync",
+            "streaming": False
+        },
+        "events": {
+            "websocket": False,
+            "max_views": 1000,
+            "max_concurrent": 8
+        },
+        "http": {
+            "etag": True,
+            "compress": True,
+            "compress_min_bytes": 1024,
+            "gzip_level": 6,
+            "brotli_quality": 5,
+            "compress_cache_bytes": 16 * 1024 * 1024,
+            "cache_policies": {}
+        },
+        "ssr_cache": {
+            "max_entries": 1000,
+            "max_bytes": 64 * 1024 * 1024,
+            "routes": {}
+        },
         "security": {
             "csrf": False,
             "csp": None
+        },
+        "session": {
+            "backend": "cookie",
+            "cookie_name": "session",
+            "max_age": 14 * 24 * 60 * 60,
+            "same_site": "lax",
+            "https_only": False,
+            "max_entries": 10000,
+            "path": ".bead/sessions.sqlite3",
+            "url": "redis://127.0.0.1:6379/0",
+            "key_prefix": "bead:session:"
         }
     }
 
@@ -11,5 +11,17 @@ class CompilerError(BeadException):
             full_message = f"{message} in file '{file_path}'."
         super().__init__(full_message)
 
+class LayoutError(BeadException):
+    def __init__(self, file_path: str, error: Exception):
+        self.file_path = file_path
+        self.error = error
+        super().__init__(str(error))
+
 class RouterError(BeadException):
-    pass
\ No newline at end of file
+    pass
+
+class BuildError(BeadException):
+    pass
+
+class SessionError(BeadException):
+    pass
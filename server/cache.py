@@ -0,0 +1,116 @@
+import asyncio
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL = 60
+DEFAULT_STALE = 0
+
+class CacheEntry:
+    def __init__(self, content: str, ttl: float, stale: float):
+        now = time.monotonic()
+        self.content = content
+        self.size = len(content)
+        self.fresh_until = now + ttl
+        self.stale_until = self.fresh_until + stale
+
+class PageCache:
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._size = 0
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refreshes": 0, "evictions": 0}
+
+    async def get_or_render(self, key, render: Callable[[], Awaitable[str]], ttl: float = DEFAULT_TTL, stale: float = DEFAULT_STALE) -> Tuple[str, str]:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry.content, "hit"
+
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self._stats["stale_hits"] += 1
+            if key not in self._inflight:
+                self._stats["refreshes"] += 1
+                self._start_render(key, render, ttl, stale)
+            return entry.content, "stale"
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(inflight), "miss"
+
+        self._stats["misses"] += 1
+        return await asyncio.shield(self._start_render(key, render, ttl, stale)), "miss"
+
+    def _start_render(self, key, render, ttl, stale) -> asyncio.Future:
+        # Aynı anahtar için eşzamanlı istekler tek bir render'ı bekler.
+        task = asyncio.ensure_future(self._render(key, render, ttl, stale))
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return task
+
+    async def _render(self, key, render, ttl, stale) -> str:
+        try:
+            content = await render()
+            self._store(key, CacheEntry(content, ttl, stale))
+            return content
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key, entry: CacheEntry):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous.size
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._size += entry.size
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self._stats["evictions"] += 1
+
+    def invalidate(self, path: Optional[str] = None):
+        if path is None:
+            self._entries.clear()
+            self._size = 0
+            return
+        for key in [key for key in self._entries if key[0] == path]:
+            self._size -= self._entries.pop(key).size
+
+    def stats(self) -> dict:
+        return {**self._stats, "entries": len(self._entries), "bytes": self._size}
+
+def normalize_rule(rule: Any) -> Optional[Dict[str, Any]]:
+    if rule is None or rule is False:
+        return None
+    if rule is True:
+        return {}
+    if isinstance(rule, (int, float)):
+        return {"ttl": rule}
+    return dict(rule)
+
+def resolve_cache_rule(page_rule: Any, route_rules: Dict[str, Any], path: str) -> Optional[Dict[str, Any]]:
+    if page_rule is not None:
+        return normalize_rule(page_rule)
+    for pattern, rule in route_rules.items():
+        if fnmatch.fnmatchcase(path, pattern):
+            return normalize_rule(rule)
+    return None
+
+def make_cache_key(request, rule: Dict[str, Any]) -> tuple:
+    query = tuple(sorted(request.query_params.multi_items()))
+    headers = tuple(request.headers.get(name, "") for name in rule.get("vary", []))
+    session_keys = rule.get("session", [])
+    session = tuple(repr(request.session.get(name)) for name in session_keys) if session_keys else ()
+    # İstemci yönlendiricisi aynı yol için belge yerine gövde parçası (JSON) alır.
+    router = request.headers.get("x-bead-router") == "true"
+    return (request.url.path, router, query, headers, session)
@@ -3,36 +3,207 @@ from starlette.applications import Starlette
 from starlette.routing import Route, Mount
 from starlette.responses import HTMLResponse
 from starlette.middleware import Middleware
-from starlette.middleware.sessions import SessionMiddleware
 import os
 import sys
 import threading
 import time
 import asyncio
+import contextlib
+from functools import partial
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, EVENT_TYPE_MODIFIED
 
-from .router import get_routes
-from .middleware import LoggingMiddleware, SecurityHeadersMiddleware
+from .router import get_routes, events_meta_hook, handle_request_and_render, socket_sessions
+from .route_index import PageRoutes
+from .middleware import LoggingMiddleware, SecurityHeadersMiddleware, ResponseOptimizationMiddleware
 from bead.compiler.parser import clear_cache
+from bead.compiler.build import load_build
+from bead.compiler import registry
+from bead.compiler.deps import DependencyGraph, file_kind, page_urls
+from bead.compiler.registry import install_component_importer
+from bead.compiler.renderer import add_head_hook, remove_head_hook
 from bead.config import load_config
+from bead.styles.compiler import StylesheetCache, get_style_map
+from bead.server.cache import PageCache
+from bead.server.handlers import HandlerRegistry
+from bead.server.sessions import session_middleware
+from bead.server.views import ViewStore
 from bead.state.state import State  # Yeni import satırı
 
 async def not_found(request, exc):
     return HTMLResponse("<h1>404 Sayfa Bulunamadı</h1>", status_code=404)
 
-def get_app(project_path):
+class _ChangeForwarder(FileSystemEventHandler):
+    # watchdog olayları kendi iş parçacığında gelir; değişiklikler uygulamanın olay döngüsünde uygulanır.
+    def __init__(self, loop, callback):
+        self.loop = loop
+        self.callback = callback
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ("created", "modified", "deleted", "moved"):
+            return
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path and os.path.splitext(path)[1] in ProjectReloader.WATCHED_SUFFIXES:
+                self.loop.call_soon_threadsafe(self.callback, os.path.abspath(path))
+
+class ProjectReloader:
+    # Süreci yeniden başlatmadan tek bir rotayı ekler/kaldırır ve yalnızca etkilenen sayfa, layout veya bileşen önbelleklerini temizler.
+    WATCHED_SUFFIXES = (".bead", ".py", ".json")
+    # Editörler tek kayıtta birden çok olay üretir; aynı dosyanın olayları bu süre içinde birleştirilir.
+    SETTLE_DELAY = 0.05
+
+    def __init__(self, app):
+        self.app = app
+        self.project_path = app.state.project_path
+        self.pages_path = os.path.join(self.project_path, "pages")
+        self.config_path = os.path.join(self.project_path, "bead.config.json")
+        self.observer = None
+        self.loop = None
+        self.graph = None
+        self._pending = {}
+
+    def start(self, loop):
+        self.loop = loop
+        self.graph = DependencyGraph.build(self.project_path)
+        self.graph.save()
+        self.observer = Observer()
+        self.observer.schedule(_ChangeForwarder(loop, self.schedule), self.project_path, recursive=True)
+        self.observer.daemon = True
+        self.observer.start()
+
+    def stop(self):
+        for pending in self._pending.values():
+            pending.cancel()
+        self._pending.clear()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join(timeout=2)
+            self.observer = None
+
+    def schedule(self, path: str):
+        pending = self._pending.pop(path, None)
+        if pending is not None:
+            pending.cancel()
+        self._pending[path] = self.loop.call_later(self.SETTLE_DELAY, self._settled, path)
+
+    def _settled(self, path: str):
+        self._pending.pop(path, None)
+        self.apply(path)
+
+    def apply(self, path: str):
+        relative_path = os.path.relpath(path, self.project_path)
+        parts = relative_path.split(os.sep)
+        if parts[-1].startswith(".") or any(part.startswith(".") or part in ("__pycache__", "build", "out") for part in parts[:-1]):
+            return
+
+        started = time.perf_counter()
+        if path == self.config_path:
+            self._reload_config()
+        elif path.endswith((".bead", ".py")):
+            # Değişen dosya ve grafikteki geçişli bağımlıları (onu kullanan layout, bileşen, sayfa ve handler'lar) geçersiz kılınır.
+            affected = self.graph.update(path)
+            for dependent in sorted(affected | {self.graph.relative(path)}):
+                self._invalidate(dependent)
+            if file_kind(self.graph.relative(path)) == "page":
+                self._update_routes(path)
+            self.graph.save()
+        else:
+            return
+        print(f"INFO:  Güncellendi: {relative_path} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+
+    def _invalidate(self, relative_path: str):
+        file_path = os.path.join(self.project_path, *relative_path.split("/"))
+        kind = file_kind(relative_path)
+        if kind in ("page", "layout"):
+            registry.invalidate(file_path)
+        if kind == "page":
+            for url_path in page_urls(self.pages_path, file_path):
+                # Parametreli rotaların önbellek anahtarları somut yollardır; bu durumda tüm önbellek temizlenir.
+                self.app.state.page_cache.invalidate(None if "{" in url_path else url_path)
+        elif kind == "component":
+            sys.modules.pop("components." + relative_path[len("components/"):-len(".bead")].replace("/", "."), None)
+        elif kind == "api":
+            self.app.state.handlers.invalidate(os.path.basename(relative_path)[:-len(".py")])
+        elif kind == "module":
+            for name in [name for name, module in sys.modules.items() if getattr(module, "__file__", None) == file_path]:
+                del sys.modules[name]
+
+    def _update_routes(self, path: str):
+        page_index = self.app.state.page_index
+        urls = page_urls(self.pages_path, path)
+        if os.path.exists(path):
+            for url_path in urls:
+                if page_index.add(url_path, partial(handle_request_and_render, path)):
+                    print(f"INFO:  Rota oluşturuldu: {url_path} -> {path}")
+            try:
+                registry.load_page(path)
+            except Exception as e:
+                print(f"UYARI: '{path}' derlenemedi: {e}")
+        else:
+            for url_path in urls:
+                if page_index.remove(url_path):
+                    print(f"INFO:  Rota kaldırıldı: {url_path}")
+
+    def _reload_config(self):
+        _apply_config(self.app, load_config(self.project_path))
+        self.app.state.page_cache.invalidate()
+
+def _apply_config(app, config):
+    app.state.config = config
+    # Üretilen stil dosyaları worker'lar arasında paylaşılan bir dizine yazılır: derleme çıktısında build/public, geliştirmede .bead/styles.
+    manifest = getattr(app.state, "manifest", None)
+    if manifest is not None:
+        styles_dir = os.path.join(manifest["build_dir"], "public")
+    else:
+        styles_dir = os.path.join(app.state.project_path, ".bead", "styles")
+    app.state.stylesheets = StylesheetCache(get_style_map(config.settings), directory=styles_dir)
+    if config.get("events", {}).get("websocket") and socket_sessions(config):
+        add_head_hook(events_meta_hook)
+    else:
+        if config.get("events", {}).get("websocket"):
+            print("UYARI: events.websocket çerez oturumuyla kullanılamaz (WebSocket çerez yazamaz); olaylar fetch ile gönderilecek. "
+                  "Sunucu tarafı bir session.backend (memory, sqlite, redis) seçin.")
+        remove_head_hook(events_meta_hook)
+
+@contextlib.asynccontextmanager
+async def _watch_project(app):
+    reloader = ProjectReloader(app)
+    reloader.start(asyncio.get_running_loop())
+    app.state.reloader = reloader
+    try:
+        yield
+    finally:
+        reloader.stop()
+
+def get_app(project_path, build_dir=None, debug=True, watch=False):
+    project_path = os.path.abspath(project_path)
     config = load_config(project_path)
-    routes = get_routes(project_path)
+    install_component_importer(project_path)
+    manifest = load_build(build_dir, project_path) if build_dir else None
+    routes = get_routes(project_path, manifest=manifest)
     SECRET_KEY = config.get("security", {}).get("secret_key", os.environ.get("SECRET_KEY", "a-secret-key-that-should-be-changed"))
     middleware = [
-        Middleware(SessionMiddleware, secret_key=SECRET_KEY),
+        session_middleware(config.get("session", {}), SECRET_KEY, project_path),
         Middleware(LoggingMiddleware),
-        Middleware(SecurityHeadersMiddleware)
+        Middleware(SecurityHeadersMiddleware),
+        Middleware(ResponseOptimizationMiddleware, max_compressed_bytes=config.get("http", {}).get("compress_cache_bytes", 16 * 1024 * 1024))
     ]
-    app = Starlette(debug=True, routes=routes, exception_handlers={404: not_found}, middleware=middleware)
+    lifespan = _watch_project if watch and manifest is None else None
+    app = Starlette(debug=debug, routes=routes, exception_handlers={404: not_found}, middleware=middleware, lifespan=lifespan)
     app.state.project_path = project_path
-    app.state.config = config
+    app.state.manifest = manifest
+    app.state.page_index = next((route.index for route in routes if isinstance(route, PageRoutes)), None)
+    _apply_config(app, config)
+    if manifest is not None:
+        stylesheet = manifest["stylesheet"]
+        app.state.stylesheets.pin(stylesheet["content"], stylesheet["classes"] + stylesheet.get("custom_styles", []), stylesheet.get("custom_css", ""))
+    app.state.views = ViewStore(max_entries=config.get("events", {}).get("max_views", 1000))
+    app.state.handlers = HandlerRegistry(os.path.join(project_path, "pages", "api"), frozen=manifest is not None)
+    ssr_cache_settings = config.get("ssr_cache", {})
+    app.state.page_cache = PageCache(
+        max_entries=ssr_cache_settings.get("max_entries", 1000),
+        max_bytes=ssr_cache_settings.get("max_bytes", 64 * 1024 * 1024),
+    )
     
     # Global state'i uygulama durumuna ekliyoruz
     app.state.global_state = State({"user_count": 0, "app_name": "Bead App"})
@@ -41,7 +212,7 @@ def get_app(project_path):
 
 def create_app():
     project_path = os.getcwd()
-    return get_app(project_path)
+    return get_app(project_path, watch=True)
 
 def start_dev_server(project_path):
     full_path = os.path.abspath(project_path)
@@ -60,13 +231,11 @@ def start_dev_server(project_path):
     print("Dosya değişiklikleri izleniyor...")
     print("CTRL+C tuşuna basarak çıkabilirsiniz.")
 
+    # Dosya değişiklikleri süreç içinde uygulanır (ProjectReloader); uvicorn'un süreç yeniden başlatması kullanılmaz.
     uvicorn.run(
-        "bead.server.dev_server:create_app",
+        get_app(full_path, watch=True),
         host="0.0.0.0",
         port=port,
-        factory=True,
-        reload=True,
-        reload_dirs=[full_path],
         log_level="info"
     )
 
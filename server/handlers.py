@@ -0,0 +1,111 @@
+import importlib.util
+import os
+import re
+import time
+from collections import deque
+
+_HANDLER_NAME = re.compile(r"^[A-Za-z_][\w-]*$")
+
+class HandlerModule:
+    def __init__(self, name: str, file_path: str, module, mtime_ns: int, size: int):
+        self.name = name
+        self.file_path = file_path
+        self.module = module
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+class HandlerStats:
+    def __init__(self, samples: int = 512):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent = deque(maxlen=samples)
+
+    def record(self, elapsed: float, error: bool):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self._recent.append(elapsed)
+        if error:
+            self.errors += 1
+
+    def to_dict(self) -> dict:
+        recent = sorted(self._recent)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p95_ms": round(p95 * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+class HandlerRegistry:
+    # pages/api/<ad>.py modülleri bir kez yüklenir; dosya değişmedikçe üst seviye kodları yeniden çalışmaz.
+    def __init__(self, api_dir: str, frozen: bool = False):
+        self.api_dir = api_dir
+        self.frozen = frozen
+        self._modules = {}
+        self._stats = {}
+        self.loads = 0
+        self.reloads = 0
+
+    def get(self, name: str):
+        if not _HANDLER_NAME.match(name):
+            return None
+
+        entry = self._modules.get(name)
+        if self.frozen and entry is not None:
+            return entry.module
+
+        file_path = os.path.join(self.api_dir, f"{name}.py")
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._modules.pop(name, None)
+            return None
+
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry.module
+
+        spec = importlib.util.spec_from_file_location(f"bead_api_{name.replace('-', '_')}", file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        self.loads += 1
+        if entry is not None:
+            self.reloads += 1
+            print(f"INFO:  Handler yeniden yüklendi: {name}")
+        self._modules[name] = HandlerModule(name, file_path, module, stat.st_mtime_ns, stat.st_size)
+        return module
+
+    def record(self, name: str, elapsed: float, error: bool = False):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = HandlerStats()
+        stats.record(elapsed, error)
+
+    def stats(self) -> dict:
+        return {
+            "loaded": len(self._modules),
+            "loads": self.loads,
+            "reloads": self.reloads,
+            "handlers": {name: stats.to_dict() for name, stats in sorted(self._stats.items())},
+        }
+
+    def invalidate(self, name: str):
+        self._modules.pop(name, None)
+
+    def clear(self):
+        self._modules.clear()
+
+async def timed(registry: HandlerRegistry, name: str, call):
+    started = time.perf_counter()
+    error = True
+    try:
+        response = await call()
+        error = getattr(response, "status_code", 200) >= 500
+        return response
+    finally:
+        registry.record(name, time.perf_counter() - started, error)
@@ -1,12 +1,19 @@
+from collections import OrderedDict
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware import Middleware
 from starlette.responses import Response
 from starlette.middleware.sessions import SessionMiddleware
+from bead.server.responses import accepted_encodings, compress, content_etag, etag_matches, is_compressible, resolve_cache_policy
 
 class LoggingMiddleware:
     def __init__(self, app):
         self.app = app
 
     async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
         print("INFO:  Middleware: Gelen istek:", scope['path'])
         
         await self.app(scope, receive, send)
@@ -33,4 +40,114 @@ class SecurityHeadersMiddleware:
 
             await send(message)
 
-        await self.app(scope, receive, send_with_headers)
\ No newline at end of file
+        await self.app(scope, receive, send_with_headers)
+
+class ResponseOptimizationMiddleware:
+    # Tek parça yanıtlara ETag/304, Accept-Encoding'e göre sıkıştırma ve bead.config.json'daki yol başına Cache-Control uygulanır.
+    # Akış (streaming) yanıtları tamponlanmaz; yalnızca önbellek politikası eklenir.
+    def __init__(self, app, max_compressed_entries: int = 256, max_compressed_bytes: int = 16 * 1024 * 1024):
+        self.app = app
+        self.max_compressed_entries = max_compressed_entries
+        self.max_compressed_bytes = max_compressed_bytes
+        self._compressed = OrderedDict()
+        self._compressed_size = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        settings = scope["app"].state.config.get("http", {})
+        start = None
+        chunks = []
+        streaming = False
+
+        async def send_optimized(message):
+            nonlocal start, streaming
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or streaming:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                if len(chunks) == 1:
+                    streaming = True
+                    headers = MutableHeaders(scope=start)
+                    self._apply_policy(scope, headers, settings)
+                    await send(start)
+                    await send(message)
+                return
+            await self._send_complete(scope, start, b"".join(chunks), send, settings)
+
+        await self.app(scope, receive, send_optimized)
+
+    def _apply_policy(self, scope, headers: MutableHeaders, settings: dict):
+        if "cache-control" not in headers:
+            policy = resolve_cache_policy(settings.get("cache_policies", {}), scope["path"])
+            if policy:
+                headers["Cache-Control"] = policy
+
+    async def _send_complete(self, scope, start, body: bytes, send, settings: dict):
+        headers = MutableHeaders(scope=start)
+        request_headers = Headers(scope=scope)
+        self._apply_policy(scope, headers, settings)
+
+        etag = headers.get("etag")
+        if start["status"] == 200 and scope["method"] == "GET" and settings.get("etag", True):
+            if etag is None:
+                etag = headers["ETag"] = content_etag(body)
+            if etag_matches(request_headers.get("if-none-match"), etag):
+                for name in ("content-length", "content-type", "content-encoding"):
+                    if name in headers:
+                        del headers[name]
+                await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        content_type = headers.get("content-type")
+        if (
+            settings.get("compress", True)
+            and is_compressible(content_type)
+            and "content-encoding" not in headers
+            and len(body) >= settings.get("compress_min_bytes", 1024)
+        ):
+            # Ön sıkıştırılmış statik dosyalar Vary başlığını zaten ekler; aynı değer iki kez yazılmaz.
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            encodings = accepted_encodings(request_headers.get("accept-encoding", ""))
+            if encodings:
+                body = self._compress(body, encodings[0], etag, headers, settings)
+                headers["Content-Encoding"] = encodings[0]
+                headers["Content-Length"] = str(len(body))
+                if etag is not None and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    def _compress(self, body: bytes, encoding: str, etag, headers: MutableHeaders, settings: dict) -> bytes:
+        # Değişmez varlıklar bir kez en yüksek seviyede sıkıştırılır; ETag'li gövdeler (ör. SSR önbelleği) yeniden sıkıştırılmaz.
+        key = (etag, encoding) if etag is not None else None
+        if key is not None and key in self._compressed:
+            self._compressed.move_to_end(key)
+            return self._compressed[key]
+
+        if "immutable" in headers.get("cache-control", ""):
+            quality = None
+        elif encoding == "br":
+            quality = settings.get("brotli_quality", 5)
+        else:
+            quality = settings.get("gzip_level", 6)
+        compressed = compress(body, encoding, quality)
+
+        # Önbellek hem girdi sayısı hem toplam bayt ile sınırlıdır; sınırdan büyük gövdeler saklanmaz.
+        if key is not None and len(compressed) <= self.max_compressed_bytes:
+            self._compressed[key] = compressed
+            self._compressed_size += len(compressed)
+            while len(self._compressed) > self.max_compressed_entries or self._compressed_size > self.max_compressed_bytes:
+                _, evicted = self._compressed.popitem(last=False)
+                self._compressed_size -= len(evicted)
+        return compressed
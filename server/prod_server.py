@@ -0,0 +1,135 @@
+import importlib.util
+import os
+import random
+import signal
+import socket
+import sys
+import time
+import uvicorn
+
+from bead.config import load_config
+from .dev_server import get_app
+
+def _server_implementations():
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return loop, http
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Soket proto=0 ile açıldığından asyncio kabul edilen bağlantılarda TCP_NODELAY'i kendisi açmaz
+    # (yalnızca proto == IPPROTO_TCP olan soketlere uygular); bağlantılar bu ayarı dinleyen soketten devralır.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+def _run_worker(app, sock, max_requests, graceful_timeout):
+    loop, http = _server_implementations()
+    # Her worker'ın istek sınırı biraz kaydırılır; böylece hepsi aynı anda yeniden başlamaz.
+    limit = max_requests + random.randint(0, max(1, max_requests // 10)) if max_requests else None
+    config = uvicorn.Config(
+        app,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        limit_max_requests=limit,
+        timeout_graceful_shutdown=graceful_timeout,
+        log_level="info",
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+def _supervise(app, sock, workers, max_requests, graceful_timeout):
+    children = {}
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                _run_worker(app, sock, max_requests, graceful_timeout)
+            finally:
+                os._exit(0)
+        children[pid] = time.monotonic()
+        print(f"INFO:  Worker başlatıldı (pid {pid}).")
+
+    def stop(signum, frame):
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        print("INFO:  Kapatılıyor; worker'ların açık istekleri bitirmesi bekleniyor...")
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for _ in range(workers):
+        spawn()
+
+    deadline = None
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+
+        if pid == 0:
+            if stopping:
+                deadline = deadline or time.monotonic() + graceful_timeout + 5
+                if time.monotonic() > deadline:
+                    for child in list(children):
+                        try:
+                            os.kill(child, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+            time.sleep(0.2)
+            continue
+
+        started = children.pop(pid, None)
+        if not stopping:
+            print(f"INFO:  Worker {pid} çıktı (kod {os.waitstatus_to_exitcode(status)}); yenisi başlatılıyor.")
+            # Başlarken çöken worker'lar için sürekli fork döngüsüne girilmez.
+            if started is not None and time.monotonic() - started < 1:
+                time.sleep(1)
+            spawn()
+
+    sock.close()
+
+def start_production_server(project_path, build_dir=None, host="0.0.0.0", port=None, workers=None, max_requests=None, graceful_timeout=30):
+    full_path = os.path.abspath(project_path)
+    if full_path not in sys.path:
+        sys.path.insert(0, full_path)
+
+    config_obj = load_config(full_path)
+    server_settings = config_obj.get("server", {})
+    port = port or server_settings.get("port", 8000)
+    workers = workers or server_settings.get("workers") or os.cpu_count() or 1
+    max_requests = max_requests if max_requests is not None else server_settings.get("max_requests")
+    build_dir = build_dir or os.path.join(full_path, "build")
+
+    print("Bead Üretim Sunucusu başlatılıyor...")
+    if workers > 1 and config_obj.get("session", {}).get("backend") == "memory":
+        print("UYARI: 'memory' oturum deposu worker başınadır; birden çok worker ile 'sqlite' veya 'redis' kullanın.")
+
+    # Rotalar ve derlenmiş sayfalar fork'tan önce yüklenir; worker'lar belleği paylaşarak sıcak başlar.
+    app = get_app(full_path, build_dir=build_dir, debug=False)
+    sock = _bind_socket(host, port)
+
+    loop, http = _server_implementations()
+    print(f"Uygulama: http://{host}:{port} ({workers} worker, loop={loop}, http={http})")
+
+    if not hasattr(os, "fork") or (workers == 1 and not max_requests):
+        _run_worker(app, sock, max_requests, graceful_timeout)
+        return
+
+    _supervise(app, sock, workers, max_requests, graceful_timeout)
@@ -0,0 +1,110 @@
+import fnmatch
+import gzip
+import hashlib
+import os
+import pathlib
+import re
+from mimetypes import guess_type
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+PRECOMPRESS_MIN_BYTES = 1024
+
+# 'bead build' hash'li kopyaları ad.<16 hex>.uzantı biçiminde yazar; içerik değişirse ad da değişir.
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{16}\.[^./]+$")
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+def accepted_encodings(accept_encoding: str) -> list:
+    # Tercih sırası: br, gzip. q=0 ile reddedilen kodlamalar atlanır.
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    encodings = []
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        encodings.append("br")
+    if "gzip" in accepted or "*" in accepted:
+        encodings.append("gzip")
+    return encodings
+
+def compress(data: bytes, encoding: str, quality: Optional[int] = None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if quality is None else quality)
+    return gzip.compress(data, compresslevel=9 if quality is None else quality, mtime=0)
+
+def content_etag(data: bytes) -> str:
+    # Zayıf ETag: aynı gövdenin sıkıştırılmış ve sıkıştırılmamış hâlleri için aynıdır.
+    return f'W/"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return opaque in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+def resolve_cache_policy(policies: Dict[str, str], path: str) -> Optional[str]:
+    for pattern, policy in policies.items():
+        if fnmatch.fnmatchcase(path, pattern):
+            return policy
+    return None
+
+def precompress_directory(directory: pathlib.Path) -> int:
+    # Metin tabanlı varlıkların .gz (ve brotli kuruluysa .br) kopyaları yazılır; küçülmeyen kopyalar atlanır.
+    written = 0
+    for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+        if path.suffix in (".gz", ".br") or not is_compressible(guess_type(path.name)[0]):
+            continue
+        data = path.read_bytes()
+        if len(data) < PRECOMPRESS_MIN_BYTES:
+            continue
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            if encoding == "br" and brotli is None:
+                continue
+            compressed = compress(data, encoding)
+            if len(compressed) < len(data):
+                path.with_name(path.name + suffix).write_bytes(compressed)
+                written += 1
+    return written
+
+class PrecompressedStaticFiles(StaticFiles):
+    # İstemci kabul ediyorsa derleme sırasında yazılmış .br/.gz kopyası gönderilir; ETag kopyanın kendisine aittir.
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        media_type = guess_type(str(full_path))[0] or "text/plain"
+        headers = {}
+        if is_compressible(media_type):
+            headers["Vary"] = "Accept-Encoding"
+            for encoding in accepted_encodings(request_headers.get("accept-encoding", "")):
+                variant_path = f"{full_path}{ENCODING_SUFFIXES[encoding]}"
+                try:
+                    variant_stat = os.stat(variant_path)
+                except OSError:
+                    continue
+                full_path, stat_result = variant_path, variant_stat
+                headers["Content-Encoding"] = encoding
+                break
+        if _HASHED_NAME.search(scope["path"]):
+            headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, media_type=media_type, headers=headers)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,173 @@
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.routing import BaseRoute, Match, NoMatchFound, Route, request_response
+
+PAGE_METHODS = ("GET", "HEAD")
+_PARAM = re.compile(r"^\{(\w+)(:path)?\}$")
+
+class PageRoute:
+    __slots__ = ("path", "endpoint", "app", "params")
+
+    def __init__(self, path: str, endpoint: Callable, params: List[str]):
+        self.path = path
+        self.endpoint = endpoint
+        self.app = request_response(endpoint)
+        self.params = params
+
+class RouteNode:
+    __slots__ = ("static", "param", "catch_all", "route")
+
+    def __init__(self):
+        self.static = {}
+        self.param = None
+        self.catch_all = None
+        self.route = None
+
+def _segments(path: str) -> List[str]:
+    return path[1:].split("/") if path.startswith("/") else path.split("/")
+
+class RouteIndex:
+    # pages/ düzeninden kurulan segment ağacı; eşleşme maliyeti rota sayısına değil yol derinliğine bağlıdır.
+    # Öncelik her segmentte sabittir: statik, sonra [param], sonra [...catch_all]; eşleşmeyen dal geri alınır.
+    def __init__(self):
+        self.root = RouteNode()
+        self.routes = {}
+        # Ortada catch-all bulunan desenler (ör. /[...a]/edit) ağaca sığmaz; ağaçta eşleşme yoksa sırayla denenir.
+        self._fallback = []
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    def add(self, path: str, endpoint: Callable) -> bool:
+        # Aynı desen ikinci kez eklenmez; düz rota listesindeki gibi ilk kayıt geçerlidir.
+        if path in self.routes:
+            return False
+
+        segments = _segments(path)
+        params = []
+        node = self.root
+        for i, segment in enumerate(segments):
+            match = _PARAM.match(segment)
+            if match is None:
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+            params.append(match.group(1))
+            if match.group(2):
+                if i != len(segments) - 1:
+                    route = PageRoute(path, endpoint, params)
+                    self.routes[path] = route
+                    self._fallback.append((Route(path, endpoint=endpoint), route))
+                    return True
+                if node.catch_all is None:
+                    node.catch_all = RouteNode()
+                node = node.catch_all
+            else:
+                if node.param is None:
+                    node.param = RouteNode()
+                node = node.param
+
+        if node.route is not None:
+            # Yalnızca parametre adları farklı olan aynı biçimli desenler: ilk kayıt kalır.
+            return False
+        node.route = PageRoute(path, endpoint, params)
+        self.routes[path] = node.route
+        return True
+
+    def remove(self, path: str) -> bool:
+        route = self.routes.pop(path, None)
+        if route is None:
+            return False
+        self._fallback = [entry for entry in self._fallback if entry[1] is not route]
+
+        node = self.root
+        for segment in _segments(path):
+            match = _PARAM.match(segment)
+            if match is None:
+                node = node.static.get(segment)
+            elif match.group(2):
+                node = node.catch_all
+            else:
+                node = node.param
+            if node is None:
+                return True
+        if node.route is route:
+            node.route = None
+        return True
+
+    def match(self, path: str) -> Optional[Tuple[PageRoute, Dict[str, str]]]:
+        segments = _segments(path)
+        values = []
+        route = self._match(self.root, segments, 0, values)
+        if route is not None:
+            return route, dict(zip(route.params, values))
+
+        for starlette_route, route in self._fallback:
+            found = starlette_route.path_regex.match(path)
+            if found:
+                return route, found.groupdict()
+        return None
+
+    def _match(self, node: RouteNode, segments: List[str], i: int, values: List[str]) -> Optional[PageRoute]:
+        if i == len(segments):
+            return node.route
+
+        segment = segments[i]
+        child = node.static.get(segment)
+        if child is not None:
+            route = self._match(child, segments, i + 1, values)
+            if route is not None:
+                return route
+
+        if node.param is not None and segment:
+            values.append(segment)
+            route = self._match(node.param, segments, i + 1, values)
+            if route is not None:
+                return route
+            values.pop()
+
+        if node.catch_all is not None and node.catch_all.route is not None:
+            values.append("/".join(segments[i:]))
+            return node.catch_all.route
+        return None
+
+def _route_path(scope) -> str:
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):]
+    return path
+
+class PageRoutes(BaseRoute):
+    # Tüm sayfalar için tek bir Starlette rotası; Router binlerce regex yerine tek bir ağaç araması yapar.
+    def __init__(self, index: RouteIndex):
+        self.index = index
+
+    def matches(self, scope):
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        found = self.index.match(_route_path(scope))
+        if found is None:
+            return Match.NONE, {}
+
+        route, params = found
+        child_scope = {
+            "endpoint": route.endpoint,
+            "path_params": {**scope.get("path_params", {}), **params},
+            "bead.page_route": route,
+        }
+        if scope["method"] not in PAGE_METHODS:
+            return Match.PARTIAL, child_scope
+        return Match.FULL, child_scope
+
+    async def handle(self, scope, receive, send):
+        if scope["method"] not in PAGE_METHODS:
+            raise HTTPException(status_code=405, headers={"Allow": ", ".join(PAGE_METHODS)})
+        await scope["bead.page_route"].app(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)
+
+    def __repr__(self) -> str:
+        return f"PageRoutes(routes={len(self.index)})"
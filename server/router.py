@@ -1,147 +1,248 @@
 import os
-import importlib.util
-from starlette.routing import Route, Mount
-from starlette.responses import HTMLResponse, JSONResponse, RedirectResponse
-from starlette.staticfiles import StaticFiles
+from starlette.requests import Request
+from starlette.routing import Route, Mount, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+from starlette.responses import HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from functools import partial
+from urllib.parse import urlsplit
 from itsdangerous import TimedSerializer
 from itsdangerous import BadSignature
 import os
+import json
 import pathlib
 import inspect
 import asyncio
 from starlette.exceptions import HTTPException
 from bead.compiler.parser import parse_bead_file, find_return_value
-from bead.compiler.renderer import render_page
-from bead.styles.compiler import generate_css, extract_classes, get_style_map
-from bead.exceptions import CompilerError
+from bead.compiler.renderer import render_page, render_fragment, render_component, stream_page, escape_html
+from bead.ui.core_components import Component, Page
+from bead.server.views import parse_html, find_body, diff_children, diff_nodes
+from bead.compiler.runtime import RUNTIME_FILES
+from bead.compiler.registry import load_route, get_stats as get_page_cache_stats
+from bead.compiler.deps import discover_pages
+from bead.exceptions import CompilerError, LayoutError
+from bead.server.handlers import timed
+from bead.server.cache import resolve_cache_rule, make_cache_key, DEFAULT_TTL, DEFAULT_STALE
+from bead.server.responses import IMMUTABLE_CACHE_CONTROL, PrecompressedStaticFiles
+from bead.server.route_index import RouteIndex, PageRoutes
+
+CSRF_PLACEHOLDER = "__bead_csrf_token__"
+MAX_BATCH_EVENTS = 100
+
+def _request_context(request):
+    return {
+        "request": request,
+        "query": request.query_params,
+        "headers": request.headers,
+        "session": request.session
+    }
 
-_all_utility_classes = set()
+async def _load_session(request):
+    # Sunucu tarafı depolarda oturum, çerçevenin ona dokunacağı kesin olan yerlerde olay döngüsü dışında okunur.
+    # Çerez oturumunda (Starlette) veri zaten çerezdedir.
+    load = getattr(request.session, "load", None)
+    if load is not None:
+        await load()
 
-async def handle_request_and_render(file_path, request):
+async def build_component_tree(compiled_route, params, context):
+    try:
+        component_tree = await compiled_route.render(params, context)
+    except LayoutError as e:
+        raise HTTPException(status_code=500, detail=f"Layout error: {e.message}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Runtime error in page function: {e}")
+
+    if not component_tree:
+        raise HTTPException(status_code=500, detail="Component tree could not be created.")
+
+    return component_tree
 
-    global _all_utility_classes
-    _all_utility_classes.clear()
+async def handle_request_and_render(file_path, request):
 
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Page not found.")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            source_code = f.read()
-    except Exception as e:
+        compiled_route = load_route(file_path, os.path.join(request.app.state.project_path, "pages"))
+    except OSError as e:
         raise HTTPException(status_code=500, detail=f"File read error: {e}")
-
-    page_namespace = {
-        '__file__': file_path,
-        '__name__': os.path.splitext(os.path.basename(file_path))[0],
-        'Page': __import__('bead.ui.core_components').ui.core_components.Page,
-        'Text': __import__('bead.ui.core_components').ui.core_components.Text,
-        'Button': __import__('bead.ui.core_components').ui.core_components.Button,
-        'Card': __import__('bead.ui.core_components').ui.core_components.Card,
-        'Stack': __import__('bead.ui.core_components').ui.core_components.Stack,
-        'Link': __import__('bead.ui.core_components').ui.core_components.Link,
-        'Image': __import__('bead.ui.core_components').ui.core_components.Image,
-        'Form': __import__('bead.ui.core_components').ui.core_components.Form,
-        'Input': __import__('bead.ui.core_components').ui.core_components.Input,
-        'asyncio': __import__('asyncio'),
-        'random': __import__('random')
-    }
-
-    try:
-        exec(source_code, page_namespace)
-        default_func = page_namespace.get('default')
-
-        if not default_func:
-            raise HTTPException(status_code=500, detail="'default' function not found.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Compilation error: {e}")
 
-    context = {
-        "request": request,
-        "query": request.query_params,
-        "headers": request.headers,
-        "session": request.session
-    }
-    params = request.path_params
-    
-    try:
-        if inspect.iscoroutinefunction(default_func):
-            component_tree = await default_func(params, context)
-        else:
-            component_tree = default_func(params, context)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Runtime error in page function: {e}")
+    if compiled_route.render is None:
+        raise HTTPException(status_code=500, detail="Compilation error: 'default' function not found.")
 
-    layout_path = os.path.join(os.path.dirname(file_path), "_layout.bead")
-    if os.path.exists(layout_path):
-        try:
-            with open(layout_path, "r", encoding="utf-8") as f:
-                layout_source_code = f.read()
+    # data-bead-router-link gezintileri (ve önceden getirmeler) belge yerine gövde parçası alır.
+    router_request = request.headers.get("x-bead-router") == "true"
+    render = render_fragment if router_request else render_page
 
-            layout_namespace = page_namespace.copy()
-            exec(layout_source_code, layout_namespace)
-            layout_func = layout_namespace.get('default')
-
-            if inspect.iscoroutinefunction(layout_func):
-                layout_tree = await layout_func(params, context, children=component_tree)
-            else:
-                layout_tree = layout_func(params, context, children=component_tree)
-
-            component_tree = layout_tree
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Layout error: {e}")
-
-    if not component_tree:
-        raise HTTPException(status_code=500, detail="Component tree could not be created.")
-    
     csrf_token = None
     config = request.app.state.config
     security_settings = config.get("security", {})
+    # Token oturum başına bir kez üretilir; her render'da yenisini yazmak oturumu (ve çerezi) her yanıtta değiştirir,
+    # önceden getirilen parçalar da açık sayfadaki formların token'ını geçersiz kılardı.
     if security_settings.get("csrf"):
+        await _load_session(request)
+        csrf_token = request.session.get("_csrf_token")
+    if security_settings.get("csrf") and csrf_token is None:
         secret_key = config.get("security", {}).get("secret_key", os.environ.get("SECRET_KEY", "a-secret-key-that-should-be-changed"))
         s = TimedSerializer(secret_key)
         csrf_token = s.dumps({'_csrf_token': os.urandom(32).hex()})
         request.session['_csrf_token'] = csrf_token
-    
-    html_content = await render_page(component_tree, _all_utility_classes, csrf_token=csrf_token)
-    
-    dynamic_style_map = get_style_map(config.settings)
-    
-    css_content = generate_css(_all_utility_classes, dynamic_style_map)
-    
-    public_dir = os.path.join(request.app.state.project_path, "public")
-    os.makedirs(public_dir, exist_ok=True)
-    with open(os.path.join(public_dir, "bead.css"), "w", encoding="utf-8") as f:
-        f.write(css_content)
-        
-    return HTMLResponse(html_content)
 
-async def _handle_action(request, module):
+    stylesheets = request.app.state.stylesheets
+    css_href = lambda classes: stylesheets.href(stylesheets.add(classes))
+    render_settings = config.get("render", {})
+    concurrent = render_settings.get("mode") == "concurrent"
+
+    cache_rule = resolve_cache_rule(
+        compiled_route.namespace.get("ssr_cache"),
+        config.get("ssr_cache", {}).get("routes", {}),
+        request.url.path,
+    )
+    if cache_rule is not None:
+        # Önbellekteki HTML kullanıcılar arasında paylaşıldığı için CSRF token'ı sonradan yerleştirilir.
+        async def render_cached():
+            component_tree = await build_component_tree(compiled_route, request.path_params, _request_context(request))
+            content = await render(
+                component_tree,
+                set(),
+                csrf_token=CSRF_PLACEHOLDER if csrf_token is not None else None,
+                css_href=css_href,
+                concurrent=concurrent,
+            )
+            return json.dumps(content) if router_request else content
+
+        html_content, cache_status = await request.app.state.page_cache.get_or_render(
+            make_cache_key(request, cache_rule),
+            render_cached,
+            ttl=cache_rule.get("ttl", DEFAULT_TTL),
+            stale=cache_rule.get("stale", DEFAULT_STALE),
+        )
+        if csrf_token is not None:
+            html_content = html_content.replace(CSRF_PLACEHOLDER, escape_html(csrf_token))
+
+        headers = {"X-Bead-Cache": cache_status, "Vary": ", ".join(["X-Bead-Router", *cache_rule.get("vary", [])])}
+        if router_request:
+            return Response(html_content, media_type="application/json", headers=headers)
+        return HTMLResponse(html_content, headers=headers)
+
+    component_tree = await build_component_tree(compiled_route, request.path_params, _request_context(request))
+    utility_classes = set()
+
+    if not router_request and compiled_route.namespace.get("streaming", render_settings.get("streaming", False)):
+        return StreamingResponse(
+            stream_page(component_tree, utility_classes, csrf_token=csrf_token, css_href=css_href),
+            media_type="text/html",
+            headers={"Vary": "X-Bead-Router"},
+        )
+
+    content = await render(
+        component_tree,
+        utility_classes,
+        csrf_token=csrf_token,
+        css_href=css_href,
+        concurrent=concurrent,
+    )
+
+    if router_request:
+        return JSONResponse(content, headers={"Vary": "X-Bead-Router"})
+    return HTMLResponse(content, headers={"Vary": "X-Bead-Router"})
+
+async def handle_stylesheet(request):
+    css_content = await request.app.state.stylesheets.load(request.path_params["css_hash"])
+    if css_content is None:
+        raise HTTPException(status_code=404, detail="Stylesheet not found.")
+    return Response(css_content, media_type="text/css", headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL})
+
+async def handle_runtime(request):
+    content = RUNTIME_FILES.get(request.path_params["name"])
+    if content is None:
+        raise HTTPException(status_code=404, detail="Runtime not found.")
+    return Response(content, media_type="application/javascript", headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL})
+
+async def _verify_csrf(request):
+    config = request.app.state.config
+    await _load_session(request)
+    csrf_token = request.session.get('_csrf_token')
+    if not csrf_token:
+        raise HTTPException(status_code=403, detail="CSRF token not found in session.")
+
+    try:
+        data = await request.json()
+        form_token = data.get("csrf_token")
+        secret_key = config.get("security", {}).get("secret_key", os.environ.get("SECRET_KEY", "a-secret-key-that-should-be-changed"))
+        s = TimedSerializer(secret_key)
+        s.loads(form_token)
+        if form_token != csrf_token:
+            raise HTTPException(status_code=403, detail="CSRF token mismatch.")
+    except (BadSignature, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=403, detail="Invalid CSRF token.")
+
+def _client_versions(request) -> dict:
+    try:
+        versions = json.loads(request.headers.get("x-bead-view-version", "{}"))
+    except ValueError:
+        return {}
+    return versions if isinstance(versions, dict) else {}
+
+async def _render_patch(request, component_tree):
+    # Oturumun bu sayfadaki son görüntüsüyle fark alınır; istemci aynı sürümdeyse yalnızca işlemler gönderilir.
+    config = request.app.state.config
+    csrf_token = request.session.get("_csrf_token") if config.get("security", {}).get("csrf") else None
+    stylesheets = request.app.state.stylesheets
+    utility_classes = set()
+
+    if isinstance(component_tree, Page):
+        target = None
+        html_content = await render_page(component_tree, utility_classes, csrf_token=csrf_token, css_href=lambda classes: stylesheets.href(stylesheets.add(classes)))
+        nodes = find_body(parse_html(html_content))
+        if nodes is None:
+            nodes = []
+    else:
+        target = component_tree.props.get("id")
+        html_content = await render_component(component_tree, utility_classes, csrf_token=csrf_token)
+        nodes = parse_html(html_content)
+
+    views = request.app.state.views
+    view_key = (request.session.setdefault("_bead_view", os.urandom(8).hex()), request.headers.get("x-bead-view", ""))
+    previous = views.get(view_key, target)
+    version = views.put(view_key, target, nodes)
+    payload = {"target": target, "version": version, "stylesheet": stylesheets.href(stylesheets.add(utility_classes))}
+
+    client_version = _client_versions(request).get(target or "")
+    if previous is not None and client_version == previous.version:
+        ops = []
+        if target is None:
+            diff_children(previous.nodes, nodes, [], ops)
+        elif len(previous.nodes) == 1 and len(nodes) == 1:
+            diff_nodes(previous.nodes[0], nodes[0], [], ops)
+        else:
+            ops = None
+        if ops is not None and len(json.dumps(ops)) < len(html_content):
+            views.record("diffs")
+            payload["ops"] = ops
+            return payload
+
+    views.record("full")
+    payload["patch"] = html_content
+    return payload
+
+async def _handle_action(request, module, render: bool = True):
+    # Handler'lar ve yama render'ı oturumu kullanır.
+    await _load_session(request)
     if request.method == "POST":
-        config = request.app.state.config
-        security_settings = config.get("security", {})
-        if security_settings.get("csrf"):
-            csrf_token = request.session.get('_csrf_token')
-            if not csrf_token:
-                raise HTTPException(status_code=403, detail="CSRF token not found in session.")
-            
-            try:
-                data = await request.json()
-                form_token = data.get("csrf_token")
-                secret_key = config.get("security", {}).get("secret_key", os.environ.get("SECRET_KEY", "a-secret-key-that-should-be-changed"))
-                s = TimedSerializer(secret_key)
-                s.loads(form_token)
-                if form_token != csrf_token:
-                    raise HTTPException(status_code=403, detail="CSRF token mismatch.")
-            except (BadSignature, ValueError, KeyError):
-                raise HTTPException(status_code=403, detail="Invalid CSRF token.")
+        security_settings = request.app.state.config.get("security", {})
+        # WebSocket köprüsü ve toplu istek kaynağı bir kez doğrular; her olayda tekrar edilmez.
+        if security_settings.get("csrf") and not request.scope.get("bead.csrf_verified"):
+            await _verify_csrf(request)
 
     if hasattr(module, '_render_after_event'):
         new_component_tree = await module._render_after_event(request)
         if new_component_tree:
-            html_content = render_page(new_component_tree)
-            return JSONResponse({"patch": html_content})
+            if not render:
+                return new_component_tree
+            return JSONResponse(await _render_patch(request, new_component_tree))
 
     if not hasattr(module, 'handler'):
         raise HTTPException(status_code=500, detail="Handler function not found in module.")
@@ -164,81 +265,226 @@ async def _handle_action(request, module):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Runtime error in API handler: {e}")
 
-async def handle_api_request(request):
+async def handle_action_request(request):
+    # /_events/{handler} ve /api/{handler} aynı yoldan geçer.
     handler_name = request.path_params.get("handler")
-    api_dir = os.path.join(request.app.state.project_path, "pages", "api")
-    handler_path = os.path.join(api_dir, f"{handler_name}.py")
-
-    if not os.path.exists(handler_path):
+    handlers = request.app.state.handlers
+    module = handlers.get(handler_name)
+    if module is None:
         raise HTTPException(status_code=404, detail="Handler not found.")
 
-    spec = importlib.util.spec_from_file_location(handler_name, handler_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    return await _handle_action(request, module)
-
-async def handle_api_endpoint(request):
-    handler_name = request.path_params.get("handler")
-    api_dir = os.path.join(request.app.state.project_path, "pages", "api")
-    handler_path = os.path.join(api_dir, f"{handler_name}.py")
-
-    if not os.path.exists(handler_path):
-        raise HTTPException(status_code=404, detail="Handler not found.")
+    return await timed(handlers, handler_name, lambda: _handle_action(request, module))
+
+def events_meta_hook(document):
+    document.add_head('<meta name="bead-events" content="websocket">')
+
+def socket_sessions(config) -> bool:
+    # Olay köprüsü yalnızca sunucu tarafı oturum deposuyla açılır: WebSocket yanıtı Set-Cookie taşıyamaz,
+    # çerez oturumunda (varsayılan) handler'ların oturuma yazdıkları kaybolurdu. Bu durumda olaylar fetch ile gider.
+    return config.get("session", {}).get("backend", "cookie") != "cookie"
+
+def _same_origin(websocket) -> bool:
+    origin = websocket.headers.get("origin")
+    return origin is not None and urlsplit(origin).netloc == websocket.headers.get("host")
+
+def _event_request(scope, handler_name: str, data, extra_headers=()) -> Request:
+    # Tek bir olayı, kaynak bağlantının oturumu ve başlıklarıyla sıradan bir POST isteği gibi çalıştırır.
+    body = json.dumps(data or {}).encode("utf-8")
+    extra_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1")), *extra_headers]
+    replaced = {key for key, _ in extra_headers}
+    headers = [(key, value) for key, value in scope["headers"] if key not in replaced] + extra_headers
+    path = f"/_events/{handler_name}"
+    event_scope = {
+        **scope,
+        "type": "http",
+        "method": "POST",
+        "scheme": "https" if scope.get("scheme") in ("https", "wss") else "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "headers": headers,
+        "path_params": {"handler": handler_name},
+        "bead.csrf_verified": True,
+    }
 
-    spec = importlib.util.spec_from_file_location(handler_name, handler_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(event_scope, receive)
+
+def _socket_request(websocket, handler_name: str, message: dict) -> Request:
+    return _event_request(websocket.scope, handler_name, message.get("data"), [
+        (b"x-bead-view", str(message.get("view", "")).encode("utf-8")),
+        (b"x-bead-view-version", json.dumps(message.get("versions") or {}).encode("utf-8")),
+    ])
+
+def _response_payload(response):
+    if isinstance(response, RedirectResponse):
+        return response.status_code, {"redirect": response.headers["location"]}
+    if isinstance(response, Response):
+        body = getattr(response, "body", b"")
+        if response.media_type == "application/json":
+            return response.status_code, json.loads(body) if body else None
+        return response.status_code, {"content": body.decode(response.charset)}
+    return 200, response
+
+async def _run_event_batch(request, events) -> dict:
+    if not isinstance(events, list) or not events:
+        raise HTTPException(status_code=400, detail="Batch must contain a list of events.")
+    if len(events) > MAX_BATCH_EVENTS:
+        raise HTTPException(status_code=413, detail="Too many events in batch.")
+    if request.app.state.config.get("security", {}).get("csrf") and not request.scope.get("bead.csrf_verified"):
+        await _verify_csrf(request)
+
+    handlers = request.app.state.handlers
+    results = []
+    trees = {}
+    for event in events:
+        try:
+            if not isinstance(event, dict):
+                raise HTTPException(status_code=400, detail="Invalid event message.")
+            handler_name = str(event.get("handler", ""))
+            module = handlers.get(handler_name)
+            if module is None:
+                raise HTTPException(status_code=404, detail="Handler not found.")
+            event_request = _event_request(request.scope, handler_name, event.get("data"))
+            outcome = await timed(handlers, handler_name, lambda: _handle_action(event_request, module, render=False))
+            if isinstance(outcome, Component):
+                # Aynı hedefin ara render'ları gönderilmez; sayfa render'ı önceki tüm parçaları kapsar.
+                target = None if isinstance(outcome, Page) else outcome.props.get("id")
+                if target is None:
+                    trees.clear()
+                trees.pop(target, None)
+                trees[target] = outcome
+                status, body = 200, None
+            else:
+                status, body = _response_payload(outcome)
+        except HTTPException as e:
+            status, body = e.status_code, {"detail": e.detail}
+        except Exception as e:
+            status, body = 500, {"detail": f"Runtime error in API handler: {e}"}
+        results.append({"status": status, "body": body})
+        if isinstance(body, dict) and "redirect" in body:
+            break
 
-    return await _handle_action(request, module)
+    patches = [await _render_patch(request, tree) for tree in trees.values()]
+    return {"results": results, "patches": patches}
 
-def get_routes(project_path):
+async def handle_event_batch(request):
+    # Olaylar sırayla çalışır; yanıt her olayın sonucunu ve hedef başına tek bir yamayı içerir.
+    try:
+        message = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body.")
+    if not isinstance(message, dict):
+        raise HTTPException(status_code=400, detail="Invalid batch message.")
+    return JSONResponse(await _run_event_batch(request, message.get("events")))
+
+async def _dispatch_socket_event(websocket, message):
+    request_id = message.get("id")
+    handler_name = str(message.get("handler", ""))
+    handlers = websocket.app.state.handlers
+    try:
+        if "events" in message:
+            status, body = 200, await _run_event_batch(_socket_request(websocket, "_batch", message), message["events"])
+        else:
+            module = handlers.get(handler_name)
+            if module is None:
+                raise HTTPException(status_code=404, detail="Handler not found.")
+            request = _socket_request(websocket, handler_name, message)
+            response = await timed(handlers, handler_name, lambda: _handle_action(request, module))
+            status, body = _response_payload(response)
+    except HTTPException as e:
+        status, body = e.status_code, {"detail": e.detail}
+    except Exception as e:
+        status, body = 500, {"detail": f"Runtime error in API handler: {e}"}
+    await websocket.scope["bead.save_session"]()
+    await websocket.send_json({"id": request_id, "status": status, "body": body})
+
+async def handle_event_socket(websocket):
+    # Tek bağlantı üzerinde çok sayıda olay; yanıtlar istek kimliğiyle eşleştirilir, sıra beklenmez.
+    config = websocket.app.state.config
+    if not config.get("events", {}).get("websocket") or not socket_sessions(config):
+        await websocket.close(code=1008)
+        return
+    if config.get("security", {}).get("csrf") and not _same_origin(websocket):
+        await websocket.close(code=1008)
+        return
+    # Oturum kimliği yoksa köprüde oluşturulan oturum çereze yazılamaz; istemci fetch'e düşer, ilk yanıt çerezi verir.
+    await websocket.session.load()
+    if websocket.session.session_id is None:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    tasks = set()
+    # Bağlantı başına eşzamanlı handler sayısı sınırlıdır; sınıra ulaşınca yeni mesajlar okunmaz (geri basınç).
+    slots = asyncio.Semaphore(config.get("events", {}).get("max_concurrent", 8))
+    try:
+        while True:
+            await slots.acquire()
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                slots.release()
+                await websocket.send_json({"id": None, "status": 400, "body": {"detail": "Invalid JSON message."}})
+                continue
+            if not isinstance(message, dict):
+                slots.release()
+                await websocket.send_json({"id": None, "status": 400, "body": {"detail": "Invalid event message."}})
+                continue
+            task = asyncio.ensure_future(_dispatch_socket_event(websocket, message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _: slots.release())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in list(tasks):
+            task.cancel()
+
+async def handle_stats(request):
+    if not request.app.state.config.get("server", {}).get("stats"):
+        raise HTTPException(status_code=404, detail="Not found.")
+    return JSONResponse({
+        "pages": get_page_cache_stats(),
+        "ssr_cache": request.app.state.page_cache.stats(),
+        "handlers": request.app.state.handlers.stats(),
+        "views": request.app.state.views.stats(),
+    })
+
+def get_routes(project_path, manifest=None):
     pages_path = pathlib.Path(project_path) / "pages"
     public_path = pathlib.Path(project_path) / "public"
     routes = []
-    
-    if not pages_path.exists():
+
+    if manifest is not None:
+        public_path = pathlib.Path(manifest["build_dir"]) / "public"
+        discovered = [(route["path"], os.path.join(project_path, route["file"])) for route in manifest["routes"]]
+    elif not pages_path.exists():
         print(f"Hata: 'pages' dizini '{project_path}' içinde bulunamadı.")
         return []
+    else:
+        discovered = discover_pages(pages_path)
 
+    routes.append(Route("/public/bead.{css_hash}.css", endpoint=handle_stylesheet))
+    routes.append(Route("/public/bead-runtime.{name}.js", endpoint=handle_runtime))
     if public_path.exists():
-        routes.append(Mount("/public", StaticFiles(directory=public_path, html=True), name="static"))
-    
-    layout_routes = []
-    page_routes = []
-    
-    for file_path in pages_path.rglob('*.bead'):
-        if file_path.name.startswith('_layout'):
-            continue
-        relative_path_parts = file_path.relative_to(pages_path).parts
-        
-        page_name = relative_path_parts[-1].removesuffix('.bead')
-        path_parts = list(relative_path_parts[:-1]) + [page_name]
-        
-        url_parts = []
-        for p in path_parts:
-            if p.startswith("[...") and p.endswith("]"):
-                param_name = p[4:-1]
-                url_parts.append(f"{{{param_name}:path}}")
-            elif p.startswith("[") and p.endswith("]"):
-                param_name = p[1:-1]
-                url_parts.append(f"{{{param_name}}}")
-            else:
-                url_parts.append(p)
-
-        url_path = "/" + "/".join(url_parts)
-        
-        print(f"INFO:  Rota oluşturuldu: {url_path} -> {file_path}")
-        
-        page_routes.append(Route(url_path, endpoint=partial(handle_request_and_render, str(file_path))))
-
-    index_file = pages_path / "index.bead"
-    if index_file.exists():
-        page_routes.append(Route("/", endpoint=partial(handle_request_and_render, str(index_file))))
-
-    routes.extend(page_routes)
-    routes.extend(layout_routes)    
-    routes.append(Route("/_events/{handler}", endpoint=handle_api_request, methods=["POST"]))
-    routes.append(Route("/api/{handler}", endpoint=handle_api_endpoint, methods=["POST"]))
+        routes.append(Mount("/public", PrecompressedStaticFiles(directory=public_path, html=True), name="static"))
+
+    # Çatı rotaları sayfalardan önce gelir; kökteki bir [...slug] sayfası bunları yakalamasın.
+    routes.append(Route("/_bead/stats", endpoint=handle_stats))
+    routes.append(WebSocketRoute("/_events/ws", endpoint=handle_event_socket))
+    routes.append(Route("/_events/_batch", endpoint=handle_event_batch, methods=["POST"]))
+    routes.append(Route("/_events/{handler}", endpoint=handle_action_request, methods=["POST"]))
+    routes.append(Route("/api/{handler}", endpoint=handle_action_request, methods=["POST"]))
+
+    # Sayfalar tek bir segment ağacında toplanır; eşleşme süresi sayfa sayısıyla büyümez.
+    page_index = RouteIndex()
+    for url_path, file_path in discovered:
+        if url_path != "/":
+            print(f"INFO:  Rota oluşturuldu: {url_path} -> {file_path}")
+        page_index.add(url_path, partial(handle_request_and_render, file_path))
+
+    routes.append(PageRoutes(page_index))
 
     return routes
\ No newline at end of file
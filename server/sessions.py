@@ -0,0 +1,368 @@
+import json
+import os
+import secrets
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+from itsdangerous import BadSignature, Signer
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import HTTPConnection
+
+from bead.exceptions import SessionError
+
+DEFAULT_MAX_AGE = 14 * 24 * 60 * 60
+
+class LazySession(MutableMapping):
+    # Depo ilk erişimde okunur; oturuma hiç dokunmayan istekler depoya gitmez.
+    # Engelleyen depolarda çerçeve oturuma dokunacağı yerlerde (CSRF, olay handler'ları) önce load() ile veriyi
+    # thread havuzunda okur; load() çağrılmadan yapılan ilk erişim depoyu o anda, olay döngüsünde okur.
+    def __init__(self, backend, session_id: Optional[str]):
+        self.backend = backend
+        self.session_id = session_id
+        self.accessed = False
+        self.modified = False
+        self._data = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._decode(self.backend.load(self.session_id) if self.session_id else None)
+        return self._data
+
+    async def load(self) -> dict:
+        if self._data is None and self.session_id and self.backend.blocking:
+            payload = await run_in_threadpool(self.backend.load, self.session_id)
+            # Beklerken eşzamanlı bir erişim veriyi yüklemiş olabilir; onun değişiklikleri ezilmez.
+            if self._data is None:
+                self._decode(payload)
+        return self.data
+
+    def _decode(self, payload: Optional[str]):
+        self.accessed = True
+        if payload is None:
+            # Bilinmeyen veya süresi dolmuş kimlik: yeni oturum başlar, eski kimlik yeniden kullanılmaz.
+            self.session_id = None
+            self._data = {}
+        else:
+            self._data = json.loads(payload)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def setdefault(self, key, default=None):
+        if key not in self.data:
+            self.modified = True
+        return self.data.setdefault(key, default)
+
+    def clear(self):
+        self.data.clear()
+        self.modified = True
+
+    def __repr__(self):
+        return f"<LazySession {self.session_id!r} loaded={self.loaded}>"
+
+class MemorySessionBackend:
+    # Süreç içi LRU. Çok worker'lı sunucuda her worker'ın kendi deposu olur; paylaşılan oturum için sqlite veya redis kullanılmalıdır.
+    blocking = False
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            payload, expires = entry
+            if expires < time.time():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return payload
+
+    def save(self, session_id: str, payload: str, max_age: int):
+        with self._lock:
+            self._entries[session_id] = (payload, time.time() + max_age)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+class SQLiteSessionBackend:
+    # Yerel dosyada kalıcı depo; aynı makinedeki worker'lar oturumları paylaşır. WAL kipinde okuma/yazma mikrosaniyeler sürer.
+    CLEANUP_EVERY = 1000
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = None
+        self._pid = None
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork sonrası bağlantı paylaşılmaz; her süreç kendi bağlantısını açar.
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def load(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute("SELECT data FROM sessions WHERE id = ? AND expires >= ?", (session_id, time.time())).fetchone()
+        return row[0] if row else None
+
+    def save(self, session_id: str, payload: str, max_age: int):
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("INSERT OR REPLACE INTO sessions (id, data, expires) VALUES (?, ?, ?)", (session_id, payload, now + max_age))
+            self._writes += 1
+            if self._writes % self.CLEANUP_EVERY == 0:
+                connection.execute("DELETE FROM sessions WHERE expires < ?", (now,))
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._connect().execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+class RedisSessionBackend:
+    # Redis protokolünü (RESP) konuşan her sunucuyla çalışır: GET, SET EX, DEL. İstemci kütüphanesi gerektirmez.
+    blocking = True
+
+    def __init__(self, url: str = "redis://127.0.0.1:6379/0", key_prefix: str = "bead:session:", timeout: float = 2.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("redis", "tcp"):
+            raise SessionError(f"Unsupported Redis URL scheme: '{parts.scheme}'.")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 6379
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.strip("/") or 0)
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._socket is not None and self._pid == os.getpid():
+            return
+        self._close()
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        self._pid = os.getpid()
+        if self.password is not None:
+            self._send(*(["AUTH", self.username, self.password] if self.username else ["AUTH", self.password]))
+        if self.db:
+            self._send("SELECT", str(self.db))
+
+    def _close(self):
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._reader = None
+
+    def _send(self, *args):
+        command = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            command.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._socket.sendall(b"".join(command))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Redis connection closed.")
+        kind, value = line[:1], line[1:-2]
+        if kind == b"+":
+            return value.decode("utf-8")
+        if kind == b"-":
+            raise SessionError(f"Redis error: {value.decode('utf-8', 'replace')}")
+        if kind == b":":
+            return int(value)
+        if kind == b"$":
+            length = int(value)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(value)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise SessionError(f"Unexpected Redis reply: {line!r}")
+
+    def _command(self, *args):
+        with self._lock:
+            # Sunucu bağlantıyı kapatmışsa (ör. yeniden başlatma) bir kez yeniden bağlanılır.
+            for attempt in (0, 1):
+                try:
+                    self._connect()
+                    return self._send(*args)
+                except OSError:
+                    self._close()
+                    if attempt:
+                        raise
+                except SessionError:
+                    self._close()
+                    raise
+
+    def load(self, session_id: str) -> Optional[str]:
+        payload = self._command("GET", self.key_prefix + session_id)
+        return payload.decode("utf-8") if payload is not None else None
+
+    def save(self, session_id: str, payload: str, max_age: int):
+        self._command("SET", self.key_prefix + session_id, payload, "EX", str(max_age))
+
+    def delete(self, session_id: str):
+        self._command("DEL", self.key_prefix + session_id)
+
+class ServerSessionMiddleware:
+    # Çerezde yalnızca imzalı, opak bir oturum kimliği taşınır; veri sunucu tarafındaki depodadır.
+    # Engelleyen depo çağrıları (sqlite, redis) thread havuzunda çalışır; yavaş bir depo olay döngüsünü dondurmaz.
+    def __init__(self, app, secret_key: str, backend, session_cookie: str = "session", max_age: int = DEFAULT_MAX_AGE,
+                 path: str = "/", same_site: str = "lax", https_only: bool = False):
+        self.app = app
+        self.backend = backend
+        self.signer = Signer(secret_key, salt="bead.session")
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = "httponly; samesite=" + same_site
+        if https_only:
+            self.security_flags += "; secure"
+
+    async def _call(self, func, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(func, *args)
+        return func(*args)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        session_id = None
+        cookie = HTTPConnection(scope).cookies.get(self.session_cookie)
+        if cookie:
+            try:
+                session_id = self.signer.unsign(cookie).decode("utf-8")
+            except BadSignature:
+                session_id = None
+        had_session = session_id is not None
+
+        session = scope["session"] = LazySession(self.backend, session_id)
+        if scope["type"] == "websocket":
+            # WebSocket yanıtında çerez gönderilemez; olay köprüsü mevcut bir oturumdaki değişiklikleri her olaydan sonra kaydeder.
+            scope["bead.save_session"] = lambda: self._save_open(session)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and session.accessed:
+                headers = MutableHeaders(scope=message)
+                headers.add_vary_header("Cookie")
+                cookie_value = await self._commit(session, had_session)
+                if cookie_value is not None:
+                    headers.append("Set-Cookie", cookie_value)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if scope["type"] == "websocket":
+            await self._save_open(session)
+
+    async def _save_open(self, session: LazySession):
+        if not session.modified or session.session_id is None:
+            return
+        # Kayıt sürerken gelen değişiklikler oturumu yeniden işaretler ve sonraki kayıtta yazılır.
+        session.modified = False
+        if session.data:
+            await self._call(self.backend.save, session.session_id, json.dumps(session.data), self.max_age)
+        else:
+            await self._call(self.backend.delete, session.session_id)
+
+    async def _commit(self, session: LazySession, had_session: bool) -> Optional[str]:
+        if not session.modified:
+            return None
+        if session.data:
+            if session.session_id is None:
+                session.session_id = secrets.token_urlsafe(32)
+            await self._call(self.backend.save, session.session_id, json.dumps(session.data), self.max_age)
+            signed = self.signer.sign(session.session_id).decode("utf-8")
+            return f"{self.session_cookie}={signed}; path={self.path}; Max-Age={self.max_age}; {self.security_flags}"
+        if session.session_id is not None:
+            await self._call(self.backend.delete, session.session_id)
+        if had_session:
+            return f"{self.session_cookie}=null; path={self.path}; expires=Thu, 01 Jan 1970 00:00:00 GMT; {self.security_flags}"
+        return None
+
+def create_session_backend(settings: dict, project_path: str):
+    backend = settings.get("backend", "cookie")
+    if backend == "memory":
+        return MemorySessionBackend(max_entries=settings.get("max_entries", 10000))
+    if backend == "sqlite":
+        return SQLiteSessionBackend(os.path.join(project_path, settings.get("path", ".bead/sessions.sqlite3")))
+    if backend == "redis":
+        return RedisSessionBackend(settings.get("url", "redis://127.0.0.1:6379/0"), key_prefix=settings.get("key_prefix", "bead:session:"))
+    raise SessionError(f"Unknown session backend: '{backend}'.")
+
+def session_middleware(settings: dict, secret_key: str, project_path: str) -> Middleware:
+    options = {
+        "session_cookie": settings.get("cookie_name", "session"),
+        "max_age": settings.get("max_age", DEFAULT_MAX_AGE),
+        "same_site": settings.get("same_site", "lax"),
+        "https_only": settings.get("https_only", False),
+    }
+    if settings.get("backend", "cookie") == "cookie":
+        return Middleware(SessionMiddleware, secret_key=secret_key, **options)
+    return Middleware(ServerSessionMiddleware, secret_key=secret_key, backend=create_session_backend(settings, project_path), **options)
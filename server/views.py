@@ -0,0 +1,172 @@
+import html
+import re
+import secrets
+from collections import OrderedDict
+from typing import List, Optional
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+TEXT = "#text"
+
+# Renderer çıktısı iyi biçimlidir (öznitelikler çift tırnaklı, metin kaçışlı); genel bir HTML ayrıştırıcısına gerek yoktur.
+_TOKEN = re.compile(r'<(/?)([a-zA-Z][\w:-]*)((?:\s+[^\s=/>]+(?:="[^"]*")?)*)\s*(/?)>|<!--.*?-->|<![^>]*>|([^<]+)', re.S)
+_ATTRIBUTE = re.compile(r'([^\s=/>]+)(?:="([^"]*)")?')
+
+def _unescape(value: str) -> str:
+    return html.unescape(value) if "&" in value else value
+
+def parse_html(html_content: str) -> list:
+    # Düğümler: metin için (TEXT, değer), eleman için (etiket, öznitelikler, çocuklar).
+    root = []
+    stack = [("#root", (), root)]
+    for match in _TOKEN.finditer(html_content):
+        closing, tag, attrs, self_closing, text = match.groups()
+        if text is not None:
+            children = stack[-1][2]
+            text = _unescape(text)
+            if children and children[-1][0] == TEXT:
+                children[-1] = (TEXT, children[-1][1] + text)
+            else:
+                children.append((TEXT, text))
+        elif tag is None:
+            continue
+        elif closing:
+            tag = tag.lower()
+            for i in range(len(stack) - 1, 0, -1):
+                if stack[i][0] == tag:
+                    del stack[i:]
+                    break
+        else:
+            tag = tag.lower()
+            node = (tag, tuple((name, _unescape(value)) for name, value in _ATTRIBUTE.findall(attrs)), [])
+            stack[-1][2].append(node)
+            if not self_closing and tag not in VOID_TAGS:
+                stack.append(node)
+    return root
+
+def find_body(nodes: list) -> Optional[list]:
+    for node in nodes:
+        if node[0] == TEXT:
+            continue
+        if node[0] == "body":
+            return node[2]
+        found = find_body(node[2])
+        if found is not None:
+            return found
+    return None
+
+def serialize(node) -> str:
+    if node[0] == TEXT:
+        return html.escape(node[1], quote=False)
+    tag, attrs, children = node
+    attrs_html = "".join(f' {name}="{html.escape(value, quote=True)}"' for name, value in attrs)
+    if tag in VOID_TAGS:
+        return f"<{tag}{attrs_html} />"
+    return f"<{tag}{attrs_html}>{''.join(serialize(child) for child in children)}</{tag}>"
+
+def _key(node):
+    if node[0] == TEXT:
+        return None
+    for name, value in node[1]:
+        if name in ("id", "data-key"):
+            return value
+    return None
+
+def diff_nodes(old, new, path: list, ops: list):
+    if old == new:
+        return
+    if old[0] != new[0]:
+        ops.append({"op": "replace", "path": path, "html": serialize(new)})
+        return
+    if old[0] == TEXT:
+        ops.append({"op": "text", "path": path, "value": new[1]})
+        return
+
+    old_attrs = dict(old[1])
+    new_attrs = dict(new[1])
+    for name, value in new_attrs.items():
+        if old_attrs.get(name) != value:
+            ops.append({"op": "attr", "path": path, "name": name, "value": value})
+    for name in old_attrs:
+        if name not in new_attrs:
+            ops.append({"op": "attr", "path": path, "name": name, "value": None})
+
+    diff_children(old[2], new[2], path, ops)
+
+def diff_children(old: list, new: list, path: list, ops: list):
+    # Anahtarlı (id / data-key) çocuklar anahtarla, diğerleri sırayla eşleşir.
+    # Yollar, önceki işlemler uygulanmış canlı DOM'daki indeksleri gösterir.
+    if old == new:
+        return
+    old_keys = {_key(node) for node in old} - {None}
+    new_keys = {_key(node) for node in new} - {None}
+
+    start = len(ops)
+    i = j = live = 0
+    while i < len(old) or j < len(new):
+        old_node = old[i] if i < len(old) else None
+        new_node = new[j] if j < len(new) else None
+
+        if old_node is not None and new_node is not None and _key(old_node) == _key(new_node):
+            diff_nodes(old_node, new_node, path + [live], ops)
+            i += 1
+            j += 1
+            live += 1
+        elif old_node is not None and (new_node is None or (_key(old_node) is not None and _key(old_node) not in new_keys)):
+            ops.append({"op": "remove", "path": path + [live]})
+            i += 1
+        elif new_node is not None and (old_node is None or (_key(new_node) is not None and _key(new_node) not in old_keys)):
+            ops.append({"op": "insert", "path": path, "index": live, "html": serialize(new_node)})
+            j += 1
+            live += 1
+        else:
+            # Yer değiştiren anahtarlar için çocuk listesi bütün olarak yenilenir.
+            del ops[start:]
+            ops.append({"op": "children", "path": path, "html": "".join(serialize(node) for node in new)})
+            return
+
+class ViewSnapshot:
+    def __init__(self, version: str, nodes: list):
+        self.version = version
+        self.nodes = nodes
+
+class ViewStore:
+    # Oturum + sayfa başına son gönderilen DOM görüntüsü; LRU ile sınırlıdır.
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._views = OrderedDict()
+        self._stats = {"diffs": 0, "full": 0, "evictions": 0}
+
+    def get(self, view_key, target: Optional[str]) -> Optional[ViewSnapshot]:
+        view = self._views.get(view_key)
+        if view is None:
+            return None
+        self._views.move_to_end(view_key)
+        return view["targets"].get(target)
+
+    def put(self, view_key, target: Optional[str], nodes: List) -> str:
+        view = self._views.get(view_key)
+        if view is None:
+            view = self._views[view_key] = {"targets": {}}
+        self._views.move_to_end(view_key)
+
+        # Gövdenin tamamı değiştiyse parça görüntüleri, bir parça değiştiyse gövde görüntüsü geçersizdir.
+        if target is None:
+            view["targets"].clear()
+        else:
+            view["targets"].pop(None, None)
+
+        # Sürüm sayaç değil rastgele bir belirteçtir: her worker kendi deposunu tutar ve sayaçlar çakışabilir;
+        # başka bir worker'ın görüntüsüne karşı alınmış fark istemcideki DOM'u bozar.
+        version = secrets.token_hex(8)
+        view["targets"][target] = ViewSnapshot(version, nodes)
+
+        while len(self._views) > self.max_entries:
+            self._views.popitem(last=False)
+            self._stats["evictions"] += 1
+        return version
+
+    def record(self, kind: str):
+        self._stats[kind] += 1
+
+    def stats(self) -> dict:
+        return {**self._stats, "views": len(self._views)}
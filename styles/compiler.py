@@ -1,5 +1,11 @@
+import asyncio
+import os
 import re
-from typing import Dict, Any
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from starlette.concurrency import run_in_threadpool
 
 STATIC_STYLE_MAP = {
     "w-full": "width: 100%;",
@@ -88,13 +94,21 @@ def generate_css(utility_classes: set, style_map: Dict[str, str]) -> str:
         
         if css_rule:
             if "&" in css_rule:
-                selector = f".{class_name.replace(':', '\\:')}"
+                escaped_name = class_name.replace(':', '\\:')
+                selector = f".{escaped_name}"
                 css_rules.append(f"{css_rule.replace('&', selector)}")
             else:
                 css_rules.append(f".{class_name} {{ {css_rule} }}")
     
     return "\n".join(css_rules)
 
+def custom_style_class(css: str) -> str:
+    # Aynı stil metni her zaman aynı sınıf adını alır; sayfalar ve istekler arasında kararlıdır.
+    return "custom-style-" + hashlib.sha256(css.strip().encode("utf-8")).hexdigest()[:12]
+
+def custom_style_rule(class_name: str, css: str) -> str:
+    return f".{class_name} {{ {css.strip()} }}"
+
 def extract_classes(html_content: str) -> set:
     classes_from_html = re.findall(r'class="([^"]*)"', html_content)
     
@@ -114,4 +128,136 @@ def get_style_map(config: Dict[str, Any]) -> Dict[str, str]:
             style_map[f"text-{name}"] = f"color: {value};"
             style_map[f"border-{name}"] = f"border-color: {value};"
 
-    return style_map
\ No newline at end of file
+    return style_map
+
+_CSS_HASH = re.compile(r"^[0-9a-f]{16}$")
+_CSS_FILE = re.compile(r"^bead\.[0-9a-f]{16}\.css$")
+
+class StylesheetCache:
+    # Üretilen dosyalar directory verilmişse diske de yazılır: ad içerik hash'i olduğundan her worker (ve yeniden başlatılan worker)
+    # aynı URL'yi diskten sunabilir; bellekteki LRU'dan düşen ama önbellekteki HTML'de hâlâ geçen dosyalar da kaybolmaz.
+    # Disk işlemleri olay döngüsünde yapılmaz; dizin max_files dosyayla sınırlıdır, en uzun süredir kullanılmayanlar silinir.
+    PRUNE_EVERY = 64
+
+    def __init__(self, style_map: Dict[str, str], max_entries: int = 256, directory: Optional[str] = None, max_files: int = 2048):
+        self.style_map = style_map
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_files = max_files
+        self._hash_by_classes = OrderedDict()
+        self._css_by_hash = OrderedDict()
+        self._pinned = None
+        self._custom_css = ""
+        self._writes = 0
+
+    def pin(self, css_content: str, classes, custom_css: str = "") -> str:
+        css_hash = hashlib.sha256(css_content.encode("utf-8")).hexdigest()[:16]
+        self._pinned = (css_hash, css_content, frozenset(classes))
+        # Derlemede paylaşılan dosyaya taşınan özel stiller üretilen her dosyaya da eklenir.
+        self._custom_css = custom_css
+        return css_hash
+
+    def add(self, utility_classes: set) -> str:
+        # Derleme çıktısındaki stil dosyası sayfanın tüm sınıflarını kapsıyorsa doğrudan o kullanılır.
+        if self._pinned is not None and self._pinned[2].issuperset(c for c in utility_classes if c in self.style_map):
+            return self._pinned[0]
+
+        used_classes = sorted(c for c in utility_classes if c in self.style_map)
+        classes_key = hashlib.sha1("\n".join(used_classes).encode("utf-8")).hexdigest()
+
+        css_hash = self._hash_by_classes.get(classes_key)
+        if css_hash is not None and css_hash in self._css_by_hash:
+            self._hash_by_classes.move_to_end(classes_key)
+            self._css_by_hash.move_to_end(css_hash)
+            return css_hash
+
+        css_content = generate_css(used_classes, self.style_map)
+        if self._custom_css:
+            css_content += "\n" + self._custom_css
+        css_hash = hashlib.sha256(css_content.encode("utf-8")).hexdigest()[:16]
+
+        self._hash_by_classes[classes_key] = css_hash
+        self._css_by_hash[css_hash] = css_content
+        if self.directory is not None:
+            self._write_behind(css_hash, css_content)
+        while len(self._css_by_hash) > self.max_entries:
+            self._css_by_hash.popitem(last=False)
+        while len(self._hash_by_classes) > self.max_entries:
+            self._hash_by_classes.popitem(last=False)
+
+        return css_hash
+
+    def _path(self, css_hash: str) -> str:
+        return os.path.join(self.directory, f"bead.{css_hash}.css")
+
+    def _write_behind(self, css_hash: str, css_content: str):
+        # add() render sırasında, olay döngüsünde çağrılır; dosya thread havuzunda yazılır. Döngü yoksa (testler, araçlar) hemen yazılır.
+        # Budanmayacak hash'ler (bellektekiler ve derleme çıktısınınki) burada, döngüde kopyalanır.
+        self._writes += 1
+        keep = None
+        if self._writes % self.PRUNE_EVERY == 0:
+            keep = set(self._css_by_hash)
+            if self._pinned is not None:
+                keep.add(self._pinned[0])
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(css_hash, css_content, keep)
+            return
+        loop.run_in_executor(None, self._write, css_hash, css_content, keep)
+
+    def _write(self, css_hash: str, css_content: str, keep: Optional[set] = None):
+        path = self._path(css_hash)
+        try:
+            if os.path.exists(path):
+                # Dosyanın tekrar kullanıldığı işaretlenir; budama en eski dosyaları siler.
+                os.utime(path)
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                # Aynı dosyayı yazan worker'lar birbirinin yarım dosyasını görmesin.
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(css_content)
+                os.replace(temp_path, path)
+            if keep is not None:
+                self._prune(keep)
+        except OSError as e:
+            print(f"UYARI: Stil dosyası yazılamadı: {path}: {e}")
+
+    def _prune(self, keep: set):
+        files = []
+        for name in os.listdir(self.directory):
+            if _CSS_FILE.match(name) and name[5:-4] not in keep:
+                path = os.path.join(self.directory, name)
+                try:
+                    files.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    continue
+        excess = len(files) + len(keep) - self.max_files
+        for _, path in sorted(files)[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def get(self, css_hash: str) -> Optional[str]:
+        if self._pinned is not None and css_hash == self._pinned[0]:
+            return self._pinned[1]
+        return self._css_by_hash.get(css_hash)
+
+    async def load(self, css_hash: str) -> Optional[str]:
+        # Bellekte yoksa (başka worker üretmiş ya da LRU'dan düşmüş) dosya thread havuzunda okunur.
+        css_content = self.get(css_hash)
+        if css_content is None and self.directory is not None and _CSS_HASH.match(css_hash):
+            css_content = await run_in_threadpool(self._read, css_hash)
+        return css_content
+
+    def _read(self, css_hash: str) -> Optional[str]:
+        try:
+            with open(self._path(css_hash), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def href(self, css_hash: str) -> str:
+        return f"/public/bead.{css_hash}.css"
@@ -0,0 +1,70 @@
+import json
+
+from starlette.testclient import TestClient
+
+from bead.server.dev_server import get_app
+from bead.server.router import MAX_BATCH_EVENTS
+
+HANDLERS = {
+    "inc": '''from bead.ui import Card, Text
+
+async def _render_after_event(request):
+    n = request.session.get("n", 0) + 1
+    request.session["n"] = n
+    return Card(id="counter", children=[Text(str(n))])
+''',
+    "echo": '''async def handler(request):
+    return await request.json()
+''',
+    "boom": '''def handler(request):
+    raise RuntimeError("kaput")
+''',
+    "go": '''from starlette.responses import RedirectResponse
+
+def handler(request):
+    return RedirectResponse("/done", status_code=303)
+''',
+}
+
+def make_client(root) -> TestClient:
+    (root / "pages" / "api").mkdir(parents=True)
+    (root / "pages" / "index.bead").write_text('def default(params, context):\n    return Page(title="t", body=[])\n', encoding="utf-8")
+    for name, source in HANDLERS.items():
+        (root / "pages" / "api" / f"{name}.py").write_text(source, encoding="utf-8")
+    (root / "bead.config.json").write_text(json.dumps({}), encoding="utf-8")
+    return TestClient(get_app(str(root)))
+
+def post_batch(client, events):
+    return client.post("/_events/_batch", json={"events": events}, headers={"X-Bead-View": "/"})
+
+def test_batch_returns_a_result_per_event_and_one_patch_per_target(tmp_path):
+    with make_client(tmp_path) as client:
+        response = post_batch(client, [
+            {"handler": "inc", "data": {}},
+            {"handler": "echo", "data": {"value": 1}},
+            {"handler": "inc", "data": {}},
+            {"handler": "missing", "data": {}},
+            {"handler": "boom", "data": {}},
+            "not an event",
+        ])
+        assert response.status_code == 200
+        body = response.json()
+        assert [result["status"] for result in body["results"]] == [200, 200, 200, 404, 500, 400]
+        assert body["results"][1]["body"] == {"value": 1}
+        assert "kaput" in body["results"][4]["body"]["detail"]
+        # Aynı hedefin iki render'ından yalnızca sonuncusu gönderilir.
+        assert len(body["patches"]) == 1
+        assert body["patches"][0]["target"] == "counter"
+        assert "<p>2</p>" in body["patches"][0]["patch"]
+
+def test_batch_stops_after_a_redirect(tmp_path):
+    with make_client(tmp_path) as client:
+        body = post_batch(client, [{"handler": "go"}, {"handler": "inc"}]).json()
+        assert body["results"] == [{"status": 303, "body": {"redirect": "/done"}}]
+        assert body["patches"] == []
+
+def test_batch_size_is_capped(tmp_path):
+    with make_client(tmp_path) as client:
+        assert post_batch(client, [{"handler": "echo", "data": {}}] * MAX_BATCH_EVENTS).status_code == 200
+        assert post_batch(client, [{"handler": "echo", "data": {}}] * (MAX_BATCH_EVENTS + 1)).status_code == 413
+        assert post_batch(client, []).status_code == 400
@@ -0,0 +1,64 @@
+import re
+
+import pytest
+from starlette.testclient import TestClient
+
+from bead.compiler import registry
+from bead.compiler.build import build_project
+from bead.compiler.renderer import set_extracted_styles
+from bead.server.dev_server import get_app
+
+PAGE = '''def default(params, context):
+    return Page(title="Home", body=[Text(value="hello", style="p-4 text-xl")])
+'''
+SCRIPT = "".join(f"console.log('line {i}');\n" for i in range(200))
+
+@pytest.fixture
+def built(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "index.bead").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "public").mkdir()
+    (tmp_path / "public" / "app.js").write_text(SCRIPT, encoding="utf-8")
+    (tmp_path / "bead.config.json").write_text("{}", encoding="utf-8")
+    build_dir = tmp_path / "build"
+    manifest = build_project(str(tmp_path), str(build_dir))
+    try:
+        yield tmp_path, build_dir, manifest
+    finally:
+        # Derleme çıktısını yüklemek kayıt defterini dondurur; diğer testler geliştirme kipinde çalışır.
+        registry.clear_cache()
+        set_extracted_styles([])
+
+def test_pages_link_the_pinned_hashed_stylesheet(built):
+    project, build_dir, manifest = built
+    stylesheet = manifest["stylesheet"]
+    assert {"p-4", "text-xl"} <= set(stylesheet["classes"])
+
+    with TestClient(get_app(str(project), build_dir=str(build_dir), debug=False)) as client:
+        href = f"/public/bead.{stylesheet['hash']}.css"
+        assert href in client.get("/").text
+
+        response = client.get(href)
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+        assert response.text == (build_dir / stylesheet["file"]).read_text(encoding="utf-8")
+        assert re.search(r"\.p-4 \{", response.text)
+
+def test_hashed_assets_are_served_precompressed(built):
+    project, build_dir, manifest = built
+    hashed = manifest["assets"]["app.js"]
+    assert hashed != "app.js"
+    assert (build_dir / "public" / f"{hashed}.gz").exists()
+
+    with TestClient(get_app(str(project), build_dir=str(build_dir), debug=False)) as client:
+        response = client.get(f"/public/{hashed}", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # Çalışma anında sıkıştırılmaz; derlemede yazılan kopya olduğu gibi gönderilir.
+        assert response.headers["content-length"] == str((build_dir / "public" / f"{hashed}.gz").stat().st_size)
+        assert "immutable" in response.headers["cache-control"]
+        assert response.text == SCRIPT
+
+        plain = client.get(f"/public/{hashed}", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.text == SCRIPT
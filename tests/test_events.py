@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from bead.server.dev_server import get_app
+
+INDEX_PAGE = '''def default(params, context):
+    return Page(title="Counter", body=[Card(id="counter", children=[Text("0")]), Button("inc", onclick="inc")])
+'''
+INC_HANDLER = '''def handler(request):
+    request.session["n"] = request.session.get("n", 0) + 1
+    return {"n": request.session["n"]}
+'''
+
+def make_project(root, config: dict) -> str:
+    (root / "pages" / "api").mkdir(parents=True)
+    (root / "pages" / "index.bead").write_text(INDEX_PAGE, encoding="utf-8")
+    (root / "pages" / "api" / "inc.py").write_text(INC_HANDLER, encoding="utf-8")
+    (root / "bead.config.json").write_text(json.dumps(config), encoding="utf-8")
+    return str(root)
+
+def test_socket_session_writes_are_saved_after_each_event(tmp_path):
+    project = make_project(tmp_path, {"events": {"websocket": True}, "session": {"backend": "memory"}})
+    with TestClient(get_app(project)) as client:
+        assert 'name="bead-events"' in client.get("/").text
+
+        # Oturum kimliği olmadan köprü açılmaz; istemci fetch'e düşer ve çerezi o yanıt verir.
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/_events/ws") as socket:
+                socket.receive_json()
+        assert client.post("/_events/inc", json={}).json() == {"n": 1}
+
+        with client.websocket_connect("/_events/ws") as socket:
+            socket.send_json({"id": 1, "handler": "inc", "data": {}})
+            assert socket.receive_json() == {"id": 1, "status": 200, "body": {"n": 2}}
+            # Bağlantı açıkken fetch ile gelen istek köprüdeki yazmayı görür.
+            assert client.post("/_events/inc", json={}).json() == {"n": 3}
+
+def test_socket_bridge_stays_off_with_cookie_sessions(tmp_path):
+    project = make_project(tmp_path, {"events": {"websocket": True}})
+    with TestClient(get_app(project)) as client:
+        assert 'name="bead-events"' not in client.get("/").text
+        assert client.post("/_events/inc", json={}).json() == {"n": 1}
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/_events/ws") as socket:
+                socket.receive_json()
@@ -0,0 +1,25 @@
+from bead.compiler.export import export_project
+
+PAGE = '''def default(params, context):
+    return Page(title="t", body=[Text(value=str(params.get("id", "home")))])
+'''
+
+def write(root, relative: str, source: str):
+    path = root / "pages" / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+
+def test_broken_pages_are_skipped_with_a_reason(tmp_path):
+    write(tmp_path, "index.bead", PAGE)
+    write(tmp_path, "broken.bead", "def default(params, context)\n    return Page(\n")
+    write(tmp_path, "items/[id].bead", 'def static_params():\n    return [{"id": 1}, {"slug": "x"}]\n\n' + PAGE)
+    write(tmp_path, "fails/[id].bead", 'def static_params():\n    raise RuntimeError("db down")\n\n' + PAGE)
+
+    result = export_project(str(tmp_path), str(tmp_path / "out"), workers=1)
+
+    reasons = dict(result["skipped"])
+    assert reasons["/broken"].startswith("compile error:")
+    assert reasons["/fails/{id}"] == "static_params error: db down"
+    assert "missing 'id'" in reasons["/items/{id}"]
+    assert (tmp_path / "out" / "index.html").exists()
+    assert (tmp_path / "out" / "items" / "1" / "index.html").exists()
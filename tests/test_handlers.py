@@ -0,0 +1,49 @@
+import json
+import os
+
+from starlette.testclient import TestClient
+
+from bead.server.dev_server import get_app
+from bead.server.handlers import HandlerRegistry
+
+def write_handler(api_dir, name: str, reply: str):
+    api_dir.mkdir(parents=True, exist_ok=True)
+    (api_dir / f"{name}.py").write_text(f"def handler(request):\n    return {{'reply': {reply!r}}}\n", encoding="utf-8")
+
+def test_modules_are_loaded_once_and_reloaded_on_change(tmp_path):
+    api_dir = tmp_path / "api"
+    write_handler(api_dir, "ping", "pong")
+    registry = HandlerRegistry(str(api_dir))
+
+    module = registry.get("ping")
+    assert registry.get("ping") is module
+    assert registry.loads == 1
+
+    write_handler(api_dir, "ping", "pong, again")
+    os.utime(api_dir / "ping.py", ns=(0, 0))
+    assert registry.get("ping") is not module
+    assert registry.reloads == 1
+
+def test_frozen_registry_does_not_stat_loaded_modules(tmp_path):
+    api_dir = tmp_path / "api"
+    write_handler(api_dir, "ping", "pong")
+    registry = HandlerRegistry(str(api_dir), frozen=True)
+    module = registry.get("ping")
+    (api_dir / "ping.py").unlink()
+    assert registry.get("ping") is module
+
+def test_unknown_and_invalid_names_are_rejected(tmp_path):
+    api_dir = tmp_path / "pages" / "api"
+    write_handler(api_dir, "ping", "pong")
+    (tmp_path / "secret.py").write_text("def handler(request):\n    return {'leaked': True}\n", encoding="utf-8")
+    registry = HandlerRegistry(str(api_dir))
+    for name in ("missing", "../../secret", "ping.py", "", "os.path"):
+        assert registry.get(name) is None, name
+
+    (tmp_path / "pages" / "index.bead").write_text('def default(params, context):\n    return Page(title="t", body=[])\n', encoding="utf-8")
+    (tmp_path / "bead.config.json").write_text(json.dumps({}), encoding="utf-8")
+    with TestClient(get_app(str(tmp_path))) as client:
+        assert client.post("/api/ping", json={}).json() == {"reply": "pong"}
+        assert client.post("/_events/ping", json={}).json() == {"reply": "pong"}
+        assert client.post("/api/missing", json={}).status_code == 404
+        assert client.post("/api/..%2F..%2Fsecret", json={}).status_code == 404
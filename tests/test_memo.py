@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from bead.compiler.renderer import render_component
+from bead.component import component
+from bead.ui.core_components import Card, Form, Input, Text
+
+def render(tree, csrf_token=None) -> tuple:
+    classes = set()
+    html = asyncio.run(render_component(tree, classes, csrf_token=csrf_token))
+    return html, classes
+
+def test_cached_fragment_is_reused_until_invalidated():
+    calls = []
+
+    @component(cache=True)
+    def Greeting(name: str):
+        calls.append(name)
+        return Card(children=[Text(value=f"Hello {name}", style="p-2")])
+
+    first = render(Greeting(name="Ada"))
+    assert render(Greeting(name="Ada")) == first == ('<div><p class="p-2">Hello Ada</p></div>', {"p-2"})
+    assert calls == ["Ada"]
+    assert Greeting.fragment_cache.stats()["hits"] == 1
+
+    render(Greeting(name="Grace"))
+    assert calls == ["Ada", "Grace"]
+
+    Greeting.fragment_cache.clear()
+    assert render(Greeting(name="Ada")) == first
+    assert calls == ["Ada", "Grace", "Ada"]
+
+def test_cached_fragment_expires_after_ttl():
+    calls = []
+
+    @component(cache=0.05)
+    def Clock():
+        calls.append(None)
+        return Text(value="tick")
+
+    render(Clock())
+    render(Clock())
+    assert len(calls) == 1
+    time.sleep(0.06)
+    render(Clock())
+    assert len(calls) == 2
+
+def test_fragment_with_csrf_token_is_not_cached():
+    calls = []
+
+    @component(cache=True)
+    def Signup():
+        calls.append(None)
+        return Form(children=[Input(name="email")])
+
+    assert 'value="token-a"' in render(Signup(), csrf_token="token-a")[0]
+    assert 'value="token-b"' in render(Signup(), csrf_token="token-b")[0]
+    assert len(calls) == 2
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import re
+
+from starlette.testclient import TestClient
+
+from bead.server.cache import PageCache
+from bead.server.dev_server import get_app
+
+def test_fresh_stale_and_expired_entries():
+    cache = PageCache()
+    renders = []
+
+    async def render():
+        renders.append(None)
+        return f"render {len(renders)}"
+
+    async def scenario():
+        assert await cache.get_or_render("/", render, ttl=0.05, stale=0.3) == ("render 1", "miss")
+        assert await cache.get_or_render("/", render, ttl=0.05, stale=0.3) == ("render 1", "hit")
+
+        # Süresi geçmiş ama bayat penceresindeki içerik hemen döner; yenisi arka planda render edilir.
+        await asyncio.sleep(0.1)
+        assert await cache.get_or_render("/", render, ttl=0.05, stale=0.3) == ("render 1", "stale")
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_render("/", render, ttl=0.05, stale=0.3) == ("render 2", "hit")
+
+        await asyncio.sleep(0.4)
+        assert await cache.get_or_render("/", render, ttl=0.05, stale=0.3) == ("render 3", "miss")
+
+    asyncio.run(scenario())
+    assert cache.stats()["refreshes"] == 1
+
+def test_concurrent_misses_share_one_render():
+    cache = PageCache()
+    renders = []
+
+    async def render():
+        renders.append(None)
+        await asyncio.sleep(0.01)
+        return "page"
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_render("/", render) for _ in range(5)))
+
+    assert [content for content, _ in asyncio.run(scenario())] == ["page"] * 5
+    assert len(renders) == 1
+
+PAGE = '''ssr_cache = 60
+
+def default(params, context):
+    return Page(title="Form", body=[Form(children=[Input(name="email")])])
+'''
+
+def test_cached_page_carries_each_sessions_csrf_token(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "index.bead").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "bead.config.json").write_text(json.dumps({"security": {"csrf": True}}), encoding="utf-8")
+    app = get_app(str(tmp_path))
+
+    tokens = []
+    for expected in ("miss", "hit"):
+        # Her istemci ayrı bir oturumdur.
+        with TestClient(app) as client:
+            response = client.get("/")
+            assert response.headers["x-bead-cache"] == expected
+            assert "__bead_csrf_token__" not in response.text
+            tokens.append(re.search(r'name="csrf_token" value="([^"]+)"', response.text).group(1))
+    assert tokens[0] != tokens[1]
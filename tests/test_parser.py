@@ -0,0 +1,28 @@
+import asyncio
+
+from bead.compiler import registry
+from bead.compiler.renderer import render_page
+
+PAGE = b'''
+def default(params, context):
+    t = Text(value="hello")
+    card = Card(children=[Text("a", style="p-2"), Link("x", href="/x")])
+    first = card.props["children"]["default"][0]
+    return Page(title="t", body=[Text(value=t.props["value"].upper()), card, Text(first.component_type + ":" + first.props["value"])])
+'''
+
+def test_hoisted_components_keep_their_props():
+    page = registry.compile_page("/tmp/hoisted.bead", PAGE)
+    assert any(name.startswith("__bead_static_") for name in page.namespace)
+
+    classes = set()
+    html = asyncio.run(render_page(page.default({}, {}), classes))
+    assert "<p>HELLO</p>" in html
+    assert '<div><p class="p-2">a</p><a href="/x">x</a></div>' in html
+    assert "<p>Text:a</p>" in html
+    assert classes == {"p-2"}
+
+def test_replaced_component_is_rendered_from_props():
+    page = registry.compile_page("/tmp/hoisted.bead", b'def default(params, context):\n    return Page(title="t", body=[Text("a").replace(value="b")])\n')
+    html = asyncio.run(render_page(page.default({}, {}), set()))
+    assert "<p>b</p>" in html
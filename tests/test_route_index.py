@@ -0,0 +1,110 @@
+import random
+import re
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from bead.server.route_index import PageRoutes, RouteIndex
+
+PATTERNS = [
+    "/",
+    "/index",
+    "/about",
+    "/blog/{slug}",
+    "/blog/new",
+    "/blog/{slug}/comments",
+    "/blog/{slug}/{comment}",
+    "/blog/archive/{year}",
+    "/docs/{rest:path}",
+    "/docs/intro",
+    "/docs/{section}/faq",
+    "/shop/{category}/{item}",
+    "/shop/sale/{item}",
+    "/shop/{category}/all",
+    "/wiki/{page}",
+    "/wiki/{page:path}/edit",
+    "/users/{id}",
+    "/users/me",
+]
+
+def endpoint_for(pattern: str):
+    async def endpoint(request):
+        return PlainTextResponse(f"{pattern} {sorted(request.path_params.items())}")
+    return endpoint
+
+def precedence(pattern: str) -> tuple:
+    # Düz listede ağacın önceliği: her segmentte statik, sonra {param}, sonra {...:path}.
+    return tuple(2 if segment.endswith(":path}") else 1 if segment.startswith("{") else 0 for segment in pattern.split("/"))
+
+def make_apps():
+    index = RouteIndex()
+    for pattern in PATTERNS:
+        index.add(pattern, endpoint_for(pattern))
+    flat = [Route(pattern, endpoint=endpoint_for(pattern)) for pattern in sorted(PATTERNS, key=precedence)]
+    return Starlette(routes=[PageRoutes(index)]), Starlette(routes=flat)
+
+def sample_paths(count: int) -> list:
+    rng = random.Random(21)
+    words = ["new", "archive", "intro", "faq", "sale", "all", "me", "edit", "comments", "2024", "x", "a-b"]
+    paths = ["/", "/about/", "/blog/", "/docs", "/docs/", "/wiki/a/b/edit", "/users/me/", "/nope"]
+    for _ in range(count):
+        pattern = rng.choice(PATTERNS)
+        path = re.sub(r"\{\w+(:path)?\}", lambda m: "/".join(rng.choice(words) for _ in range(rng.randint(1, 3) if m.group(1) else 1)), pattern)
+        if rng.random() < 0.2:
+            path += "/"
+        if rng.random() < 0.1:
+            path += "/" + rng.choice(words)
+        paths.append(path)
+    return paths
+
+def test_index_matches_like_flat_route_list():
+    trie_app, flat_app = make_apps()
+    with TestClient(trie_app) as trie, TestClient(flat_app) as flat:
+        for path in sample_paths(500):
+            expected = flat.get(path, follow_redirects=False)
+            actual = trie.get(path, follow_redirects=False)
+            assert (actual.status_code, actual.headers.get("location"), actual.text) == \
+                (expected.status_code, expected.headers.get("location"), expected.text), path
+
+def test_precedence_static_then_param_then_catch_all():
+    index = RouteIndex()
+    for pattern in PATTERNS:
+        index.add(pattern, endpoint_for(pattern))
+
+    def matched(path):
+        found = index.match(path)
+        return found and (found[0].path, found[1])
+
+    assert matched("/blog/new") == ("/blog/new", {})
+    assert matched("/blog/hello") == ("/blog/{slug}", {"slug": "hello"})
+    assert matched("/blog/archive/2024") == ("/blog/archive/{year}", {"year": "2024"})
+    assert matched("/blog/archive/comments") == ("/blog/archive/{year}", {"year": "comments"})
+    # Statik dal sonuçsuz kalırsa parametre dalına geri dönülür.
+    assert matched("/blog/archive") == ("/blog/{slug}", {"slug": "archive"})
+    assert matched("/shop/sale/x/all") is None
+    assert matched("/shop/toys/all") == ("/shop/{category}/all", {"category": "toys"})
+    assert matched("/docs/intro") == ("/docs/intro", {})
+    assert matched("/docs/api/faq") == ("/docs/{section}/faq", {"section": "api"})
+    assert matched("/docs/api/faq/more") == ("/docs/{rest:path}", {"rest": "api/faq/more"})
+    assert matched("/shop/sale/all") == ("/shop/sale/{item}", {"item": "all"})
+    assert matched("/wiki/a/b/edit") == ("/wiki/{page:path}/edit", {"page": "a/b"})
+    assert matched("/users/me") == ("/users/me", {})
+    assert matched("/nope") is None
+
+def test_trailing_slash_redirects_to_page():
+    trie_app, _ = make_apps()
+    with TestClient(trie_app) as client:
+        response = client.get("/about/", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/about")
+        # Catch-all boş kalanı da yakalar; yönlendirme yapılmaz.
+        assert client.get("/docs/", follow_redirects=False).text.startswith("/docs/{rest:path}")
+
+def test_non_get_on_page_is_405():
+    trie_app, _ = make_apps()
+    with TestClient(trie_app) as client:
+        response = client.post("/about")
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
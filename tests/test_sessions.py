@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from starlette.middleware import Middleware
+
+from bead.server.sessions import SQLiteSessionBackend, ServerSessionMiddleware, session_middleware
+
+async def count(request):
+    request.session["count"] = request.session.get("count", 0) + 1
+    return JSONResponse(request.session["count"])
+
+async def untouched(request):
+    return JSONResponse(None)
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_server_side_session_round_trip(tmp_path, backend):
+    app = Starlette(
+        routes=[Route("/count", count), Route("/untouched", untouched)],
+        middleware=[session_middleware({"backend": backend}, "test-secret", str(tmp_path))],
+    )
+    with TestClient(app) as client:
+        assert client.get("/count").json() == 1
+        cookie = client.cookies["session"]
+        assert "count" not in cookie
+        assert client.get("/count").json() == 2
+        assert "set-cookie" not in client.get("/untouched").headers
+
+        client.cookies.set("session", "tampered")
+        assert client.get("/count").json() == 1
+
+class RecordingBackend(SQLiteSessionBackend):
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.load_threads = []
+
+    def load(self, session_id):
+        self.load_threads.append(threading.get_ident())
+        return super().load(session_id)
+
+async def loaded_count(request):
+    # Çerçevenin handler'lardan önce yaptığı gibi oturum önce load() ile okunur.
+    request.app.state.loop_thread = threading.get_ident()
+    await request.session.load()
+    return await count(request)
+
+def test_blocking_store_is_read_only_when_the_session_is_used(tmp_path):
+    backend = RecordingBackend(str(tmp_path / "sessions.sqlite3"))
+    app = Starlette(
+        routes=[Route("/count", loaded_count), Route("/untouched", untouched)],
+        middleware=[Middleware(ServerSessionMiddleware, secret_key="test-secret", backend=backend)],
+    )
+    with TestClient(app) as client:
+        assert client.get("/count").json() == 1
+        assert client.get("/untouched").json() is None
+        assert client.get("/untouched").json() is None
+        assert backend.load_threads == []
+
+        assert client.get("/count").json() == 2
+        assert len(backend.load_threads) == 1
+        assert backend.load_threads[0] != app.state.loop_thread
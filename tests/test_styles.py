@@ -0,0 +1,51 @@
+import asyncio
+import os
+import threading
+
+from bead.styles.compiler import StylesheetCache, get_style_map
+
+def test_generated_stylesheet_is_served_by_another_cache(tmp_path):
+    style_map = get_style_map({})
+    worker_a = StylesheetCache(style_map, directory=str(tmp_path))
+    worker_b = StylesheetCache(style_map, directory=str(tmp_path))
+
+    css_hash = worker_a.add({"p-2", "w-full"})
+    assert worker_b.get(css_hash) is None
+    assert asyncio.run(worker_b.load(css_hash)) == worker_a.get(css_hash)
+
+def test_evicted_stylesheet_is_read_back_from_disk(tmp_path):
+    cache = StylesheetCache(get_style_map({}), max_entries=1, directory=str(tmp_path))
+    first = cache.add({"p-2"})
+    cache.add({"w-full"})
+    assert asyncio.run(cache.load(first)) is not None
+    assert asyncio.run(cache.load("../../etc/passwd")) is None
+
+def test_files_are_written_off_the_event_loop(tmp_path):
+    writers = []
+    cache = StylesheetCache(get_style_map({}), directory=str(tmp_path))
+    write = cache._write
+    cache._write = lambda *args: (writers.append(threading.get_ident()), write(*args))
+
+    async def render():
+        css_hash = cache.add({"p-2"})
+        await asyncio.sleep(0.05)
+        return threading.get_ident(), css_hash
+
+    loop_thread, css_hash = asyncio.run(render())
+    assert writers and writers[0] != loop_thread
+    assert os.path.exists(tmp_path / f"bead.{css_hash}.css")
+
+def test_directory_is_pruned_to_max_files(tmp_path):
+    classes = sorted(get_style_map({}))
+    cache = StylesheetCache(get_style_map({}), max_entries=4, directory=str(tmp_path), max_files=10)
+    cache.PRUNE_EVERY = 8
+    pinned = cache.pin(".pinned { color: red; }", [])
+    (tmp_path / f"bead.{pinned}.css").write_text(".pinned { color: red; }")
+    os.utime(tmp_path / f"bead.{pinned}.css", (0, 0))
+
+    hashes = [cache.add({classes[i]}) for i in range(40)]
+    files = [name for name in os.listdir(tmp_path) if name.endswith(".css")]
+    assert len(files) <= 10 + cache.PRUNE_EVERY
+    # Bellekteki ve derleme çıktısındaki dosyalar silinmez.
+    assert f"bead.{pinned}.css" in files
+    assert all(f"bead.{css_hash}.css" in files for css_hash in hashes[-4:])
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import random
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+
+from bead.server.router import _render_patch
+from bead.server.views import TEXT, ViewStore, diff_children, parse_html, serialize
+from bead.styles.compiler import StylesheetCache, get_style_map
+from bead.ui.core_components import Page, Text
+
+TAGS = ("div", "p", "span", "ul", "li", "br")
+
+def random_node(rng: random.Random, depth: int, keys: list):
+    if depth == 0 or rng.random() < 0.3:
+        return (TEXT, rng.choice(("a", "b", "x < y", "&amp;", "")) or "c")
+    tag = rng.choice(TAGS)
+    attrs = []
+    if keys and rng.random() < 0.4:
+        attrs.append(("data-key", keys.pop()))
+    if rng.random() < 0.5:
+        attrs.append(("class", rng.choice(("p-2", "p-4", "selected"))))
+    if rng.random() < 0.2:
+        attrs.append(("title", rng.choice(("t", "\"q\""))))
+    children = [] if tag == "br" else random_children(rng, depth - 1)
+    return (tag, tuple(attrs), children)
+
+def random_children(rng: random.Random, depth: int) -> list:
+    # Kardeşler arasında anahtarlar tekildir (DOM'daki id'ler gibi).
+    keys = rng.sample(("k1", "k2", "k3", "k4", "k5", "k6"), 6)
+    return [random_node(rng, depth, keys) for _ in range(rng.randint(0, 4))]
+
+def mutate(rng: random.Random, nodes: list) -> list:
+    # Çoğu sınama ağaçların küçük farklarını kapsasın diye b, a'dan türetilir.
+    result = []
+    for node in nodes:
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        if roll < 0.2:
+            result.append(random_node(rng, 2, []))
+        if node[0] != TEXT and roll > 0.5:
+            attrs = node[1] if rng.random() < 0.7 else tuple((name, value + "!") for name, value in node[1])
+            node = (node[0], attrs, mutate(rng, node[2]))
+        result.append(node)
+    if rng.random() < 0.15:
+        rng.shuffle(result)
+    if rng.random() < 0.2:
+        result.insert(rng.randint(0, len(result)), random_node(rng, 2, []))
+    return result
+
+def normalize(nodes: list) -> list:
+    # Bitişik metin düğümleri ve kaçışlar, sunucunun gördüğü biçime getirilir.
+    return parse_html("".join(serialize(node) for node in nodes))
+
+def to_live(nodes: list) -> list:
+    return [[TEXT, node[1]] if node[0] == TEXT else [node[0], dict(node[1]), to_live(node[2])] for node in nodes]
+
+def apply_ops(root: list, ops: list):
+    # İstemcideki applyOps'un karşılığı; kök, body'nin çocuk listesidir.
+    for op in ops:
+        path = op["path"]
+        parent = root
+        for index in path[:-1]:
+            parent = parent[index][2]
+        node = parent[path[-1]] if path else None
+        children = root if node is None else node[-1]
+        if op["op"] == "text":
+            node[1] = op["value"]
+        elif op["op"] == "attr":
+            if op["value"] is None:
+                node[1].pop(op["name"], None)
+            else:
+                node[1][op["name"]] = op["value"]
+        elif op["op"] == "insert":
+            children[op["index"]:op["index"]] = to_live(parse_html(op["html"]))
+        elif op["op"] == "remove":
+            del parent[path[-1]]
+        elif op["op"] == "replace":
+            parent[path[-1]:path[-1] + 1] = to_live(parse_html(op["html"]))
+        elif op["op"] == "children":
+            children[:] = to_live(parse_html(op["html"]))
+
+def test_applying_diff_reproduces_new_tree():
+    rng = random.Random(17)
+    for _ in range(20000):
+        a = normalize(random_children(rng, 3))
+        b = normalize(mutate(rng, a) if rng.random() < 0.8 else random_children(rng, 3))
+        ops = []
+        diff_children(a, b, [], ops)
+        live = to_live(a)
+        apply_ops(live, ops)
+        assert live == to_live(b), (serialize(("div", (), a)), serialize(("div", (), b)), ops)
+
+def test_equal_trees_produce_no_ops():
+    nodes = parse_html('<ul><li data-key="1">a</li><li data-key="2">b</li></ul>')
+    ops = []
+    diff_children(nodes, parse_html('<ul><li data-key="1">a</li><li data-key="2">b</li></ul>'), [], ops)
+    assert ops == []
+
+def make_worker() -> Starlette:
+    app = Starlette()
+    app.state.config = {}
+    app.state.stylesheets = StylesheetCache(get_style_map({}))
+    app.state.views = ViewStore()
+    return app
+
+def render_on(app: Starlette, session: dict, versions: dict, count: int) -> dict:
+    headers = [(b"x-bead-view", b"/counter"), (b"x-bead-view-version", json.dumps(versions).encode())]
+    request = Request({"type": "http", "method": "POST", "path": "/", "query_string": b"", "headers": headers, "app": app, "session": session})
+    page = Page(title="t", body=[Text(value=str(count))] + [Text(value=f"row {i}") for i in range(50)])
+    return asyncio.run(_render_patch(request, page))
+
+def test_versions_from_separate_stores_never_match():
+    worker_a, worker_b = ViewStore(), ViewStore()
+    key = ("session", "/counter")
+    nodes = parse_html("<p>0</p>")
+    assert worker_a.put(key, None, nodes) != worker_b.put(key, None, nodes)
+    assert worker_a.get(key, None).version != worker_b.get(key, None).version
+
+def test_ops_only_against_the_snapshot_the_client_holds():
+    # İki worker aynı oturum ve sayfa için ayrı görüntü tutar; istemci istekler arasında worker değiştirir.
+    worker_a, worker_b = make_worker(), make_worker()
+    session = {}
+    on_b = render_on(worker_b, session, {}, 0)
+    on_a = render_on(worker_a, session, {"": on_b["version"]}, 1)
+    assert "ops" not in on_a
+
+    # B'nin görüntüsü (0) istemcinin DOM'u (1) değildir; yalnızca tam HTML gönderilebilir.
+    back_on_b = render_on(worker_b, session, {"": on_a["version"]}, 2)
+    assert "ops" not in back_on_b and "<p>2</p>" in back_on_b["patch"]
+
+    again_on_b = render_on(worker_b, session, {"": back_on_b["version"]}, 3)
+    assert again_on_b["ops"] == [{"op": "text", "path": [0, 0], "value": "3"}]
@@ -1,26 +1,89 @@
 from typing import Optional, List, Literal, Dict, Any, Union
 
+def _readonly(self, *args, **kwargs):
+    raise TypeError("Bileşen prop'ları değiştirilemez; yeni bir bileşen oluşturun.")
+
+class FrozenProps(dict):
+    __slots__ = ()
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (FrozenProps, (dict(self),))
+
+def freeze(value):
+    if isinstance(value, FrozenProps):
+        return value
+    if isinstance(value, dict):
+        return FrozenProps({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def _restore(cls, props):
+    component = object.__new__(cls)
+    object.__setattr__(component, "props", props)
+    object.__setattr__(component, "prerendered", None)
+    return component
+
+def prerender(component, html: str, classes: tuple, styles: dict):
+    # Derleyicinin statik olarak render ettiği düğüm aynen kalır (prop'lar, tür, çocuklar); renderer yalnızca hazır HTML'i kullanır.
+    object.__setattr__(component, "prerendered", (html, classes, styles))
+    return component
+
 class Component:
+    # Düğümler değişmezdir; aynı ağaç istekler ve thread'ler arasında güvenle paylaşılabilir.
+    __slots__ = ("props", "prerendered")
+    component_type = "Component"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.component_type = cls.__name__
+
     def __init__(self, children: Optional[Union[List['Component'], Dict[str, List['Component']]]] = None, **kwargs):
-        self.props = kwargs
         if children is not None:
-            if isinstance(children, list):
-                self.props['children'] = {'default': children}
+            if isinstance(children, (list, tuple)):
+                kwargs['children'] = {'default': children}
             else:
-                self.props['children'] = children
-        self.component_type = self.__class__.__name__
+                kwargs['children'] = children
+        # None değerli prop'lar "verilmemiş" ile aynı anlama gelir; saklanmaz.
+        object.__setattr__(self, "props", FrozenProps({
+            key: freeze(value) if isinstance(value, (list, dict)) else value
+            for key, value in kwargs.items() if value is not None
+        }))
+        object.__setattr__(self, "prerendered", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.component_type}' bileşeni değiştirilemez.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{self.component_type}' bileşeni değiştirilemez.")
+
+    def replace(self, **changes) -> 'Component':
+        clone = object.__new__(type(self))
+        object.__setattr__(clone, "props", freeze({**self.props, **changes}))
+        object.__setattr__(clone, "prerendered", None)
+        return clone
+
+    def __reduce__(self):
+        return (_restore, (type(self), self.props))
 
     def render(self) -> str:
         raise NotImplementedError("Component alt sınıfları 'render' metodunu uygulamalıdır.")
 
     def __repr__(self):
-        return f"<{self.component_type} props={self.props}>"
+        return f"<{self.component_type} props={dict(self.props)}>"
 
 class Page(Component):
+    __slots__ = ()
+
     def __init__(self, title: str, body: List[Component], style: Optional[str] = None, custom_style: Optional[str] = None, meta: Optional[Dict[str, str]] = None, **kwargs):
         super().__init__(children=body, title=title, style=style, custom_style=custom_style, meta=meta, **kwargs)
 
 class Text(Component):
+    __slots__ = ()
+
     def __init__(self, value: str, style: Optional[str] = None, custom_style: Optional[str] = None, as_: str = "p", **kwargs):
         super().__init__(value=value, style=style, custom_style=custom_style, as_=as_, **kwargs)
         
@@ -31,6 +94,8 @@ class Text(Component):
         return f'<{tag} class="{style}">{value}</{tag}>'
 
 class Button(Component):
+    __slots__ = ()
+
     def __init__(self, label: str, onclick: Optional[str] = None, href: Optional[str] = None, style: Optional[str] = None, custom_style: Optional[str] = None, **kwargs):
         super().__init__(label=label, onclick=onclick, href=href, style=style, custom_style=custom_style, **kwargs)
 
@@ -43,25 +108,49 @@ class Button(Component):
         return f'<{tag} class="{style}"{onclick}{href}>{label}</{tag}>'
 
 class Card(Component):
+    __slots__ = ()
+
     def __init__(self, children: Union[List[Component], Dict[str, List[Component]]], style: Optional[str] = None, custom_style: Optional[str] = None, id: Optional[str] = None, **kwargs):
         super().__init__(children=children, style=style, custom_style=custom_style, id=id, **kwargs)
 
 class Stack(Component):
+    __slots__ = ()
+
     def __init__(self, children: List[Component], direction: Literal["row", "col"] = "col", style: Optional[str] = None, custom_style: Optional[str] = None, **kwargs):
         super().__init__(children=children, direction=direction, style=style, custom_style=custom_style, **kwargs)
 
 class Input(Component):
+    __slots__ = ()
+
     def __init__(self, name: str, value: str = "", type: str = "text", placeholder: str = "", style: Optional[str] = None, custom_style: Optional[str] = None, error: Optional[str] = None, **kwargs):
         super().__init__(name=name, value=value, type=type, placeholder=placeholder, style=style, custom_style=custom_style, error=error, **kwargs)
 
 class Form(Component):
+    __slots__ = ()
+
     def __init__(self, children: List[Component], action: Optional[str] = None, method: str = "POST", onsubmit: Optional[str] = None, style: Optional[str] = None, custom_style: Optional[str] = None, schema: Optional[Dict] = None, csrf_token: Optional[str] = None, **kwargs):
         super().__init__(children=children, action=action, method=method, onsubmit=onsubmit, style=style, custom_style=custom_style, schema=schema, csrf_token=csrf_token, **kwargs)
 
 class Link(Component):
+    __slots__ = ()
+
     def __init__(self, label: str, href: str, style: Optional[str] = None, custom_style: Optional[str] = None, router_link: bool = False, **kwargs):
         super().__init__(label=label, href=href, style=style, custom_style=custom_style, router_link=router_link, **kwargs)
 
 class Image(Component):
+    __slots__ = ()
+
     def __init__(self, src: str, alt: str = "", style: Optional[str] = None, custom_style: Optional[str] = None, loading: str = "lazy", **kwargs):
-        super().__init__(src=src, alt=alt, style=style, custom_style=custom_style, loading=loading, **kwargs)   
\ No newline at end of file
+        super().__init__(src=src, alt=alt, style=style, custom_style=custom_style, loading=loading, **kwargs)
+
+class Fragment(Component):
+    __slots__ = ()
+
+    def __init__(self, html: str, classes: Optional[List[str]] = None, styles: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(html=html, classes=classes or [], styles=styles or {}, **kwargs)
+
+class Memo(Component):
+    __slots__ = ()
+
+    def __init__(self, child: Component, cache: Any, cache_key: str, **kwargs):
+        super().__init__(children=[child], cache=cache, cache_key=cache_key, **kwargs)